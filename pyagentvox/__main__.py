@@ -59,7 +59,8 @@ def find_conversation_file() -> Path | None:
         Path.home() / 'Library' / 'Application Support' / 'Claude' / 'conversations',
     ]
 
-    # Find the most recently modified conversation file
+    # Find the most recently modified conversation file, pruning subagent
+    # transcripts before descending (they are never the window's own file)
     latest_file = None
     latest_time = 0
 
@@ -67,13 +68,22 @@ def find_conversation_file() -> Path | None:
         if not directory.exists():
             continue
 
-        for jsonl_file in directory.rglob('*.jsonl'):
-            mtime = jsonl_file.stat().st_mtime
-            if mtime > latest_time:
-                latest_time = mtime
-                latest_file = jsonl_file
+        for root, dirs, files in os.walk(directory):
+            if 'subagents' in dirs:
+                dirs.remove('subagents')
+            for name in files:
+                if not name.endswith('.jsonl'):
+                    continue
+                full_path = os.path.join(root, name)
+                try:
+                    mtime = os.stat(full_path).st_mtime
+                except OSError:
+                    continue
+                if mtime > latest_time:
+                    latest_time = mtime
+                    latest_file = full_path
 
-    return latest_file
+    return Path(latest_file) if latest_file else None
 
 
 def get_lock_id() -> str:
@@ -88,7 +98,7 @@ def get_lock_id() -> str:
     conv_file = find_conversation_file()
     if conv_file:
         # Create hash of conversation file path for unique lock per window
-        path_hash = hashlib.md5(str(conv_file).encode()).hexdigest()[:8]
+        path_hash = hashlib.blake2b(str(conv_file).encode(), digest_size=4).hexdigest()
         return path_hash
     return 'global'
 
@@ -113,7 +123,7 @@ def get_running_pid() -> int | None:
         return None
 
     try:
-        pid = int(pid_file.read_text().strip())
+        pid = int(pid_file.read_text().partition('\n')[0])  # Second line holds the start time
         if psutil.pid_exists(pid):
             return pid
     except (ValueError, OSError):
@@ -39,7 +39,9 @@ import sys
 import tempfile
 import time
 import tkinter as tk
-from dataclasses import dataclass
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import cached_property
 from pathlib import Path
 from tkinter import messagebox
 from typing import Any
@@ -63,6 +65,11 @@ except ImportError:
     win32gui = None  # type: ignore[assignment]
     win32con = None  # type: ignore[assignment]
 
+try:
+    from .ipc_watch import IPCFileEventHandler, Observer
+except ImportError:
+    from ipc_watch import IPCFileEventHandler, Observer
+
 __author__ = 'Jake Meador <jameador13@gmail.com>'
 __all__ = ['AvatarWidget', 'ImageEntry', 'TagEditorDialog', 'main']
 
@@ -72,26 +79,67 @@ logger = logging.getLogger('pyagentvox.avatar')
 # Data Structures
 # ============================================================================
 
-@dataclass
 class ImageEntry:
     """Represents a registered avatar image with tags.
 
     Attributes:
         path: Path to the image file (relative to avatar directory or absolute).
-        tags: List of tags (must include at least one emotion tag).
+        tags: Tuple of tags (must include at least one emotion tag).
     """
-    path: Path
-    tags: list[str]
 
-    def __post_init__(self) -> None:
-        """Convert path string to Path object if needed."""
-        if isinstance(self.path, str):
-            self.path = Path(self.path)
+    __hash__ = None  # type: ignore[assignment]  # Compared by value and mutable
+
+    def __init__(self, path: Path | str, tags: Iterable[str]) -> None:
+        self._assign(path, tags)
+
+    def __repr__(self) -> str:
+        return f'ImageEntry(path={self._path!r}, tags={self._tags!r})'
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ImageEntry):
+            return NotImplemented
+        return self._path == other._path and self._tags == other._tags
+
+    @property
+    def path(self) -> Path:
+        """Image path; assigning a string converts it to a Path."""
+        return self._path
+
+    @path.setter
+    def path(self, value: Path | str) -> None:
+        self._assign(value, self._tags)
 
     @property
-    def tag_set(self) -> set[str]:
-        """Return tags as a set for efficient lookups."""
-        return {tag.lower() for tag in self.tags}
+    def tags(self) -> tuple[str, ...]:
+        """Image tags; assign a new sequence to change them."""
+        return self._tags
+
+    @tags.setter
+    def tags(self, value: Iterable[str]) -> None:
+        self._assign(self._path, value)
+
+    def _assign(self, path: Path | str, tags: Iterable[str]) -> None:
+        """Set path and tags and drop the values cached from them."""
+        self._path = Path(path)
+        self._tags = tuple(tags)
+        self.__dict__.pop('tag_set', None)
+        self.__dict__.pop('resolved_path', None)
+
+    @cached_property
+    def tag_set(self) -> frozenset[str]:
+        """Return tags as an interned lowercase frozenset for O(1) membership lookups.
+
+        Computed once per tag tuple; assigning ``tags`` recomputes it on next access.
+        """
+        return frozenset(sys.intern(tag.lower()) for tag in self._tags)
+
+    @cached_property
+    def resolved_path(self) -> Path:
+        """Return the fully resolved image path, computed once per path."""
+        try:
+            return self._path.resolve()
+        except OSError:
+            return self._path
 
 
 # ============================================================================
@@ -219,12 +267,18 @@ ANIMATION_CONFIG = _CONFIG['animation']
 IMAGE_REGISTRY = _CONFIG['images']
 
 POSITION_FILE = Path(tempfile.gettempdir()) / 'pyagentvox_avatar_position.json'
-FADE_STEPS = 10
+FADE_STEPS = 10  # Window alpha steps per fade direction (Windows only)
 FADE_INTERVAL_MS = 30
 EMOTION_POLL_INTERVAL_MS = 200
 SHIMMER_PEAK_BRIGHTNESS = 2.5  # Peak brightness multiplier for shimmer effect
 IDLE_CHECK_INTERVAL_MS = 5000  # Check idle state every 5 seconds
-FILTER_POLL_INTERVAL_MS = 500  # Check filter control file every 500ms
+FILTER_POLL_INTERVAL_MS = 500  # Check filter control file roughly every 500ms
+FILTER_POLL_EVERY_TICKS = -(-FILTER_POLL_INTERVAL_MS // EMOTION_POLL_INTERVAL_MS)  # Filter checks ride the emotion tick
+CLOSE_HOLD_MS = 500  # Show the close image before sliding away
+CLOSE_SLIDE_STEPS = 40
+CLOSE_SLIDE_DISTANCE = 350  # Pixels
+CLOSE_SLIDE_INTERVAL_MS = 30  # 40 x 30ms = 1.2s slide
+WARMUP_INTERVAL_MS = 50  # Delay between idle cache-warmup steps (one emotion per step)
 
 # Emotion tag -> avatar filename mapping
 EMOTION_AVATAR_MAP: dict[str, str] = {
@@ -243,9 +297,13 @@ EMOTION_AVATAR_MAP: dict[str, str] = {
     'surprised': 'surprised',
 }
 
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp')  # Supported image formats, in preference order
+IMAGE_EXTENSION_SET = frozenset(IMAGE_EXTENSIONS)  # O(1) membership for directory scans
+
 DEFAULT_AVATAR = 'cheerful'
 DETECTIVE_AVATAR = 'detective'
 WAITING_STATE = 'waiting'
+NON_SPEAKING_EMOTIONS: frozenset[str] = frozenset({WAITING_STATE, 'bored', 'sleeping'})  # Emotions written when TTS is idle
 
 # Button hover avatar tags -- maps button state to image tag for tag-based lookup.
 # These tags are matched against the image registry to find contextual avatars
@@ -260,6 +318,34 @@ BUTTON_HOVER_TAGS: dict[str, str] = {
     # - tags button shows current image (for editing that image's tags)
 }
 
+# Legacy control image names -> functional control tags (backward compatibility)
+LEGACY_CONTROL_MAP: dict[str, str] = {
+    'tts-on': 'control-tts-hover-on',
+    'tts-off': 'control-tts-hover-off',
+    'stt-on': 'control-stt-hover-on',
+    'stt-off': 'control-stt-hover-off',
+    'close': 'control-close-hover',
+    'pleading': 'control-close-hover',        # Legacy name
+    'tts-toggled': 'control-tts-clicked',
+    'stt-toggled': 'control-stt-clicked',
+    'crying': 'control-close-animation',      # Legacy name
+}
+
+# Button hover state -> control tag shown when no BUTTON_HOVER_TAGS image matches
+HOVER_CONTROL_TAGS: dict[str, str] = {
+    'tts_on': 'control-tts-hover-on',
+    'tts_off': 'control-tts-hover-off',
+    'stt_on': 'control-stt-hover-on',
+    'stt_off': 'control-stt-hover-off',
+    'close': 'control-close-hover',
+}
+
+# Functional control tag -> legacy filenames that map to it (inverse of LEGACY_CONTROL_MAP)
+LEGACY_REVERSE_MAP: dict[str, tuple[str, ...]] = {
+    functional_tag: tuple(name for name, tag in LEGACY_CONTROL_MAP.items() if tag == functional_tag)
+    for functional_tag in dict.fromkeys(LEGACY_CONTROL_MAP.values())
+}
+
 # Button styling colors
 BTN_COLOR_ACTIVE = '#2d6b3f'         # Muted green - feature enabled
 BTN_COLOR_INACTIVE = '#8b2d2d'       # Muted red - feature disabled
@@ -282,14 +368,15 @@ AVATAR_SHADOW_OPACITY = 100         # Shadow alpha (0-255), 100 = ~39% opacity
 # Emotion Resolution
 # ============================================================================
 
-_emotion_hierarchy_cache: dict[tuple[str, str], str] = {}
+_emotion_hierarchy_cache: dict[tuple[str, Path], str] = {}
 
 
 def resolve_emotion_hierarchy(emotion: str, avatar_dir: Path) -> str:
     """Resolve an emotion through the hierarchy to find available images.
 
     Results are cached to avoid repeated filesystem scans (called every 200ms
-    by the emotion poll). Cache is keyed on (emotion, avatar_dir_str).
+    by the emotion poll). Cache is keyed on (emotion, avatar_dir) using the
+    Path directly, which caches its own hash.
 
     Resolution order:
     1. Check if emotion has images directly
@@ -304,7 +391,7 @@ def resolve_emotion_hierarchy(emotion: str, avatar_dir: Path) -> str:
     Returns:
         Resolved emotion name that has images available.
     """
-    cache_key = (emotion, str(avatar_dir))
+    cache_key = (emotion, avatar_dir)
     if cache_key in _emotion_hierarchy_cache:
         return _emotion_hierarchy_cache[cache_key]
 
@@ -343,7 +430,7 @@ def _resolve_emotion_hierarchy_uncached(emotion: str, avatar_dir: Path) -> str:
 # Tag Filtering System
 # ============================================================================
 
-def calculate_tag_similarity(tags1: set[str], tags2: set[str]) -> float:
+def calculate_tag_similarity(tags1: set[str] | frozenset[str], tags2: set[str] | frozenset[str]) -> float:
     """Calculate Jaccard similarity between two tag sets.
 
     Args:
@@ -364,16 +451,16 @@ def calculate_tag_similarity(tags1: set[str], tags2: set[str]) -> float:
 
 def filter_images_by_tags(
     images: list[ImageEntry],
-    include_tags: list[str],
-    exclude_tags: list[str],
+    include_tags: Iterable[str],
+    exclude_tags: Iterable[str],
     require_all_include: bool
 ) -> list[ImageEntry]:
     """Filter images based on tag inclusion/exclusion rules.
 
     Args:
         images: All registered images.
-        include_tags: If non-empty, only images with these tags pass.
-        exclude_tags: Images with any of these tags are excluded.
+        include_tags: If non-empty, only images with these tags pass (set or list).
+        exclude_tags: Images with any of these tags are excluded (set or list).
         require_all_include: If True, image must have ALL include tags;
                             If False, image must have ANY include tag.
 
@@ -390,7 +477,7 @@ def filter_images_by_tags(
         img_tags = img.tag_set
 
         # Exclude filter (highest priority)
-        if exclude_set and any(tag in img_tags for tag in exclude_set):
+        if exclude_set and not exclude_set.isdisjoint(img_tags):
             continue
 
         # Include filter
@@ -401,7 +488,7 @@ def filter_images_by_tags(
                     continue
             else:
                 # Must have ANY include tag
-                if not any(tag in img_tags for tag in include_set):
+                if include_set.isdisjoint(img_tags):
                     continue
 
         filtered.append(img)
@@ -445,21 +532,7 @@ def load_image_registry(avatar_dir: Path, registry_config: list[dict]) -> list[I
             missing += 1
 
         # Validate at least one emotion or control tag
-        valid_emotions = {
-            'cheerful', 'excited', 'calm', 'focused', 'warm', 'empathetic', 'neutral',
-            'thinking', 'curious', 'determined', 'apologetic', 'playful', 'surprised',
-            'waiting', 'bored', 'sleeping'
-        }
-        valid_control_tags = {
-            'control-tts-hover-on', 'control-tts-hover-off',
-            'control-stt-hover-on', 'control-stt-hover-off',
-            'control-close-hover',
-            'control-tts-clicked', 'control-stt-clicked',
-            'control-close-animation',
-        }
-        tag_set_lower = {tag.lower() for tag in tags}
-        has_valid_tag = any(tag in valid_emotions or tag in valid_control_tags
-                           for tag in tag_set_lower)
+        has_valid_tag = not _BUILTIN_VALID_TAGS.isdisjoint(tag.lower() for tag in tags)
 
         if not has_valid_tag:
             logger.warning(f'[AVATAR] Image {path.name} has no emotion or control tag, skipping')
@@ -561,6 +634,18 @@ def write_filter_command(pid: int, command: str) -> None:
         logger.debug(f'Wrote filter command: {command}')
 
 
+def _parse_tag_list(value: str) -> set[str]:
+    """Parse a comma-separated filter tag list, dropping blanks.
+
+    Args:
+        value: Raw tag list (e.g., 'casual, summer,').
+
+    Returns:
+        Set of stripped, non-empty tags.
+    """
+    return {tag for tag in map(str.strip, value.split(',')) if tag}
+
+
 # ============================================================================
 # Image Variant Discovery
 # ============================================================================
@@ -656,8 +741,9 @@ def _save_position(x: int, y: int) -> None:
 # ============================================================================
 
 try:
-    from pyagentvox.avatar_tags import VALID_CONTROL_TAGS, VALID_EMOTIONS
+    from pyagentvox.avatar_tags import VALID_CONTROL_TAGS, VALID_EMOTIONS, update_image_tags
 except ImportError:
+    update_image_tags = None  # Tag edits stay in memory only
     VALID_EMOTIONS = {
         'cheerful', 'excited', 'calm', 'focused', 'warm', 'empathetic', 'neutral',
         'thinking', 'curious', 'determined', 'apologetic', 'playful', 'surprised',
@@ -671,6 +757,33 @@ except ImportError:
         'control-close-animation',
     }
 
+# Built-in emotion + control tags, frozen once for per-entry and per-click checks
+_BUILTIN_VALID_TAGS: frozenset[str] = frozenset(map(sys.intern, VALID_EMOTIONS | VALID_CONTROL_TAGS))
+
+
+def _control_tag_spec(control_tag: str) -> tuple[str, str, tuple[str, ...]]:
+    """Normalize a control tag or legacy name for image lookup.
+
+    Args:
+        control_tag: Functional control tag (e.g., 'control-tts-hover-on') or
+            legacy name (e.g., 'tts-off').
+
+    Returns:
+        Tuple of (functional tag, interned lowercase tag-index key, controls
+        directory filename stems to try in order).
+    """
+    if not control_tag.startswith('control-'):
+        control_tag = LEGACY_CONTROL_MAP.get(control_tag, f'control-{control_tag}')
+    base_name = control_tag.removeprefix('control-')
+    return control_tag, sys.intern(control_tag.lower()), (base_name, *LEGACY_REVERSE_MAP.get(control_tag, ()))
+
+
+# Every known control tag and legacy name, normalized once instead of per hover
+CONTROL_TAG_SPECS: dict[str, tuple[str, str, tuple[str, ...]]] = {
+    name: _control_tag_spec(name)
+    for name in (*VALID_CONTROL_TAGS, *LEGACY_CONTROL_MAP, *LEGACY_CONTROL_MAP.values(), *HOVER_CONTROL_TAGS.values())
+}
+
 
 # ============================================================================
 # Tag Editor Dialog
@@ -706,7 +819,7 @@ class TagEditorDialog:
         self._control_tags = sorted(tag for tag in all_tags if tag.lower() in VALID_CONTROL_TAGS)
         self._other_tags = sorted(
             tag for tag in all_tags
-            if tag.lower() not in VALID_EMOTIONS and tag.lower() not in VALID_CONTROL_TAGS
+            if tag.lower() not in _BUILTIN_VALID_TAGS
         )
 
         # Create modal dialog
@@ -927,29 +1040,50 @@ class AvatarWidget:
         self._running = True
         self._fade_alpha = 1.0
         self._fade_after_id: str | None = None  # Track fade animation callback for cancellation
+        self._close_after_id: str | None = None  # Pending close slide frame
+
+        # IPC file paths, built once per widget (unset when not monitoring a PID)
+        self._emotion_file: Path | None = None
+        self._filter_file: Path | None = None
+        self._state_files: dict[str, Path] = {}  # 'tts'/'stt' -> enabled-state file
+        if monitor_pid is not None:
+            self._emotion_file = get_emotion_file_path(monitor_pid)
+            self._filter_file = get_filter_control_file_path(monitor_pid)
+            self._state_files = {
+                kind: self._emotion_file.parent / f'pyagentvox_{kind}_enabled_{monitor_pid}.txt'
+                for kind in ('tts', 'stt')
+            }
 
         # Idle timer state (for bored/sleeping transitions)
         self._idle_start_time: float | None = None
         self._idle_check_after_id: str | None = None
         self._is_speaking = False  # Track whether TTS is currently playing
+        self._last_raw_emotion = ''  # Last emotion read from the IPC file
+        self._last_emotion_stat: tuple[int, int] | None = None  # (mtime_ns, size) of the last read
 
         # Variant cycling state
-        self._variant_cache: dict[str, list[Path]] = {}
+        self._variant_cache: dict[str, list[Path]] = {}  # Filtered variants per emotion
+        self._resolved_variants: dict[str, tuple[list[ImageEntry], list[Path]]] = {}  # Unfiltered sources
         self._current_variant_index: int = 0
         self._cycle_after_id: str | None = None
+        self._rng = random.Random()  # Widget-local RNG (avoids the shared module-level instance)
+        self._warmup_after_id: str | None = None  # Idle-time cache warmup step
 
         # Tag filtering state
         self._image_registry: list[ImageEntry] = []
-        self._include_tags: list[str] = FILTER_CONFIG['include_tags'].copy()
-        self._exclude_tags: list[str] = FILTER_CONFIG['exclude_tags'].copy()
+        self._include_tags: set[str] = set(FILTER_CONFIG['include_tags'])
+        self._exclude_tags: set[str] = set(FILTER_CONFIG['exclude_tags'])
         self._require_all_include: bool = FILTER_CONFIG['require_all_include']
-        self._filter_poll_after_id: str | None = None
+        self._ipc_poll_after_id: str | None = None  # Shared emotion/filter poll tick (polling fallback)
+        self._ipc_poll_tick = 0
+        self._file_observer: Any = None  # watchdog Observer when event-driven IPC is active
 
         # Animation settings
         self._shimmer_threshold: float = ANIMATION_CONFIG['shimmer_threshold']
         self._shimmer_duration: int = ANIMATION_CONFIG['shimmer_duration']
         self._shimmer_steps: int = ANIMATION_CONFIG['shimmer_steps']
         self._shimmer_after_id: str | None = None  # Track shimmer animation callback for cancellation
+        self._shimmer_photo: ImageTk.PhotoImage | None = None  # Reused for every shimmer frame (paste)
 
         # Speaking indicator state
         self._speaking_indicator_id: int | None = None  # Canvas item ID for speech bubble
@@ -962,6 +1096,12 @@ class AvatarWidget:
 
         # Load image registry from config
         self._image_registry = load_image_registry(self.avatar_dir, IMAGE_REGISTRY)
+        self._registry_by_path: dict[Path, ImageEntry] = {}  # Registry path (raw + resolved) -> entry
+        self._tag_counts: Counter[str] = Counter()  # Tag -> number of registry entries using it
+        self._all_tags_cache: set[str] = set()  # Registry tags + all valid system tags (tag editor)
+        self._tag_index: dict[str, list[ImageEntry]] = {}  # Lowercase tag -> entries (registry order)
+        self._controls_file_index: dict[str, Path] | None = None  # controls/ casefolded stem -> path (lazy)
+        self._index_registry()
 
         # Interactive controls state
         self._buttons_visible = False
@@ -969,6 +1109,7 @@ class AvatarWidget:
         self._preview_emotion: str | None = None
         self._tts_enabled = True
         self._stt_enabled = True
+        self._written_states: dict[str, bool] = {}  # kind -> last value written to its state file
         self._tag_editor_open = False
 
         # Canvas-based control button IDs (bg rect + text for each)
@@ -978,6 +1119,10 @@ class AvatarWidget:
         self._hover_locked = False
         self._was_cycling = False
 
+        # Cached canvas bounds in screen coordinates (x1, y1, x2, y2), refreshed on
+        # <Configure> and drag release so hover checks avoid winfo_* round-trips
+        self._canvas_bbox: tuple[int, int, int, int] = (0, 0, 0, 0)
+
         logger.info(f'[AVATAR] Avatar dir: {self.avatar_dir}')
         logger.debug(f'[AVATAR] Avatar dir exists: {self.avatar_dir.exists()}')
         if monitor_pid:
@@ -985,8 +1130,10 @@ class AvatarWidget:
         logger.debug(f'[AVATAR] Image registry: {len(self._image_registry)} entries')
         logger.debug(f'[AVATAR] Widget size: {self.size}px')
 
-        # Image cache: file_path_str -> PhotoImage
-        self._image_cache: dict[str, ImageTk.PhotoImage] = {}
+        # Image cache: image path -> PhotoImage at self.size (size is fixed per widget,
+        # so the Path alone is the key; paths come from cached variant lists and reuse
+        # their memoized hash)
+        self._image_cache: dict[Path, ImageTk.PhotoImage] = {}
 
         # Build window
         logger.debug('[AVATAR] Creating tkinter root window')
@@ -1066,7 +1213,9 @@ class AvatarWidget:
         self._canvas.bind('<ButtonRelease-1>', self._on_drag_release)
         self._canvas.bind('<Enter>', self._on_mouse_enter)
         self._canvas.bind('<Leave>', self._on_mouse_leave)
+        self._root.bind('<Configure>', self._update_canvas_bbox)
         self._root.protocol('WM_DELETE_WINDOW', self.stop)
+        self._update_canvas_bbox()
 
         # Drag state
         self._drag_x = 0
@@ -1081,6 +1230,10 @@ class AvatarWidget:
         logger.debug('[AVATAR] Loading initial avatar (waiting state)')
         self._switch_emotion(WAITING_STATE)
 
+        # Resolve variants and decode one image per remaining emotion between user events
+        known_emotions = sorted(set(EMOTION_AVATAR_MAP) | set(IDLE_STATES) | {WAITING_STATE})
+        self._warmup_after_id = self._root.after_idle(self._warmup, iter(known_emotions))
+
         logger.info(f'[AVATAR] Widget initialized ({self.size}x{self.size}), geometry: {final_geometry}')
 
     def _position_bottom_right(self) -> None:
@@ -1105,82 +1258,154 @@ class AvatarWidget:
         # The transparent background already lets clicks pass through empty areas.
         pass
 
+    def _index_registry(self) -> None:
+        """Rebuild the lookup indexes derived from the image registry.
+
+        Called at init and whenever the registry-derived caches are invalidated.
+        """
+        self._registry_by_path.clear()
+        self._tag_counts.clear()
+        self._tag_index.clear()
+        for img in self._image_registry:
+            self._registry_by_path.setdefault(img.path, img)
+            self._registry_by_path.setdefault(img.resolved_path, img)
+            self._tag_counts.update(set(img.tags))
+            for tag in img.tag_set:
+                self._tag_index.setdefault(tag, []).append(img)
+
+        self._all_tags_cache = set(self._tag_counts)
+        self._all_tags_cache |= _BUILTIN_VALID_TAGS
+
+    def _update_tag_indexes(self, image_entry: ImageEntry, old_tags: Sequence[str], new_tags: Sequence[str]) -> None:
+        """Incrementally update the tag index and reference counts after an edit.
+
+        Tags no longer used by any entry are dropped from the editor tag set,
+        unless they are built-in emotion or control tags.
+
+        Args:
+            image_entry: The entry whose tags changed.
+            old_tags: The entry's previous tags.
+            new_tags: The entry's new tags.
+        """
+        old_lower = {tag.lower() for tag in old_tags}
+        new_lower = {sys.intern(tag.lower()) for tag in new_tags}
+        for tag in old_lower - new_lower:
+            entries = self._tag_index.get(tag, [])
+            if image_entry in entries:
+                entries.remove(image_entry)
+            if not entries:
+                self._tag_index.pop(tag, None)
+        for tag in new_lower - old_lower:
+            self._tag_index.setdefault(tag, []).append(image_entry)
+
+        old_set, new_set = set(old_tags), set(new_tags)
+        for tag in old_set - new_set:
+            self._tag_counts[tag] -= 1
+            if self._tag_counts[tag] <= 0:
+                del self._tag_counts[tag]
+                if tag not in _BUILTIN_VALID_TAGS:
+                    self._all_tags_cache.discard(tag)
+        for tag in new_set - old_set:
+            self._tag_counts[tag] += 1
+            self._all_tags_cache.add(tag)
+
+    def _find_registry_entry(self, image_path: Path) -> ImageEntry | None:
+        """Find the registry entry for an image path via the path index.
+
+        Args:
+            image_path: Path of the displayed image.
+
+        Returns:
+            Matching ImageEntry, or None if the image is not registered.
+        """
+        entry = self._registry_by_path.get(image_path)
+        if entry is None:
+            with contextlib.suppress(OSError):
+                entry = self._registry_by_path.get(image_path.resolve())
+        return entry
+
+    def _resolve_base_variants(self, emotion: str) -> tuple[list[ImageEntry], list[Path]]:
+        """Resolve the filter-independent variant sources for an emotion.
+
+        Args:
+            emotion: Emotion name (e.g., 'excited', 'waiting').
+
+        Returns:
+            Tuple of (tagged registry entries, fallback paths). Registry entries are
+            subject to tag filtering; fallback paths (directory discovery or the
+            default avatar) are only used when no registry entries match.
+        """
+        avatar_name = EMOTION_AVATAR_MAP.get(emotion, emotion)
+        logger.debug(f'[AVATAR] Resolving variants for emotion: {emotion} -> {avatar_name}')
+
+        # Tag-based lookup (if registry is populated): all images with this
+        # emotion tag, excluding control images
+        if self._image_registry:
+            entries = [
+                img for img in self._tag_index.get(avatar_name.lower(), ())
+                if not any(t.startswith('control') for t in img.tag_set)
+            ]
+            logger.debug(f'[AVATAR] Found {len(entries)} images with tag "{avatar_name}"')
+            if entries:
+                return entries, []
+        else:
+            logger.debug('[AVATAR] No image registry, using directory-based discovery')
+
+        # Directory-based discovery (backward compatibility)
+        variants = discover_variants(self.avatar_dir, avatar_name)
+        logger.debug(f'[AVATAR] Directory discovery for "{avatar_name}": {len(variants)} variants')
+
+        # Any emotion (including waiting) with no variants falls back to the default avatar
+        if not variants:
+            default_path = self.avatar_dir / f'{DEFAULT_AVATAR}.png'
+            if default_path.exists():
+                variants = [default_path]
+                if emotion == WAITING_STATE:
+                    logger.debug(f'[AVATAR] Waiting fallback to cheerful: {default_path}')
+                else:
+                    logger.warning(f'[AVATAR] No variants for {emotion}, falling back to {DEFAULT_AVATAR}')
+            elif emotion == WAITING_STATE:
+                logger.warning(f'[AVATAR] No waiting images AND no {DEFAULT_AVATAR}.png found!')
+            else:
+                logger.error(f'[AVATAR] No variants for {emotion} and no fallback image exists!')
+
+        return [], variants
+
     def _get_variants(self, emotion: str) -> list[Path]:
         """Get all image variants for an emotion, with caching.
 
         Uses tag-based lookup if image registry is populated, otherwise falls
-        back to directory-based discovery for backward compatibility.
+        back to directory-based discovery for backward compatibility. The
+        fallback ladder is resolved once per emotion; only the tag filters are
+        re-applied when the filter state changes.
 
         Args:
             emotion: Emotion name (e.g., 'excited', 'waiting').
 
         Returns:
-            List of image paths. Falls back to cheerful.png for empty results
-            on 'waiting' emotion.
+            List of image paths. Falls back to cheerful.png for empty results.
         """
         if emotion not in self._variant_cache:
-            variants: list[Path] = []
-            logger.debug(f'[AVATAR] Resolving variants for emotion: {emotion}')
-
-            # Tag-based lookup (if registry is populated)
-            if self._image_registry:
-                # Map emotion to avatar base name for consistency
-                avatar_name = EMOTION_AVATAR_MAP.get(emotion, emotion)
-                logger.debug(f'[AVATAR] Tag lookup: emotion={emotion} -> avatar_name={avatar_name}')
-
-                # Get all images with this emotion tag (exclude all control tags)
-                emotion_images = [
-                    img for img in self._image_registry
-                    if (avatar_name.lower() in img.tag_set and
-                        not any(tag.startswith('control') for tag in img.tag_set))
-                ]
-                logger.debug(f'[AVATAR] Found {len(emotion_images)} images with tag "{avatar_name}"')
-
-                # Apply tag filters
-                if emotion_images:
-                    filtered = filter_images_by_tags(
-                        emotion_images,
-                        self._include_tags,
-                        self._exclude_tags,
-                        self._require_all_include
-                    )
-                    variants = [img.path for img in filtered]
-                    logger.debug(f'[AVATAR] After filtering: {len(variants)} variants')
+            if emotion not in self._resolved_variants:
+                self._resolved_variants[emotion] = self._resolve_base_variants(emotion)
+            entries, variants = self._resolved_variants[emotion]
+
+            if entries:
+                filtered = filter_images_by_tags(
+                    entries,
+                    self._include_tags,
+                    self._exclude_tags,
+                    self._require_all_include
+                )
+                logger.debug(f'[AVATAR] After filtering: {len(filtered)} variants')
 
                 # Fallback: if filters excluded everything, ignore filters for this emotion
-                if not variants and emotion_images:
-                    variants = [img.path for img in emotion_images]
+                if not filtered:
+                    filtered = entries
                     logger.warning(
                         f'[AVATAR] Tag filters excluded all {emotion} images, ignoring filters'
                     )
-            else:
-                logger.debug('[AVATAR] No image registry, using directory-based discovery')
-
-            # Directory-based discovery (backward compatibility)
-            if not variants:
-                avatar_name = EMOTION_AVATAR_MAP.get(emotion, emotion)
-                variants = discover_variants(self.avatar_dir, avatar_name)
-                logger.debug(
-                    f'[AVATAR] Directory discovery for "{avatar_name}": {len(variants)} variants'
-                )
-
-            # For waiting state, try 'waiting' first, then fall back to cheerful
-            if not variants and emotion == WAITING_STATE:
-                cheerful_path = self.avatar_dir / f'{DEFAULT_AVATAR}.png'
-                if cheerful_path.exists():
-                    variants = [cheerful_path]
-                    logger.debug(f'[AVATAR] Waiting fallback to cheerful: {cheerful_path}')
-                else:
-                    logger.warning(f'[AVATAR] No waiting images AND no {DEFAULT_AVATAR}.png found!')
-
-            # For any emotion with no variants, fall back to default avatar
-            if not variants and emotion != WAITING_STATE:
-                default_path = self.avatar_dir / f'{DEFAULT_AVATAR}.png'
-                if default_path.exists():
-                    variants = [default_path]
-                    logger.warning(f'[AVATAR] No variants for {emotion}, falling back to {DEFAULT_AVATAR}')
-                else:
-                    logger.error(f'[AVATAR] No variants for {emotion} and no fallback image exists!')
+                variants = [img.path for img in filtered]
 
             self._variant_cache[emotion] = variants
             logger.debug(
@@ -1191,6 +1416,45 @@ class AvatarWidget:
 
         return self._variant_cache[emotion]
 
+    def _invalidate_variants_for_tags(self, tags: set[str] | frozenset[str]) -> None:
+        """Drop cached variants for emotions whose lookup tag is in ``tags``.
+
+        An image can only appear in (or fall out of) the variants of emotions it
+        is tagged with, so editing one image leaves every other emotion's cache valid.
+
+        Args:
+            tags: Lowercase tags of the edited image, before and after the edit.
+        """
+        for emotion in list(self._resolved_variants.keys() | self._variant_cache.keys()):
+            if EMOTION_AVATAR_MAP.get(emotion, emotion).lower() in tags:
+                self._resolved_variants.pop(emotion, None)
+                self._variant_cache.pop(emotion, None)
+
+    def _warmup(self, emotions: Iterator[str]) -> None:
+        """Warm the variant and image caches for one emotion, then yield to Tk.
+
+        Moves first-touch variant resolution and image decoding out of the
+        emotion-switch path. Each step handles a single emotion and reschedules
+        itself so user events are never blocked for long.
+
+        Args:
+            emotions: Iterator over emotion names still to warm.
+        """
+        self._warmup_after_id = None
+        if not self._running:
+            return
+
+        emotion = next(emotions, None)
+        if emotion is None:
+            logger.debug(f'[AVATAR] Cache warmup complete ({len(self._image_cache)} images decoded)')
+            return
+
+        variants = self._get_variants(emotion)
+        if variants:
+            self._load_image_from_path(variants[0])
+
+        self._warmup_after_id = self._root.after(WARMUP_INTERVAL_MS, self._warmup, emotions)
+
     def _load_image_from_path(self, image_path: Path) -> ImageTk.PhotoImage | None:
         """Load and cache an image at the current widget size.
 
@@ -1203,9 +1467,9 @@ class AvatarWidget:
         Returns:
             Tkinter-compatible PhotoImage, or None if loading failed.
         """
-        cache_key = f'{image_path}_{self.size}'
-        if cache_key in self._image_cache:
-            return self._image_cache[cache_key]
+        photo = self._image_cache.get(image_path)
+        if photo is not None:
+            return photo
 
         if not image_path.exists():
             logger.error(f'[AVATAR] Image file does not exist: {image_path}')
@@ -1245,7 +1509,7 @@ class AvatarWidget:
             bg.paste(img, (offset_x, offset_y), img)
 
             photo = ImageTk.PhotoImage(bg)
-            self._image_cache[cache_key] = photo
+            self._image_cache[image_path] = photo
             logger.debug(f'[AVATAR] Image cached: {image_path.name} (scaled to {img.width}x{img.height})')
             return photo
         except Exception as e:
@@ -1260,9 +1524,10 @@ class AvatarWidget:
         """
         photo = self._load_image_from_path(image_path)
         if photo:
-            self._canvas.itemconfig(self._image_item, image=photo)
-            # Keep reference to prevent garbage collection
-            self._canvas._current_photo = photo  # type: ignore[attr-defined]
+            if getattr(self._canvas, '_current_photo', None) is not photo:
+                self._canvas.itemconfig(self._image_item, image=photo)
+                # Keep reference to prevent garbage collection
+                self._canvas._current_photo = photo  # type: ignore[attr-defined]
             self.current_avatar_path = image_path
             logger.debug(f'[AVATAR] Displaying: {image_path.name}')
         else:
@@ -1289,22 +1554,22 @@ class AvatarWidget:
             logger.warning(f'No variants found for emotion: {emotion}')
             return
 
-        # Choose a random variant for visual variety
-        new_variant_index = random.randint(0, len(variants) - 1)
-        new_image_path = variants[new_variant_index]
+        # Choose a random variant for visual variety, skipping the image already on
+        # screen so the switch always produces a visible change
+        pool = variants
+        if len(variants) > 1 and self.current_avatar_path in variants:
+            pool = [v for v in variants if v != self.current_avatar_path]
+        new_image_path = self._rng.choice(pool)
+        new_variant_index = variants.index(new_image_path)
 
         # Determine if we should use shimmer animation based on tag similarity
         use_shimmer = force_shimmer
         if not use_shimmer and self._image_registry and self.current_avatar_path:
             # Get tags for current and new images
-            current_tags = set()
-            new_tags = set()
-
-            for img in self._image_registry:
-                if img.path == self.current_avatar_path:
-                    current_tags = img.tag_set
-                if img.path == new_image_path:
-                    new_tags = img.tag_set
+            current_entry = self._registry_by_path.get(self.current_avatar_path)
+            new_entry = self._registry_by_path.get(new_image_path)
+            current_tags = current_entry.tag_set if current_entry else frozenset()
+            new_tags = new_entry.tag_set if new_entry else frozenset()
 
             # Calculate similarity and decide animation type
             if current_tags and new_tags:
@@ -1367,6 +1632,8 @@ class AvatarWidget:
         """Perform a smooth fade transition to a new emotion.
 
         Fades out the current avatar, swaps the emotion, then fades back in.
+        Window alpha is only supported on Windows, so other platforms switch
+        immediately instead of running a timer chain that changes nothing.
 
         Args:
             new_emotion: Emotion name to transition to.
@@ -1374,6 +1641,10 @@ class AvatarWidget:
         if new_emotion == self.current_emotion:
             return
 
+        if sys.platform != 'win32':
+            self._switch_emotion(new_emotion)
+            return
+
         # Cancel any in-progress fade to prevent overlapping animations
         if self._fade_after_id is not None:
             with contextlib.suppress(tk.TclError):
@@ -1392,9 +1663,8 @@ class AvatarWidget:
         self._fade_step += 1
         alpha = max(0.0, 1.0 - (self._fade_step / FADE_STEPS))
 
-        if sys.platform == 'win32':
-            with contextlib.suppress(tk.TclError):
-                self._root.attributes('-alpha', alpha)
+        with contextlib.suppress(tk.TclError):
+            self._root.attributes('-alpha', alpha)
 
         if self._fade_step >= FADE_STEPS:
             # Swap emotion at full transparency
@@ -1412,9 +1682,8 @@ class AvatarWidget:
         self._fade_step += 1
         alpha = min(1.0, self._fade_step / FADE_STEPS)
 
-        if sys.platform == 'win32':
-            with contextlib.suppress(tk.TclError):
-                self._root.attributes('-alpha', alpha)
+        with contextlib.suppress(tk.TclError):
+            self._root.attributes('-alpha', alpha)
 
         if self._fade_step < FADE_STEPS:
             self._fade_after_id = self._root.after(FADE_INTERVAL_MS, self._fade_in)
@@ -1512,7 +1781,9 @@ class AvatarWidget:
 
         Returns the image fitted to widget size with aspect ratio preserved
         and bottom-anchored on transparent background, matching the normal
-        display pipeline exactly.
+        display pipeline. Uses BILINEAR resampling since shimmer frames are
+        only on screen for a few milliseconds; the settled frame is rendered
+        by _display_variant with LANCZOS.
 
         Args:
             image_path: Path to the image file.
@@ -1524,7 +1795,7 @@ class AvatarWidget:
             return None
         try:
             img = Image.open(image_path).convert('RGBA')
-            img.thumbnail((self.size, self.size), Image.Resampling.LANCZOS)
+            img.thumbnail((self.size, self.size), Image.Resampling.BILINEAR)
 
             # Composite onto transparent background, bottom-anchored
             r, g, b = self._transparent_rgb
@@ -1562,9 +1833,14 @@ class AvatarWidget:
             result = brightened.convert('RGBA')
             result.putalpha(a_chan)
 
-            photo = ImageTk.PhotoImage(result)
-            self._canvas.itemconfig(self._image_item, image=photo)
-            self._canvas._current_photo = photo  # type: ignore[attr-defined]
+            # Paste into one persistent PhotoImage instead of allocating a new
+            # pixmap per frame; only re-point the canvas item when switching to it
+            if self._shimmer_photo is None:
+                self._shimmer_photo = ImageTk.PhotoImage('RGBA', (self.size, self.size))
+            self._shimmer_photo.paste(result)
+            if getattr(self._canvas, '_current_photo', None) is not self._shimmer_photo:
+                self._canvas.itemconfig(self._image_item, image=self._shimmer_photo)
+                self._canvas._current_photo = self._shimmer_photo  # type: ignore[attr-defined]
         except Exception as e:
             logger.error(f'[AVATAR] Failed to render shimmer frame: {e}')
 
@@ -1763,6 +2039,7 @@ class AvatarWidget:
     def _on_drag_release(self, event: tk.Event) -> None:
         """Save position when drag ends and restore focus to previous window."""
         _save_position(self._root.winfo_x(), self._root.winfo_y())
+        self._update_canvas_bbox()
 
         # Restore focus to previous window after drag
         if self._drag_prev_hwnd and sys.platform == 'win32' and win32gui:
@@ -1803,20 +2080,38 @@ class AvatarWidget:
         self._root.after(100, self._check_hide_buttons)
         self._root.after(100, self._check_release_hover_lock)
 
+    def _update_canvas_bbox(self, event: tk.Event | None = None) -> None:
+        """Refresh the cached canvas bounds (screen coordinates).
+
+        Bound to <Configure> and called after drags, so hover checks can
+        compare against plain integers instead of querying the window system.
+
+        Args:
+            event: Optional Tkinter event (from the <Configure> binding).
+        """
+        with contextlib.suppress(tk.TclError):
+            x = self._canvas.winfo_rootx()
+            y = self._canvas.winfo_rooty()
+            self._canvas_bbox = (x, y, x + self._canvas.winfo_width(), y + self._canvas.winfo_height())
+
+    def _pointer_over_canvas(self) -> bool:
+        """Check whether the mouse pointer is inside the cached canvas bounds.
+
+        Raises:
+            tk.TclError: If the pointer position cannot be queried.
+        """
+        x, y = self._root.winfo_pointerxy()
+        x1, y1, x2, y2 = self._canvas_bbox
+        return x1 <= x <= x2 and y1 <= y <= y2
+
     def _check_hide_buttons(self) -> None:
         """Check if mouse is still over avatar/buttons area, hide if not."""
         if not self._buttons_visible:
             return
 
         try:
-            x, y = self._root.winfo_pointerxy()
-            canvas_x = self._canvas.winfo_rootx()
-            canvas_y = self._canvas.winfo_rooty()
-            canvas_w = self._canvas.winfo_width()
-            canvas_h = self._canvas.winfo_height()
-
             # If mouse is outside canvas area, hide buttons and glow
-            if not (canvas_x <= x <= canvas_x + canvas_w and canvas_y <= y <= canvas_y + canvas_h):
+            if not self._pointer_over_canvas():
                 self._hide_buttons()
                 self._hide_hover_glow()
         except tk.TclError:
@@ -1828,16 +2123,7 @@ class AvatarWidget:
             return
 
         try:
-            x, y = self._root.winfo_pointerxy()
-            canvas_x = self._canvas.winfo_rootx()
-            canvas_y = self._canvas.winfo_rooty()
-            canvas_w = self._canvas.winfo_width()
-            canvas_h = self._canvas.winfo_height()
-
-            still_over_canvas = (canvas_x <= x <= canvas_x + canvas_w
-                                 and canvas_y <= y <= canvas_y + canvas_h)
-
-            if not still_over_canvas:
+            if not self._pointer_over_canvas():
                 self._hover_locked = False
 
                 # Resume variant cycling if it was active before hover
@@ -1984,8 +2270,9 @@ class AvatarWidget:
         When hover-locked, only the button color changes -- the locked avatar
         image stays visible.
         """
-        if tag in self._ctrl_btn_ids:
-            bg_id, text_id = self._ctrl_btn_ids[tag]
+        ids = self._ctrl_btn_ids.get(tag)
+        if ids is not None:
+            bg_id, text_id = ids
             self._canvas.itemconfig(bg_id, fill=self._get_btn_hover_color(tag))
             self._canvas.itemconfig(text_id, fill='#ffffff')
 
@@ -2009,8 +2296,9 @@ class AvatarWidget:
         When hover-locked, only the button color reverts -- the locked avatar
         image stays visible (no restore needed since no preview was shown).
         """
-        if tag in self._ctrl_btn_ids:
-            bg_id, text_id = self._ctrl_btn_ids[tag]
+        ids = self._ctrl_btn_ids.get(tag)
+        if ids is not None:
+            bg_id, text_id = ids
             self._canvas.itemconfig(bg_id, fill=self._get_btn_color(tag))
             self._canvas.itemconfig(text_id, fill='#cccccc')
 
@@ -2045,37 +2333,19 @@ class AvatarWidget:
 
         try:
             # Find the ImageEntry for the current image
-            current_entry: ImageEntry | None = None
-            for img in self._image_registry:
-                if img.path == self.current_avatar_path:
-                    current_entry = img
-                    break
-                # Fall back to resolved path comparison (guard against OSError)
-                with contextlib.suppress(OSError):
-                    if img.path.resolve() == self.current_avatar_path.resolve():
-                        current_entry = img
-                        break
+            current_entry = self._find_registry_entry(self.current_avatar_path)
 
             if current_entry is None:
                 logger.warning(f'[TAGS] Current image not in registry: {self.current_avatar_path}')
                 return
 
-            # Collect all tags across the entire registry
-            all_tags: set[str] = set()
-            for img in self._image_registry:
-                all_tags.update(img.tags)
-
-            # Also include all known valid tags so user can add new ones
-            all_tags.update(VALID_EMOTIONS)
-            all_tags.update(VALID_CONTROL_TAGS)
-
             self._tag_editor_open = True
 
-            # Open dialog
+            # Open dialog with all registry tags plus all known valid tags (cached)
             dialog = TagEditorDialog(
                 self._root,
                 current_entry,
-                all_tags,
+                self._all_tags_cache,
                 lambda new_tags: self._save_image_tags(current_entry, new_tags),
             )
 
@@ -2092,26 +2362,31 @@ class AvatarWidget:
 
         Updates the in-memory ImageEntry, invalidates the variant cache so
         the new tags take effect immediately, and persists to disk via
-        avatar_tags.update_image_tags().
+        avatar_tags.update_image_tags(). Saving an unchanged tag list is a no-op.
 
         Args:
             image_entry: The image entry being updated.
             new_tags: New list of tags to assign.
         """
-        old_tags = image_entry.tags[:]
+        old_tags = image_entry.tags
+        if tuple(new_tags) == old_tags:
+            logger.debug(f'[TAGS] No tag changes for {image_entry.path.name}, skipping save')
+            return
+
+        old_set, new_set = set(old_tags), set(new_tags)
         image_entry.tags = new_tags
-        logger.info(f'[TAGS] Updated {image_entry.path.name}: {old_tags} -> {new_tags}')
+        logger.info(
+            f'[TAGS] Updated {image_entry.path.name}: '
+            f'+{sorted(new_set - old_set)} -{sorted(old_set - new_set)}'
+        )
+        self._update_tag_indexes(image_entry, old_tags, new_tags)
 
-        # Invalidate variant cache so tag changes take effect immediately
-        self._variant_cache.clear()
+        # Invalidate only the emotions this image belongs (or belonged) to, so
+        # tag changes take effect immediately without re-resolving every emotion
+        self._invalidate_variants_for_tags(image_entry.tag_set | {tag.lower() for tag in old_set})
 
         # Persist to config file
-        try:
-            from pyagentvox.avatar_tags import update_image_tags
-
-            update_image_tags(image_entry.path, new_tags)
-            logger.info(f'[TAGS] Saved to config: {image_entry.path.name}')
-        except ImportError:
+        if update_image_tags is None:
             logger.error('[TAGS] avatar_tags module not available, changes only in memory')
             messagebox.showwarning(
                 'Save Warning',
@@ -2119,6 +2394,11 @@ class AvatarWidget:
                 'The avatar_tags module is not available.',
                 parent=self._root,
             )
+            return
+
+        try:
+            update_image_tags(image_entry.path, new_tags)
+            logger.info(f'[TAGS] Saved to config: {image_entry.path.name}')
         except Exception as e:
             logger.error(f'[TAGS] Failed to save: {e}')
             messagebox.showerror(
@@ -2145,8 +2425,9 @@ class AvatarWidget:
         gap = 6
         num_buttons = 4
         total_w = num_buttons * btn_w + (num_buttons - 1) * gap
-        canvas_w = self._canvas.winfo_width()
-        canvas_h = self._canvas.winfo_height()
+        x1, y1, x2, y2 = self._canvas_bbox
+        canvas_w = x2 - x1
+        canvas_h = y2 - y1
         start_x = (canvas_w - total_w) // 2
         y = canvas_h - btn_h - 10  # 10px margin from bottom
 
@@ -2231,14 +2512,11 @@ class AvatarWidget:
 
         # Tag-based lookup from image registry (if hover tag is configured)
         hover_tag = BUTTON_HOVER_TAGS.get(avatar_key)
-        if hover_tag and self._image_registry:
-            matching = [
-                img for img in self._image_registry
-                if hover_tag.lower() in img.tag_set
-            ]
+        if hover_tag:
+            matching = self._tag_index.get(hover_tag.lower())
             if matching:
                 # Pick a random match for visual variety
-                chosen = random.choice(matching)
+                chosen = self._rng.choice(matching)
                 self._display_variant(chosen.path)
                 logger.debug(
                     f'[AVATAR] Button hover preview: {chosen.path.name} '
@@ -2247,15 +2525,7 @@ class AvatarWidget:
                 return
 
         # Fall back to control-tag system with state-aware tag name
-        # Maps avatar_key (e.g., 'tts_on') to control tag (e.g., 'control-tts-hover-on')
-        control_tag_map = {
-            'tts_on': 'control-tts-hover-on',
-            'tts_off': 'control-tts-hover-off',
-            'stt_on': 'control-stt-hover-on',
-            'stt_off': 'control-stt-hover-off',
-            'close': 'control-close-hover',
-        }
-        fallback_tag = control_tag_map.get(avatar_key, f'control-{control_type}-hover')
+        fallback_tag = HOVER_CONTROL_TAGS[avatar_key]
         logger.debug(f'[AVATAR] Trying control tag fallback: {fallback_tag}')
         self._load_control_image(fallback_tag)
 
@@ -2284,54 +2554,29 @@ class AvatarWidget:
                         'control-close-hover'). Also accepts legacy names for
                         backward compatibility.
         """
-        # Legacy filename mapping for backward compatibility
-        legacy_map = {
-            'tts-on': 'control-tts-hover-on',
-            'tts-off': 'control-tts-hover-off',
-            'stt-on': 'control-stt-hover-on',
-            'stt-off': 'control-stt-hover-off',
-            'close': 'control-close-hover',
-            'pleading': 'control-close-hover',        # Legacy name
-            'tts-toggled': 'control-tts-clicked',
-            'stt-toggled': 'control-stt-clicked',
-            'crying': 'control-close-animation',      # Legacy name
-        }
-
-        # Normalize: map legacy names to functional tags
-        if not control_tag.startswith('control-'):
-            control_tag = legacy_map.get(control_tag, f'control-{control_tag}')
-
-        # Tag-based lookup (if registry is populated)
-        if self._image_registry:
-            for img in self._image_registry:
-                if control_tag.lower() in img.tag_set:
-                    self._display_variant(img.path)
-                    logger.debug(f'Loaded control image by tag: {control_tag}')
-                    return
+        # Normalize: map legacy names to functional tags (precomputed for known tags)
+        spec = CONTROL_TAG_SPECS.get(control_tag)
+        control_tag, index_key, filenames_to_try = spec if spec is not None else _control_tag_spec(control_tag)
+
+        # Tag-based lookup (if registry is populated): first entry carrying the tag.
+        # Index keys are interned, so an interned probe usually matches by identity.
+        tagged = self._tag_index.get(index_key)
+        if tagged:
+            self._display_variant(tagged[0].path)
+            logger.debug(f'Loaded control image by tag: {control_tag}')
+            return
 
         # Fallback: filename-based lookup in controls subdirectory
-        # Try functional tag name first (strip 'control-' prefix), then legacy filenames
-        base_name = control_tag.replace('control-', '') if control_tag.startswith('control-') else control_tag
-
-        # Build list of filenames to try: functional name, then any legacy names that map here
-        filenames_to_try = [base_name]
-        for legacy_name, functional_tag in legacy_map.items():
-            if functional_tag == control_tag and legacy_name not in filenames_to_try:
-                filenames_to_try.append(legacy_name)
-
-        controls_dir = self.avatar_dir / 'controls'
-        if not controls_dir.exists():
-            logger.warning(f'Controls directory not found and no tag match: {controls_dir}')
+        # Try functional tag name first (without 'control-' prefix), then legacy filenames
+        controls_index = self._get_controls_file_index()
+        if not controls_index:
+            logger.warning(f'No control images found and no tag match: {self.avatar_dir / "controls"}')
             return
 
-        # Try to find image with any supported extension and filename variant
+        # Try each filename variant against the cached directory listing
         img_path = None
         for filename in filenames_to_try:
-            for ext in ['.png', '.jpg', '.jpeg', '.webp']:
-                candidate = controls_dir / f'{filename}{ext}'
-                if candidate.exists():
-                    img_path = candidate
-                    break
+            img_path = controls_index.get(filename.casefold())
             if img_path:
                 break
 
@@ -2341,6 +2586,32 @@ class AvatarWidget:
         else:
             logger.warning(f'Control image not found by tag or filename: {control_tag}')
 
+    def _get_controls_file_index(self) -> dict[str, Path]:
+        """Get the cached stem -> path map of images in the controls subdirectory.
+
+        The directory is listed once on first use (and again after
+        invalidate_variant_cache) instead of probing candidate files on every hover.
+        Stems are casefolded, so 'TTS-Off.png' matches as on a case-insensitive
+        filesystem; callers casefold the name they look up. When a stem exists
+        with several extensions, IMAGE_EXTENSIONS order wins.
+
+        Returns:
+            Dict mapping casefolded file stem (e.g., 'tts-off') to image path.
+            Empty if the controls directory is missing.
+        """
+        if self._controls_file_index is None:
+            controls_dir = self.avatar_dir / 'controls'
+            index: dict[str, Path] = {}
+            try:
+                images = [p for p in controls_dir.iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS]
+            except OSError:
+                logger.debug(f'[AVATAR] Controls directory not available: {controls_dir}')
+                images = []
+            for img_path in sorted(images, key=lambda p: IMAGE_EXTENSIONS.index(p.suffix.lower())):
+                index.setdefault(img_path.stem.casefold(), img_path)
+            self._controls_file_index = index
+        return self._controls_file_index
+
     def _toggle_tts(self) -> None:
         """Toggle TTS enabled/disabled state."""
         self._tts_enabled = not self._tts_enabled
@@ -2372,12 +2643,17 @@ class AvatarWidget:
             on_icon: Icon to show when enabled.
             off_icon: Icon to show when disabled.
         """
-        if tag in self._ctrl_btn_ids:
-            bg_id, text_id = self._ctrl_btn_ids[tag]
-            self._canvas.itemconfig(text_id, text=on_icon if enabled else off_icon)
-            self._canvas.itemconfig(
-                bg_id, fill=BTN_COLOR_ACTIVE if enabled else BTN_COLOR_INACTIVE,
-            )
+        # Buttons only exist while shown; _hide_buttons deletes them
+        ids = self._ctrl_btn_ids.get(tag)
+        if ids is None:
+            return
+        bg_id, text_id = ids
+        if enabled:
+            self._canvas.itemconfig(text_id, text=on_icon)
+            self._canvas.itemconfig(bg_id, fill=BTN_COLOR_ACTIVE)
+        else:
+            self._canvas.itemconfig(text_id, text=off_icon)
+            self._canvas.itemconfig(bg_id, fill=BTN_COLOR_INACTIVE)
 
     def _show_feedback(self, feedback_type: str) -> None:
         """Show confirmation image for 1 second, then restore emotion.
@@ -2402,16 +2678,7 @@ class AvatarWidget:
         Args:
             enabled: Whether TTS is enabled.
         """
-        if self.monitor_pid is None:
-            logger.warning('[AVATAR] Cannot write TTS state: no monitor PID')
-            return
-
-        state_file = Path(tempfile.gettempdir()) / f'pyagentvox_tts_enabled_{self.monitor_pid}.txt'
-        try:
-            state_file.write_text('1' if enabled else '0', encoding='utf-8')
-            logger.info(f'[AVATAR] Wrote TTS state: {"enabled" if enabled else "disabled"} -> {state_file}')
-        except OSError as e:
-            logger.error(f'[AVATAR] Failed to write TTS state: {e}')
+        self._write_state_file('tts', enabled)
 
     def _write_stt_state(self, enabled: bool) -> None:
         """Write STT enabled state to IPC file.
@@ -2419,16 +2686,39 @@ class AvatarWidget:
         Args:
             enabled: Whether STT is enabled.
         """
+        self._write_state_file('stt', enabled)
+
+    def _write_state_file(self, kind: str, enabled: bool) -> None:
+        """Atomically write a control state file, skipping unchanged values.
+
+        The value is written to a sibling temp file and moved into place with
+        ``os.replace`` so the main process never reads a partial file.
+
+        Args:
+            kind: State name, either 'tts' or 'stt'.
+            enabled: Whether the feature is enabled.
+        """
+        label = kind.upper()
         if self.monitor_pid is None:
-            logger.warning('[AVATAR] Cannot write STT state: no monitor PID')
+            logger.warning(f'[AVATAR] Cannot write {label} state: no monitor PID')
             return
 
-        state_file = Path(tempfile.gettempdir()) / f'pyagentvox_stt_enabled_{self.monitor_pid}.txt'
+        state_file = self._state_files[kind]
+        if self._written_states.get(kind) == enabled and state_file.exists():
+            return
+
+        tmp_file = state_file.with_suffix('.tmp')
         try:
-            state_file.write_text('1' if enabled else '0', encoding='utf-8')
-            logger.info(f'[AVATAR] Wrote STT state: {"enabled" if enabled else "disabled"} -> {state_file}')
+            tmp_file.write_text('1' if enabled else '0', encoding='utf-8')
+            os.replace(tmp_file, state_file)
         except OSError as e:
-            logger.error(f'[AVATAR] Failed to write STT state: {e}')
+            logger.error(f'[AVATAR] Failed to write {label} state: {e}')
+            with contextlib.suppress(OSError):
+                tmp_file.unlink(missing_ok=True)
+            return
+
+        self._written_states[kind] = enabled
+        logger.info(f'[AVATAR] Wrote {label} state: {"enabled" if enabled else "disabled"} -> {state_file}')
 
     def _close_with_animation(self) -> None:
         """Show crying Luna and animate slide-down with fade-out.
@@ -2440,37 +2730,49 @@ class AvatarWidget:
         # Hide control buttons so only crying image is visible
         self._hide_buttons()
 
+        if self._close_after_id is not None:
+            return  # Exit sequence already running
+
         # Show close animation image (crying Luna)
         self._load_control_image('control-close-animation')
-        self._root.update()
-        time.sleep(0.5)
 
-        # Animate slide-down with simultaneous fade-out using ease-in curve
-        steps = 40
-        distance = 350
-        total_duration = 1.2  # seconds
-        delay = total_duration / steps
+        # Hold on the image, then slide; after() keeps the mainloop responsive throughout
+        self._close_after_id = self._root.after(
+            CLOSE_HOLD_MS, self._close_slide_step, 0, self._root.winfo_x(), self._root.winfo_y()
+        )
 
-        start_x = self._root.winfo_x()
-        start_y = self._root.winfo_y()
+    def _close_slide_step(self, step: int, start_x: int, start_y: int) -> None:
+        """Advance the close slide-down by one frame, then stop the widget.
 
-        for i in range(steps):
-            # Ease-in (cubic): slow start, accelerating exit
-            t = i / steps
-            eased = t * t * t
+        Args:
+            step: Current frame index (0 to CLOSE_SLIDE_STEPS).
+            start_x: Window x position when the slide started.
+            start_y: Window y position when the slide started.
+        """
+        if not self._running:
+            return
+
+        if step >= CLOSE_SLIDE_STEPS:
+            self._close_after_id = None
+            logger.info('Avatar closed with animation')
+            self.stop()
+            return
 
-            offset = int(distance * eased)
-            alpha = max(0.0, 1.0 - eased)
+        # Ease-in (cubic): slow start, accelerating exit
+        t = step / CLOSE_SLIDE_STEPS
+        eased = t * t * t
 
+        offset = int(CLOSE_SLIDE_DISTANCE * eased)
+        alpha = max(0.0, 1.0 - eased)
+
+        with contextlib.suppress(tk.TclError):
             self._root.geometry(f'+{start_x}+{start_y + offset}')
             if sys.platform == 'win32':
-                with contextlib.suppress(tk.TclError):
-                    self._root.attributes('-alpha', alpha)
-            self._root.update()
-            time.sleep(delay)
+                self._root.attributes('-alpha', alpha)
 
-        logger.info('Avatar closed with animation')
-        self.stop()
+        self._close_after_id = self._root.after(
+            CLOSE_SLIDE_INTERVAL_MS, self._close_slide_step, step + 1, start_x, start_y
+        )
 
     def _enable_click_through(self) -> None:
         """Enable click-through mode (Windows only)."""
@@ -2487,8 +2789,23 @@ class AvatarWidget:
     # Filter Control File Monitoring
     # ========================================================================
 
-    def _poll_filter_control_file(self) -> None:
-        """Poll the filter control file and update tag filters on changes.
+    def _set_include_filter(self, value: str) -> None:
+        """Handle an ``include:`` filter command."""
+        self._include_tags = _parse_tag_list(value)
+        logger.info(f'[FILTER] Include tags: {sorted(self._include_tags)}')
+
+    def _set_exclude_filter(self, value: str) -> None:
+        """Handle an ``exclude:`` filter command."""
+        self._exclude_tags = _parse_tag_list(value)
+        logger.info(f'[FILTER] Exclude tags: {sorted(self._exclude_tags)}')
+
+    def _set_require_all_filter(self, value: str) -> None:
+        """Handle a ``require_all:`` filter command."""
+        self._require_all_include = value.lower() == 'true'
+        logger.info(f'[FILTER] Require all: {self._require_all_include}')
+
+    def _apply_filter_file(self) -> None:
+        """Read the filter control file, if present, and update tag filters.
 
         Control file format (one command per line):
             include:tag1,tag2,tag3
@@ -2499,30 +2816,25 @@ class AvatarWidget:
         if not self._running or self.monitor_pid is None:
             return
 
-        filter_file = Path(tempfile.gettempdir()) / f'agent_avatar_filter_{self.monitor_pid}.txt'
+        filter_file = self._filter_file
 
         try:
             if filter_file.exists():
                 commands = filter_file.read_text(encoding='utf-8').strip().split('\n')
 
+                handlers = {
+                    'include': self._set_include_filter,
+                    'exclude': self._set_exclude_filter,
+                    'require_all': self._set_require_all_filter,
+                }
                 for cmd in commands:
-                    if cmd.startswith('include:'):
-                        tags = cmd[8:].split(',')
-                        self._include_tags = [t.strip() for t in tags if t.strip()]
-                        logger.info(f'[FILTER] Include tags: {self._include_tags}')
-
-                    elif cmd.startswith('exclude:'):
-                        tags = cmd[8:].split(',')
-                        self._exclude_tags = [t.strip() for t in tags if t.strip()]
-                        logger.info(f'[FILTER] Exclude tags: {self._exclude_tags}')
-
-                    elif cmd.startswith('require_all:'):
-                        self._require_all_include = cmd[12:].lower() == 'true'
-                        logger.info(f'[FILTER] Require all: {self._require_all_include}')
-
+                    key, sep, value = cmd.partition(':')
+                    handler = handlers.get(key) if sep else None
+                    if handler is not None:
+                        handler(value)
                     elif cmd == 'reset':
-                        self._include_tags = []
-                        self._exclude_tags = []
+                        self._include_tags = set()
+                        self._exclude_tags = set()
                         self._require_all_include = False
                         logger.info('[FILTER] Filters reset')
 
@@ -2542,30 +2854,36 @@ class AvatarWidget:
         except Exception as e:
             logger.error(f'Error polling filter control file: {e}')
 
-        # Schedule next poll
-        if self._running:
-            self._filter_poll_after_id = self._root.after(
-                FILTER_POLL_INTERVAL_MS, self._poll_filter_control_file
-            )
-
     # ========================================================================
     # Emotion File Monitoring
     # ========================================================================
 
-    def _poll_emotion_file(self) -> None:
-        """Poll the emotion IPC file and update avatar on changes.
-
-        Scheduled on the Tkinter main loop to avoid threading issues.
-        """
+    def _apply_emotion_file(self) -> None:
+        """Read the emotion IPC file and update the avatar on changes."""
         if not self._running or self.monitor_pid is None:
             return
 
+        # One stat per poll: skip the read entirely while the file is unchanged
+        emotion_file = self._emotion_file
         try:
-            emotion = read_emotion_state(self.monitor_pid)
+            st = emotion_file.stat()
+        except OSError:
+            self._last_emotion_stat = None
+            return
+        emotion_stat = (st.st_mtime_ns, st.st_size)
+        if emotion_stat == self._last_emotion_stat:
+            return
+        self._last_emotion_stat = emotion_stat
+
+        try:
+            emotion = emotion_file.read_text(encoding='utf-8').strip()
+        except OSError:
+            return
 
+        try:
             if emotion:
                 # Determine if TTS is speaking (any emotion except waiting/bored/sleeping)
-                is_speaking = emotion not in [WAITING_STATE, 'bored', 'sleeping']
+                is_speaking = emotion not in NON_SPEAKING_EMOTIONS
 
                 if is_speaking and not self._is_speaking:
                     # TTS started speaking - reset idle timer and show indicator
@@ -2581,9 +2899,6 @@ class AvatarWidget:
                     logger.debug(f'[AVATAR] TTS stopped speaking, entering: {emotion}')
 
                 # Only resolve emotion if it changed from last poll (avoid redundant discover_variants calls)
-                if not hasattr(self, '_last_raw_emotion'):
-                    self._last_raw_emotion = ''
-
                 if emotion != self._last_raw_emotion:
                     # Resolve emotion through hierarchy if needed
                     resolved_emotion = resolve_emotion_hierarchy(emotion, self.avatar_dir)
@@ -2595,9 +2910,73 @@ class AvatarWidget:
         except Exception as e:
             logger.error(f'[AVATAR] Error polling emotion file: {e}')
 
-        # Schedule next poll
+    # ========================================================================
+    # IPC File Watch / Polling
+    # ========================================================================
+
+    def _poll_ipc_files(self) -> None:
+        """Poll the emotion and filter IPC files on one shared timer.
+
+        Fallback when watchdog is unavailable. A single ``after`` chain ticks at
+        the emotion interval and checks the filter file every
+        FILTER_POLL_EVERY_TICKS ticks, instead of two independent timer chains.
+        Scheduled on the Tkinter main loop to avoid threading issues.
+        """
+        self._ipc_poll_after_id = None
+        if not self._running or self.monitor_pid is None:
+            return
+
+        self._apply_emotion_file()
+
+        self._ipc_poll_tick += 1
+        if self._ipc_poll_tick >= FILTER_POLL_EVERY_TICKS:
+            self._ipc_poll_tick = 0
+            self._apply_filter_file()
+
+        # Schedule next tick
         if self._running:
-            self._root.after(EMOTION_POLL_INTERVAL_MS, self._poll_emotion_file)
+            self._ipc_poll_after_id = self._root.after(EMOTION_POLL_INTERVAL_MS, self._poll_ipc_files)
+
+    def _start_file_watch(self) -> bool:
+        """Watch the emotion and filter IPC files with OS change notifications.
+
+        Uses watchdog (inotify, ReadDirectoryChangesW, FSEvents) when it is
+        installed. Events arrive on the observer thread and are marshaled back
+        to the Tk main loop with ``after(0, ...)``.
+
+        Returns:
+            True if the watch is running, False if the caller should fall back
+            to timer polling.
+        """
+        if Observer is None or self.monitor_pid is None:
+            return False
+
+        callbacks = {
+            self._emotion_file.name: self._apply_emotion_file,
+            self._filter_file.name: self._apply_filter_file,
+        }
+        try:
+            observer = Observer()
+            observer.schedule(IPCFileEventHandler(callbacks, self._post_to_main_loop), tempfile.gettempdir())
+            observer.daemon = True
+            observer.start()
+        except Exception as e:
+            logger.warning(f'[AVATAR] File watch unavailable, falling back to polling: {e}')
+            return False
+
+        self._file_observer = observer
+        return True
+
+    def _post_to_main_loop(self, callback: Callable[[], None]) -> None:
+        """Schedule a callback on the Tk main loop from a watcher thread.
+
+        Args:
+            callback: Zero-argument callable to run on the main loop.
+        """
+        if not self._running:
+            return
+        with contextlib.suppress(RuntimeError, tk.TclError):
+            self._root.after(0, callback)
 
     # ========================================================================
     # Visibility Guard
@@ -2636,15 +3015,17 @@ class AvatarWidget:
         """
         # Start polling emotion file if monitoring a PID
         if self.monitor_pid is not None:
-            emotion_file = get_emotion_file_path(self.monitor_pid)
-            logger.info(f'[AVATAR] Monitoring emotion file: {emotion_file}')
-            logger.debug(f'[AVATAR] Emotion file exists: {emotion_file.exists()}')
-            self._root.after(EMOTION_POLL_INTERVAL_MS, self._poll_emotion_file)
-
-            # Start polling filter control file
-            filter_file = get_filter_control_file_path(self.monitor_pid)
-            logger.debug(f'[AVATAR] Monitoring filter control file: {filter_file}')
-            self._root.after(FILTER_POLL_INTERVAL_MS, self._poll_filter_control_file)
+            logger.info(f'[AVATAR] Monitoring emotion file: {self._emotion_file}')
+            logger.debug(f'[AVATAR] Emotion file exists: {self._emotion_file.exists()}')
+            logger.debug(f'[AVATAR] Monitoring filter control file: {self._filter_file}')
+
+            if self._start_file_watch():
+                # Pick up anything written before the watch started
+                logger.debug('[AVATAR] Watching IPC files for change events')
+                self._root.after(0, self._apply_emotion_file)
+                self._root.after(0, self._apply_filter_file)
+            else:
+                self._ipc_poll_after_id = self._root.after(EMOTION_POLL_INTERVAL_MS, self._poll_ipc_files)
 
         # Start idle timer for bored/sleeping transitions
         self._start_idle_timer()
@@ -2685,11 +3066,29 @@ class AvatarWidget:
                 self._root.after_cancel(self._idle_check_after_id)
             self._idle_check_after_id = None
 
-        # Cancel filter polling
-        if self._filter_poll_after_id is not None:
+        # Cancel IPC file polling
+        if self._ipc_poll_after_id is not None:
             with contextlib.suppress(tk.TclError):
-                self._root.after_cancel(self._filter_poll_after_id)
-            self._filter_poll_after_id = None
+                self._root.after_cancel(self._ipc_poll_after_id)
+            self._ipc_poll_after_id = None
+
+        # Stop the IPC file watch
+        if self._file_observer is not None:
+            with contextlib.suppress(RuntimeError):
+                self._file_observer.stop()
+            self._file_observer = None
+
+        # Cancel cache warmup
+        if self._warmup_after_id is not None:
+            with contextlib.suppress(tk.TclError):
+                self._root.after_cancel(self._warmup_after_id)
+            self._warmup_after_id = None
+
+        # Cancel any in-progress close slide
+        if self._close_after_id is not None:
+            with contextlib.suppress(tk.TclError):
+                self._root.after_cancel(self._close_after_id)
+            self._close_after_id = None
 
         # Cancel any in-progress fade animation
         if self._fade_after_id is not None:
@@ -2711,12 +3110,10 @@ class AvatarWidget:
 
         # Clean up control state files
         if self.monitor_pid is not None:
-            tts_file = Path(tempfile.gettempdir()) / f'pyagentvox_tts_enabled_{self.monitor_pid}.txt'
-            stt_file = Path(tempfile.gettempdir()) / f'pyagentvox_stt_enabled_{self.monitor_pid}.txt'
-            with contextlib.suppress(OSError):
-                tts_file.unlink(missing_ok=True)
-            with contextlib.suppress(OSError):
-                stt_file.unlink(missing_ok=True)
+            for state_file in self._state_files.values():
+                with contextlib.suppress(OSError):
+                    state_file.unlink(missing_ok=True)
+            self._written_states.clear()
 
         # Save final position
         with contextlib.suppress(tk.TclError):
@@ -2741,11 +3138,14 @@ class AvatarWidget:
             self._root.after(0, self._fade_transition, avatar_name)
 
     def invalidate_variant_cache(self) -> None:
-        """Clear the variant cache, forcing re-discovery on next access.
+        """Clear the variant caches, forcing re-discovery on next access.
 
         Useful if images are added/removed at runtime.
         """
+        self._resolved_variants.clear()
         self._variant_cache.clear()
+        self._controls_file_index = None
+        self._index_registry()
         logger.debug('Variant cache invalidated')
 
 
@@ -2766,38 +3166,33 @@ def scan_avatar_directory(avatar_dir: Path) -> dict[str, list[str]]:
         Dictionary mapping emotion names to lists of image filenames.
     """
     emotions: dict[str, list[str]] = {}
-    supported_formats = {'.png', '.jpg', '.jpeg', '.webp'}
 
     if not avatar_dir.exists():
         logger.error(f'Avatar directory does not exist: {avatar_dir}')
         return emotions
 
-    # Scan for emotion subdirectories
-    for item in avatar_dir.iterdir():
-        if item.is_dir():
-            emotion_name = item.name
-            images = []
-            for img_path in item.iterdir():
-                if img_path.suffix.lower() in supported_formats:
-                    images.append(img_path.name)
-
-            if images:
-                emotions[emotion_name] = sorted(images)
-
-    # Scan for prefixed files in root directory
-    for img_path in avatar_dir.glob('*'):
-        if img_path.is_file() and img_path.suffix.lower() in supported_formats:
-            # Extract emotion name from filename (e.g., "excited-1.png" -> "excited")
-            name = img_path.stem
-            # Handle both "excited.png" and "excited-1.png" formats
-            if '-' in name:
-                emotion_name = name.split('-')[0]
-            else:
-                emotion_name = name
-
-            if emotion_name not in emotions:
-                emotions[emotion_name] = []
-            emotions[emotion_name].append(img_path.name)
+    # Single scandir pass: DirEntry type checks reuse the directory listing,
+    # and rejected files never become Path objects
+    with os.scandir(avatar_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                # Emotion subdirectory (e.g., excited/)
+                with os.scandir(entry.path) as sub_entries:
+                    images = [
+                        sub.name for sub in sub_entries
+                        if os.path.splitext(sub.name)[1].lower() in IMAGE_EXTENSION_SET
+                    ]
+                if images:
+                    emotions.setdefault(entry.name, []).extend(images)
+
+            elif not entry.name.startswith('.') and entry.is_file():
+                # Prefixed file in root directory (e.g., "excited-1.png" -> "excited")
+                stem, ext = os.path.splitext(entry.name)
+                if ext.lower() not in IMAGE_EXTENSION_SET:
+                    continue
+                # Handle both "excited.png" and "excited-1.png" formats
+                emotion_name = stem.split('-')[0]
+                emotions.setdefault(emotion_name, []).append(entry.name)
 
     # Sort and deduplicate
     for emotion in emotions:
@@ -2824,7 +3219,7 @@ def print_avatar_scan(avatar_dir: Path | None = None) -> None:
         return
 
     # Separate standard emotions from special ones
-    standard_emotions = set(EMOTION_AVATAR_MAP.values()) | {WAITING_STATE, 'bored', 'sleeping'}
+    standard_emotions = set(EMOTION_AVATAR_MAP.values()) | NON_SPEAKING_EMOTIONS
     special_emotions = {e for e in emotions if e not in standard_emotions}
 
     print(f'📊 Found {len(emotions)} emotion categories with {sum(len(imgs) for imgs in emotions.values())} total images\n')
@@ -18,12 +18,25 @@ Author:
 import contextlib
 import json
 import logging
+import os
 import re
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 __author__ = 'Jake Meador <jameador13@gmail.com>'
 __all__ = [
     'merge_dicts',
@@ -42,64 +55,161 @@ __all__ = [
 
 logger = logging.getLogger('pyagentvox')
 
+# Emotions with their own voice settings, in config/display order
+STANDARD_EMOTIONS: tuple[str, ...] = ('neutral', 'cheerful', 'excited', 'empathetic', 'warm', 'calm', 'focused')
+
+# Shorthand keys in --set/--modify strings that apply to every standard emotion
+_SHORTHAND_SET_KEYS = frozenset({'speed', 'pitch', 'voice'})
+_SHORTHAND_MODIFY_KEYS = frozenset({'speed', 'pitch'})
+
+# Built-in voice settings, used when no config file is found. Copy before mutating.
+DEFAULT_CONFIG: dict[str, dict[str, str]] = {
+    'neutral': {'voice': 'en-US-MichelleNeural', 'speed': '+10%', 'pitch': '+10Hz'},
+    'cheerful': {'voice': 'en-US-JennyNeural', 'speed': '+15%', 'pitch': '+8Hz'},
+    'excited': {'voice': 'en-US-JennyNeural', 'speed': '+20%', 'pitch': '+10Hz'},
+    'empathetic': {'voice': 'en-US-EmmaNeural', 'speed': '+5%', 'pitch': '+5Hz'},
+    'warm': {'voice': 'en-US-EmmaNeural', 'speed': '+8%', 'pitch': '+18Hz'},
+    'calm': {'voice': 'en-GB-SoniaNeural', 'speed': '+0%', 'pitch': '-2Hz'},
+    'focused': {'voice': 'en-GB-SoniaNeural', 'speed': '+5%', 'pitch': '+0Hz'},
+}
+
+# Voice shorthand (lowercase) -> full Edge TTS voice ID
+VOICE_MAP: dict[str, str] = {
+    'michelle': 'en-US-MichelleNeural',
+    'jenny': 'en-US-JennyNeural',
+    'emma': 'en-US-EmmaNeural',
+    'aria': 'en-US-AriaNeural',
+    'ava': 'en-US-AvaNeural',
+    'sonia': 'en-GB-SoniaNeural',
+    'libby': 'en-GB-LibbyNeural',
+    'maisie': 'en-GB-MaisieNeural',
+    'guy': 'en-US-GuyNeural',
+    'davis': 'en-US-DavisNeural',
+    'tony': 'en-US-TonyNeural',
+    'jason': 'en-US-JasonNeural',
+    'ryan': 'en-GB-RyanNeural',
+    'thomas': 'en-GB-ThomasNeural',
+}
+_FULL_VOICE_IDS = frozenset(VOICE_MAP.values())  # Already-resolved IDs pass straight through
+
+# Signed numeric value with an optional unit suffix (e.g., '+10%', '-2Hz')
+_SIGNED_VALUE_PATTERN = re.compile(r'([+-]?)(\d+(?:\.\d+)?)(.*)')
+
+# Config file names searched in the working directory, in priority order
+_CWD_CONFIG_NAMES: tuple[str, ...] = ('pyagentvox.json', 'pyagentvox.yaml')
+_PACKAGE_CONFIG = Path(__file__).parent / 'pyagentvox.yaml'
+
+# Config file extensions (lowercase) that select the parser without sniffing content
+_JSON_SUFFIXES = frozenset({'.json'})
+_YAML_SUFFIXES = frozenset({'.yaml', '.yml'})
+
+# Parsed config files keyed by path -> ((mtime_ns, size), parsed content)
+_PARSED_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+
 
 def merge_dicts(base: dict, override: dict) -> dict:
-    """Recursively merge two dictionaries."""
-    result = base.copy()
+    """Recursively merge two dictionaries without modifying either input.
 
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_dicts(result[key], value)
-        else:
-            result[key] = value
+    Walks nested levels with an explicit stack. Only the dicts on a merged
+    path are copied; untouched nested dicts are shared with ``base``.
+    """
+    result = base.copy()
+    stack = [(result, override)]
+
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                current = target[key] = current.copy()
+                stack.append((current, value))
+            else:
+                target[key] = value
 
     return result
 
 
+def _clone_config(value: Any) -> Any:
+    """Deep-copy parsed config data (dicts, lists, scalars).
+
+    Config data is plain JSON/YAML-shaped, so this skips copy.deepcopy's memo
+    and dispatch machinery and just rebuilds the containers.
+    """
+    if isinstance(value, dict):
+        return {key: _clone_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_config(item) for item in value]
+    return value
+
+
 def find_config_file(custom_path: Optional[str] = None) -> Optional[Path]:
     """Find config file in order: custom, CWD pyagentvox.{json,yaml}, package pyagentvox.yaml."""
     if custom_path:
-        path = Path(custom_path)
-        if not path.exists():
+        if not os.path.exists(custom_path):
             raise FileNotFoundError(f'Config file not found: {custom_path}')
-        return path
+        return Path(custom_path)
 
+    # JSON wins over YAML; direct probes match case exactly as the filesystem does
     cwd = Path.cwd()
-    if (json_config := cwd / 'pyagentvox.json').exists():
-        return json_config
-
-    if (yaml_config := cwd / 'pyagentvox.yaml').exists():
-        return yaml_config
+    for name in _CWD_CONFIG_NAMES:
+        if (candidate := cwd / name).is_file():
+            return candidate
 
-    script_dir = Path(__file__).parent
-    if (package_config := script_dir / 'pyagentvox.yaml').exists():
-        return package_config
+    if _PACKAGE_CONFIG.is_file():
+        return _PACKAGE_CONFIG
 
     return None
 
 
 def load_config_file(path: Path) -> dict:
-    """Load config file (JSON or YAML)."""
-    content = path.read_text(encoding='utf-8')
+    """Load config file (JSON or YAML), reusing the parse while the file is unchanged."""
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _PARSED_CACHE.get(str(path))
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, _parse_config_content(path, path.read_text(encoding='utf-8')))
+        _PARSED_CACHE[str(path)] = cached
+
+    # Callers merge into the result, so never hand out the cached object itself
+    return _clone_config(cached[1])
+
 
-    if path.suffix in ['.json', '.JSON']:
-        return json.loads(content)
+def _json_loads(content: str) -> Any:
+    """Parse JSON with orjson when installed, else the stdlib parser."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
 
-    if path.suffix in ['.yaml', '.yml', '.YAML', '.YML']:
-        return yaml.safe_load(content)
+
+def _parse_config_content(path: Path, content: str) -> Any:
+    """Parse config file content as JSON or YAML based on the file extension."""
+    suffix = path.suffix.lower()
+    if suffix in _JSON_SUFFIXES:
+        return _json_loads(content)
+
+    if suffix in _YAML_SUFFIXES:
+        return yaml.load(content, Loader=_YamlLoader)
+
+    # Unknown extension: content that opens like JSON skips the slower YAML parser
+    if content.lstrip()[:1] in ('{', '['):
+        with contextlib.suppress(ValueError):
+            return _json_loads(content)
 
     try:
-        return yaml.safe_load(content)
+        return yaml.load(content, Loader=_YamlLoader)
     except yaml.YAMLError:
-        return json.loads(content)
+        return _json_loads(content)
 
 
 def save_config_file(path: Path, config: dict) -> None:
     """Save config file (JSON or YAML)."""
-    if path.suffix in ['.json', '.JSON']:
-        content = json.dumps(config, indent=2)
+    if path.suffix.lower() in _JSON_SUFFIXES:
+        if orjson is not None:
+            content = orjson.dumps(config, option=orjson.OPT_INDENT_2).decode('utf-8')
+        else:
+            content = json.dumps(config, indent=2)
     else:
-        content = yaml.dump(config, default_flow_style=False, sort_keys=False)
+        content = yaml.dump(config, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
 
     path.write_text(content, encoding='utf-8')
 
@@ -111,15 +221,8 @@ def load_config(
     save_overrides: bool = False
 ) -> tuple[dict, Optional[Path]]:
     """Load configuration with optional profile and overrides."""
-    default_config = {
-        'neutral': {'voice': 'en-US-MichelleNeural', 'speed': '+10%', 'pitch': '+10Hz'},
-        'cheerful': {'voice': 'en-US-JennyNeural', 'speed': '+15%', 'pitch': '+8Hz'},
-        'excited': {'voice': 'en-US-JennyNeural', 'speed': '+20%', 'pitch': '+10Hz'},
-        'empathetic': {'voice': 'en-US-EmmaNeural', 'speed': '+5%', 'pitch': '+5Hz'},
-        'warm': {'voice': 'en-US-EmmaNeural', 'speed': '+8%', 'pitch': '+18Hz'},
-        'calm': {'voice': 'en-GB-SoniaNeural', 'speed': '+0%', 'pitch': '-2Hz'},
-        'focused': {'voice': 'en-GB-SoniaNeural', 'speed': '+5%', 'pitch': '+0Hz'},
-    }
+    # Nested default dicts end up in the result, so work on a private copy
+    default_config = _clone_config(DEFAULT_CONFIG)
 
     config_file = find_config_file(config_path)
 
@@ -181,29 +284,26 @@ def apply_key_path(config: dict, key_path: str, value: Any) -> dict:
 def parse_set_string(set_string: str) -> dict[str, Any]:
     """Parse space-separated key=value pairs with shorthand support."""
     overrides = {}
-    pairs = set_string.split()
 
-    for pair in pairs:
-        if '=' not in pair:
+    for pair in set_string.split():
+        key_path, sep, value = pair.partition('=')
+        if not sep:
             continue
 
-        key_path, value = pair.split('=', 1)
-
         with contextlib.suppress(json.JSONDecodeError, ValueError):
             value = json.loads(value)
 
-        if key_path in ['speed', 'pitch', 'voice']:
-            standard_emotions = ['neutral', 'cheerful', 'excited', 'empathetic', 'warm', 'calm', 'focused']
-            for emotion in standard_emotions:
-                if emotion not in overrides:
-                    overrides[emotion] = {}
+        if key_path in _SHORTHAND_SET_KEYS:
+            # Resolve the shorthand value once, then fan it out to every emotion
+            if key_path == 'voice':
+                value = resolve_voice_name(value)
+            else:
+                value = normalize_value(key_path, value)
 
-                if key_path == 'voice':
-                    overrides[emotion]['voice'] = resolve_voice_name(value)
-                else:
-                    overrides[emotion][key_path] = normalize_value(key_path, value)
+            for emotion in STANDARD_EMOTIONS:
+                overrides.setdefault(emotion, {})[key_path] = value
         else:
-            overrides = apply_key_path(overrides, key_path, value)
+            apply_key_path(overrides, key_path, value)
 
     return overrides
 
@@ -233,43 +333,50 @@ def normalize_value(key: str, value: Any) -> str:
 
 def resolve_voice_name(voice: str) -> str:
     """Resolve voice shorthand to full voice ID."""
-    voice_map = {
-        'michelle': 'en-US-MichelleNeural',
-        'jenny': 'en-US-JennyNeural',
-        'emma': 'en-US-EmmaNeural',
-        'aria': 'en-US-AriaNeural',
-        'ava': 'en-US-AvaNeural',
-        'sonia': 'en-GB-SoniaNeural',
-        'libby': 'en-GB-LibbyNeural',
-        'maisie': 'en-GB-MaisieNeural',
-        'guy': 'en-US-GuyNeural',
-        'davis': 'en-US-DavisNeural',
-        'tony': 'en-US-TonyNeural',
-        'jason': 'en-US-JasonNeural',
-        'ryan': 'en-GB-RyanNeural',
-        'thomas': 'en-GB-ThomasNeural',
-    }
-    return voice_map.get(voice.lower(), voice)
+    if voice in _FULL_VOICE_IDS:
+        return voice
+    return VOICE_MAP.get(voice.lower(), voice)
+
+
+def _parse_signed_value(value: str) -> Optional[tuple[float, str]]:
+    """Split a signed value like '+10%' or '-2.5Hz' into (number, unit).
+
+    Integer values are split with plain string ops; only decimals go through
+    the regex.
+
+    Returns:
+        Tuple of (signed number, unit suffix), or None if value isn't numeric.
+    """
+    sign = value[:1]
+    body = value[1:] if sign in ('+', '-') else value
+    unit = body.lstrip('0123456789')
+    digits = body[:len(body) - len(unit)]
+    if digits and not unit.startswith('.'):
+        number = int(digits)
+        return (-number if sign == '-' else number), unit
+
+    match = _SIGNED_VALUE_PATTERN.match(value)
+    if not match:
+        return None
+    sign, number, unit = match.groups()
+    return float(number) * (-1 if sign == '-' else 1), unit
 
 
 def modify_value(current: str, modifier: Any) -> str:
     """Modify config value by adding modifier."""
-    match = re.match(r'([+-]?)(\d+(?:\.\d+)?)(.*)', str(current))
-    if not match:
+    parsed = _parse_signed_value(str(current))
+    if parsed is None:
         return str(current)
 
-    sign, number, unit = match.groups()
-    current_num = float(number) * (-1 if sign == '-' else 1)
+    current_num, unit = parsed
 
     if isinstance(modifier, str):
-        if mod_match := re.match(r'([+-]?)(\d+(?:\.\d+)?)', modifier):
-            mod_sign, mod_number = mod_match.groups()
-            modifier = float(mod_number) * (-1 if mod_sign == '-' else 1)
-    else:
+        if (mod_parsed := _parse_signed_value(modifier)) is not None:
+            modifier = mod_parsed[0]
+    elif not isinstance(modifier, int):
         modifier = float(modifier)
 
-    result = current_num + modifier
-    return f'+{int(result)}{unit}' if result >= 0 else f'{int(result)}{unit}'
+    return f'{int(current_num + modifier):+d}{unit}'
 
 
 def parse_modify_string(set_string: str, config: dict) -> dict[str, Any]:
@@ -286,10 +393,8 @@ def parse_modify_string(set_string: str, config: dict) -> dict[str, Any]:
         with contextlib.suppress(json.JSONDecodeError, ValueError):
             modifier = json.loads(modifier)
 
-        if key_path in ['speed', 'pitch']:
-            standard_emotions = ['neutral', 'cheerful', 'excited', 'empathetic', 'warm', 'calm', 'focused']
-
-            for emotion in standard_emotions:
+        if key_path in _SHORTHAND_MODIFY_KEYS:
+            for emotion in STANDARD_EMOTIONS:
                 if emotion in config and key_path in config[emotion]:
                     if emotion not in overrides:
                         overrides[emotion] = {}
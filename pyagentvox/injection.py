@@ -32,7 +32,7 @@ import sys
 import time
 import traceback
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
 
 __author__ = 'Jake Meador <jameador13@gmail.com>'
 __all__ = ['VoiceInjector', 'main']
@@ -40,9 +40,12 @@ __all__ = ['VoiceInjector', 'main']
 logger = logging.getLogger('pyagentvox.voice_injector')
 
 if sys.platform == 'win32':
+    import msvcrt
     import win32gui
     import win32api
     import win32con
+    import win32event
+    import win32file
 else:
     raise NotImplementedError(f'Platform {sys.platform} not supported. Voice injector requires Windows.')
 
@@ -50,21 +53,44 @@ else:
 class VoiceInjector:
     """Monitors voice output and injects into Claude Code."""
 
-    def __init__(self, output_file: Path, window_title: Optional[str] = None, use_foreground: bool = False):
+    __slots__ = (
+        'output_file',
+        '_output_path',
+        'window_title',
+        'use_foreground',
+        'char_delay',
+        'last_position',
+        'last_content',
+        'hwnd',
+        'parent_pid',
+        '_output_fh',
+    )
+
+    def __init__(
+        self,
+        output_file: Path,
+        window_title: Optional[str] = None,
+        use_foreground: bool = False,
+        char_delay: float = 0.0,
+    ):
         """Initialize voice injector.
 
         Args:
             output_file: Path to PyAgentVox output file to monitor
             window_title: Title of Claude Code window (default: None = auto-detect foreground)
             use_foreground: If True, use currently focused window as target
+            char_delay: Seconds to sleep between characters (default: 0 = post back to back)
         """
         self.output_file = Path(output_file)
+        self._output_path = os.fspath(self.output_file)  # Plain str for per-poll os.stat/open
         self.window_title = window_title
         self.use_foreground = use_foreground
+        self.char_delay = char_delay
         self.last_position = 0
-        self.last_content = ''
+        self.last_content = ''  # Last speech sent, to drop repeats
         self.hwnd: Optional[int] = None
         self.parent_pid = os.getppid()
+        self._output_fh: Optional[TextIO] = None  # Opened on first read, kept across polls
 
         if not self.output_file.exists():
             raise FileNotFoundError(f'Output file not found: {output_file}')
@@ -82,15 +108,28 @@ class VoiceInjector:
             logger.info(f'   Target: Window matching \'{self.window_title}\'')
 
     def find_window(self) -> Optional[int]:
-        """Find Claude Code window handle."""
+        """Find Claude Code window handle.
+
+        Stops enumerating at the first visible window whose title matches.
+        """
+        if self.window_title is None:
+            return None
+
+        wanted = self.window_title.lower()
+
         def callback(hwnd, windows):
-            if win32gui.IsWindowVisible(hwnd):
-                title = win32gui.GetWindowText(hwnd)
-                if self.window_title.lower() in title.lower():
-                    windows.append(hwnd)
+            if win32gui.IsWindowVisible(hwnd) and wanted in win32gui.GetWindowText(hwnd).lower():
+                windows.append(hwnd)
+                return False  # Stop EnumWindows
+            return True
 
         windows = []
-        win32gui.EnumWindows(callback, windows)
+        try:
+            win32gui.EnumWindows(callback, windows)
+        except win32gui.error:
+            # pywin32 reports a callback-stopped enumeration as an error
+            if not windows:
+                raise
 
         if windows:
             self.hwnd = windows[0]
@@ -111,19 +150,27 @@ class VoiceInjector:
         Returns:
             True if successful, False otherwise
         """
-        if not self.hwnd:
+        # Reuse the cached handle while it is alive; only re-enumerate windows when it dies
+        if not self.hwnd or not win32gui.IsWindow(self.hwnd):
             self.hwnd = self.find_window()
             if not self.hwnd:
                 logger.warning('Claude Code window not found!')
                 return False
 
         try:
-            # Send each character as WM_CHAR message directly to the window
+            # Send each character as WM_CHAR message directly to the window.
+            # PostMessage queues in order, so no per-character sleep is needed
+            # unless a target drops input (see --char-delay).
+            hwnd = self.hwnd
+            post = win32api.PostMessage
+            wm_char = win32con.WM_CHAR
+            char_delay = self.char_delay
             for char in text:
-                win32api.PostMessage(self.hwnd, win32con.WM_CHAR, ord(char), 0)
-                time.sleep(0.01)  # Small delay for reliability
+                post(hwnd, wm_char, ord(char), 0)
+                if char_delay:
+                    time.sleep(char_delay)
 
-            time.sleep(0.05)
+            time.sleep(0.05)  # Let the text settle before Enter
 
             # Send Enter key using WM_KEYDOWN/WM_KEYUP
             win32api.PostMessage(self.hwnd, win32con.WM_KEYDOWN, win32con.VK_RETURN, 0)
@@ -142,6 +189,26 @@ class VoiceInjector:
             logger.debug(traceback.format_exc())
             return False
 
+    @staticmethod
+    def _speech_from_line(line: str) -> str:
+        """Extract speech text from one timestamped output line.
+
+        Session banners ('===...', 'Voice session started: ...') never start
+        with '[', so they fall through with everything else that isn't speech.
+
+        Args:
+            line: Single line from the output file
+
+        Returns:
+            Speech text, or an empty string if the line holds none
+        """
+        line = line.lstrip()
+        if not line.startswith('['):
+            return ''
+
+        _, sep, text = line.partition(']')
+        return text.strip() if sep else ''
+
     @staticmethod
     def extract_speech_text(content: str) -> str:
         """Extract speech text from timestamped format.
@@ -152,19 +219,7 @@ class VoiceInjector:
         Returns:
             Extracted speech text
         """
-        lines = content.strip().split('\n')
-        texts = []
-
-        for line in lines:
-            if '===' in line or 'Voice session started' in line:
-                continue
-
-            if ']' in line and line.strip().startswith('['):
-                text = line.split(']', 1)[1].strip()
-                if text:
-                    texts.append(text)
-
-        return ' '.join(texts)
+        return ' '.join(filter(None, map(VoiceInjector._speech_from_line, content.splitlines())))
 
     def check_for_new_speech(self) -> Optional[str]:
         """Check for new speech in output file.
@@ -173,25 +228,35 @@ class VoiceInjector:
             New speech text if found, None otherwise
         """
         try:
-            # Check if file still exists
-            if not self.output_file.exists():
+            # One stat answers both "still exists?" and "grown?". A delete-pending
+            # file (our handle allows deletes) can stat as access denied, not missing.
+            try:
+                current_size = os.stat(self._output_path).st_size
+            except OSError:
                 logger.error(f'Output file was deleted: {self.output_file}')
                 logger.error('Voice injector cannot continue without the output file.')
                 return 'EXIT'  # Special signal to stop
 
-            current_size = self.output_file.stat().st_size
+            if current_size < self.last_position:
+                # Truncated or replaced: start over on a fresh handle
+                logger.debug('Output file shrank, reading from the start')
+                self.close()
+                self.last_position = 0
             if current_size <= self.last_position:
                 return None
 
-            with open(self.output_file, 'r', encoding='utf-8') as f:
+            # Parse line by line from the last offset instead of reading the whole delta
+            if self._output_fh is None:
+                self._output_fh = self._open_output()
+            f = self._output_fh
+            try:
                 f.seek(self.last_position)
-                new_content = f.read()
+                speech_text = ' '.join(filter(None, map(self._speech_from_line, f)))
                 self.last_position = f.tell()
+            except (OSError, ValueError):
+                self.close()  # Reopen on the next poll
+                raise
 
-            if not new_content.strip():
-                return None
-
-            speech_text = self.extract_speech_text(new_content)
             if not speech_text or speech_text == self.last_content:
                 return None
 
@@ -203,23 +268,106 @@ class VoiceInjector:
             logger.debug(traceback.format_exc())
             return None
 
+    def _open_output(self) -> TextIO:
+        """Open the output file for reading without blocking its deletion.
+
+        Python's open() omits FILE_SHARE_DELETE on Windows, so a handle kept
+        open across polls would stop PyAgentVox from removing the file at
+        shutdown. CreateFile with full sharing avoids that.
+
+        Returns:
+            Text-mode file object positioned at the start of the file
+        """
+        handle = win32file.CreateFile(
+            self._output_path,
+            win32file.GENERIC_READ,
+            win32file.FILE_SHARE_READ | win32file.FILE_SHARE_WRITE | win32file.FILE_SHARE_DELETE,
+            None,
+            win32file.OPEN_EXISTING,
+            0,
+            None,
+        )
+        fd = msvcrt.open_osfhandle(handle.Detach(), os.O_RDONLY)
+        return open(fd, 'r', encoding='utf-8')
+
+    def close(self) -> None:
+        """Close the cached output file handle, if open."""
+        if self._output_fh is not None:
+            with contextlib.suppress(OSError):
+                self._output_fh.close()
+            self._output_fh = None
+
+    def _open_change_watch(self) -> Optional[int]:
+        """Open a directory change notification for the output file's folder.
+
+        Returns:
+            Change notification handle, or None if it could not be created
+        """
+        try:
+            return win32file.FindFirstChangeNotification(
+                str(self.output_file.parent),
+                False,
+                win32con.FILE_NOTIFY_CHANGE_LAST_WRITE | win32con.FILE_NOTIFY_CHANGE_SIZE,
+            )
+        except Exception as e:
+            logger.warning(f'Change notification unavailable, polling instead: {e}')
+            return None
+
+    @staticmethod
+    def _wait_for_change(watch: Optional[int], timeout: float) -> None:
+        """Block until the watched folder changes or the timeout elapses.
+
+        The timeout keeps Ctrl+C responsive and still lets the loop notice a
+        deleted output file. Without a watch handle this is a plain sleep.
+
+        Args:
+            watch: Change notification handle from _open_change_watch, or None
+            timeout: Maximum time to wait (seconds)
+        """
+        if watch is None:
+            time.sleep(timeout)
+            return
+
+        if win32event.WaitForSingleObject(watch, int(timeout * 1000)) == win32event.WAIT_OBJECT_0:
+            # Re-arm before reading so writes during processing signal the next wait
+            win32file.FindNextChangeNotification(watch)
+
     def run(self, poll_interval: float = 0.5):
         """Run the voice injector loop.
 
+        Sleeps on a directory change notification between checks, waking
+        early when the output file is written.
+
         Args:
-            poll_interval: How often to check for new speech (seconds)
+            poll_interval: Maximum time between checks for new speech (seconds)
         """
         logger.info('\n[MIC] Voice Injector running!')
         logger.info(f'   Poll interval: {poll_interval}s')
         logger.info('   Say \'stop listening\' to stop PyAgentVox')
         logger.info('   Press Ctrl+C to stop\n')
 
+        watch = self._open_change_watch()
+        try:
+            self._run_loop(watch, poll_interval)
+        finally:
+            if watch is not None:
+                with contextlib.suppress(Exception):
+                    win32file.FindCloseChangeNotification(watch)
+            self.close()
+
+    def _run_loop(self, watch: Optional[int], poll_interval: float) -> None:
+        """Check for speech and inject it until stopped.
+
+        Args:
+            watch: Change notification handle, or None to poll
+            poll_interval: Maximum time between checks for new speech (seconds)
+        """
         with contextlib.suppress(KeyboardInterrupt):
             while True:
                 speech_text = self.check_for_new_speech()
 
                 if not speech_text:
-                    time.sleep(poll_interval)
+                    self._wait_for_change(watch, poll_interval)
                     continue
 
                 # Check for file deletion signal
@@ -247,7 +395,7 @@ class VoiceInjector:
                 else:
                     logger.warning('Failed to send')
 
-                time.sleep(poll_interval)
+                self._wait_for_change(watch, poll_interval)
 
         logger.info('\n\n[BYE] Voice Injector stopped!')
 
@@ -255,7 +403,6 @@ class VoiceInjector:
 def main() -> None:
     """Entry point for voice injector."""
     import argparse
-    import glob
     import tempfile
 
     parser = argparse.ArgumentParser(description='Voice input injector for Claude Code')
@@ -264,6 +411,7 @@ def main() -> None:
     parser.add_argument('--use-foreground', action='store_true', help='Use currently focused window as target (ignores --window-title)')
     parser.add_argument('--interval', type=float, default=0.5, help='Poll interval in seconds (default: 0.5)')
     parser.add_argument('--startup-delay', type=int, default=0, help='Seconds to wait before capturing foreground window (default: 0)')
+    parser.add_argument('--char-delay', type=float, default=0.0, help='Seconds to wait between typed characters (default: 0)')
 
     args = parser.parse_args()
 
@@ -271,15 +419,24 @@ def main() -> None:
 
     # Get output file
     if not args.output_file:
-        pattern = str(Path(tempfile.gettempdir()) / 'agent_output_*.txt')
-        files = sorted(glob.glob(pattern), key=lambda x: Path(x).stat().st_mtime, reverse=True)
-
-        if not files:
+        # Newest agent_output_*.txt in one directory pass (DirEntry caches stat on Windows)
+        newest_path = None
+        newest_mtime = -1.0
+        with os.scandir(tempfile.gettempdir()) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('agent_output_') and name.endswith('.txt'):
+                    with contextlib.suppress(OSError):
+                        mtime = entry.stat().st_mtime
+                        if mtime > newest_mtime:
+                            newest_mtime, newest_path = mtime, entry.path
+
+        if newest_path is None:
             raise FileNotFoundError(
                 'No PyAgentVox output files found. Make sure PyAgentVox is running first.'
             )
 
-        output_file = Path(files[0])
+        output_file = Path(newest_path)
         logger.info(f'[FILE] Auto-detected: {output_file}')
     else:
         output_file = Path(args.output_file)
@@ -293,7 +450,7 @@ def main() -> None:
         logger.info('  Capturing foreground window!\n')
 
     # Let exceptions propagate - caller can handle them
-    injector = VoiceInjector(output_file, args.window_title, args.use_foreground)
+    injector = VoiceInjector(output_file, args.window_title, args.use_foreground, args.char_delay)
     injector.run(args.interval)
 
 
@@ -15,12 +15,19 @@ Author:
     Jake Meador <jameador13@gmail.com>
 """
 
-import json
+import contextlib
 import logging
-import re
+import os
+import shutil
+import stat
 from pathlib import Path
 from typing import Optional
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 __author__ = 'Jake Meador <jameador13@gmail.com>'
 __all__ = [
     'find_instructions_file',
@@ -33,18 +40,16 @@ logger = logging.getLogger('pyagentvox')
 VOICE_SECTION_MARKER_START = '<!-- PYAGENTVOX_START -->'
 VOICE_SECTION_MARKER_END = '<!-- PYAGENTVOX_END -->'
 
+_PROBE_CHUNK_SIZE = 64 * 1024  # Bytes read per step when probing for the start marker
 
-def _generate_voice_instructions(config: Optional[dict] = None, profile_name: Optional[str] = None) -> str:
-    """Generate voice instructions dynamically based on config and profile.
+# Instructions files already located, keyed by (cwd, home, filename)
+_FOUND_INSTRUCTIONS: dict[tuple[str, str, str], str] = {}
 
-    Args:
-        config: Configuration dictionary (optional)
-        profile_name: Active profile name (optional)
+# Last content read or written per instructions file, keyed by str(path)
+_CONTENT_CACHE: dict[str, tuple[tuple[int, int], str]] = {}
 
-    Returns:
-        Formatted voice instructions string with profile description if available
-    """
-    base_instructions = '''<!-- PYAGENTVOX_START -->
+# Static body of the voice block; the profile section and end marker are appended per call
+_BASE_INSTRUCTIONS = '''<!-- PYAGENTVOX_START -->
 # Voice Output Active 🎤
 
 Your responses are **spoken aloud** and displayed as an animated avatar. Control voice with emotion tags anywhere in your message:
@@ -108,6 +113,32 @@ python -m pyagentvox.avatar_tags filter --pid <PID> --reset
 - `/avatar-tags filter --reset` - Clear all filters
 - `/avatar-tags current` - Show current filter state'''
 
+_END_MARKER = '\n' + VOICE_SECTION_MARKER_END
+
+
+def _generate_voice_instructions(config: Optional[dict] = None, profile_name: Optional[str] = None) -> str:
+    """Generate voice instructions dynamically based on config and profile.
+
+    Args:
+        config: Configuration dictionary (optional)
+        profile_name: Active profile name (optional)
+
+    Returns:
+        Formatted voice instructions string with profile description if available
+    """
+    return _BASE_INSTRUCTIONS + _generate_profile_section(config, profile_name)
+
+
+def _generate_profile_section(config: Optional[dict], profile_name: Optional[str]) -> str:
+    """Generate the profile-dependent tail of the voice block, end marker included.
+
+    Args:
+        config: Configuration dictionary (optional)
+        profile_name: Active profile name (optional)
+
+    Returns:
+        Text that follows _BASE_INSTRUCTIONS in a generated voice block
+    """
     # Add profile information if available
     profile_info = None
     if config:
@@ -120,67 +151,258 @@ python -m pyagentvox.avatar_tags filter --pid <PID> --reset
         elif 'description' in config and not profile_name:
             profile_info = f"**Current Profile:** Default - {config['description']}"
 
+    # Assemble the profile section
+    parts = []
+    if profile_info:
+        parts.append('\n\n' + profile_info)
+
     # Add profile switching instructions
-    switch_instructions = '\n\n**Switch Profiles:** Use the `/voice-switch` skill to change voice profiles during conversations.'
+    parts.append('\n\n**Switch Profiles:** Use the `/voice-switch` skill to change voice profiles during conversations.')
 
     # Add available profiles list if config has profiles
     if config and 'profiles' in config:
-        profiles_list = '\n\n**Available Profiles:**'
+        parts.append('\n\n**Available Profiles:**')
         # Add default profile
         if 'description' in config:
-            profiles_list += f"\n- `default` - {config['description']}"
+            parts.append(f"\n- `default` - {config['description']}")
         # Add named profiles
         for name, profile_config in config.get('profiles', {}).items():
             if isinstance(profile_config, dict) and 'description' in profile_config:
-                profiles_list += f"\n- `{name}` - {profile_config['description']}"
-        switch_instructions += profiles_list
+                parts.append(f"\n- `{name}` - {profile_config['description']}")
 
-    # Assemble final instructions
-    instructions = base_instructions
-    if profile_info:
-        instructions += '\n\n' + profile_info
-    instructions += switch_instructions
-    instructions += '\n<!-- PYAGENTVOX_END -->'
+    parts.append(_END_MARKER)
+    return ''.join(parts)
+
+
+def _replace_voice_blocks(content: str, replacement: str) -> str:
+    """Replace every marker-bounded voice block (markers included).
+
+    Both markers are fixed strings, so blocks are located with str.find and
+    spliced out rather than matched with a regex.
 
-    return instructions
+    Args:
+        content: Instructions file content
+        replacement: Text to put in place of each block
+
+    Returns:
+        Content with blocks replaced, unchanged if no complete block exists
+    """
+    parts = []
+    pos = 0
+    while (start := content.find(VOICE_SECTION_MARKER_START, pos)) != -1:
+        end = content.find(VOICE_SECTION_MARKER_END, start + len(VOICE_SECTION_MARKER_START))
+        if end == -1:
+            break
+        parts.append(content[pos:start])
+        parts.append(replacement)
+        pos = end + len(VOICE_SECTION_MARKER_END)
+
+    if not parts:
+        return content
+
+    parts.append(content[pos:])
+    return ''.join(parts)
+
+
+def _remove_voice_blocks(content: str) -> str:
+    """Remove every marker-bounded voice block and the blank lines around it.
+
+    Only the newlines touching each block are trimmed; the surrounding text
+    is rejoined with a single blank line, so blank runs elsewhere in the file
+    are left alone.
+
+    Args:
+        content: Instructions file content
+
+    Returns:
+        Content without voice blocks and with one trailing newline, or the
+        content unchanged if no complete block exists
+    """
+    parts = []
+    pos = 0
+    while (start := content.find(VOICE_SECTION_MARKER_START, pos)) != -1:
+        end = content.find(VOICE_SECTION_MARKER_END, start + len(VOICE_SECTION_MARKER_START))
+        if end == -1:
+            break
+        left = start
+        while left > pos and content[left - 1] == '\n':
+            left -= 1
+        parts.append(content[pos:left])
+        pos = end + len(VOICE_SECTION_MARKER_END)
+        while pos < len(content) and content[pos] == '\n':
+            pos += 1
+
+    if not parts:
+        return content
+
+    parts.append(content[pos:])
+    return '\n\n'.join(part for part in parts if part).rstrip() + '\n'
+
+
+def _read_original_path(sessions_index: str) -> Optional[str]:
+    """Read the top-level ``originalPath`` from a Claude sessions index.
+
+    The index can grow large, so with ijson installed the key is streamed and
+    parsing stops once it is found; otherwise the whole file is loaded.
+
+    Args:
+        sessions_index: Path to sessions-index.json
+
+    Returns:
+        Original project path, or None if the key is missing
+    """
+    with open(sessions_index, 'rb') as f:
+        if ijson is not None:
+            return next(ijson.items(f, 'originalPath'), None)
+        import json  # Only needed on this fallback, so kept off the module import
+        return json.load(f).get('originalPath')
+
+
+def _read_if_contains(path: Path, marker: str) -> Optional[str]:
+    """Read a UTF-8 text file only if it contains a marker.
+
+    Scans raw bytes in chunks and stops scanning at the first hit, then reads
+    the rest. Files without the marker are never decoded.
+
+    Args:
+        path: File to read
+        marker: Text to look for
+
+    Returns:
+        Full file content with universal newlines, or None if marker is absent
+    """
+    needle = marker.encode('utf-8')
+    data = bytearray()
+    with open(path, 'rb') as f:
+        while chunk := f.read(_PROBE_CHUNK_SIZE):
+            search_from = max(len(data) - len(needle) + 1, 0)  # Catch a marker split across chunks
+            data += chunk
+            if data.find(needle, search_from) != -1:
+                data += f.read()
+                return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    return None
+
+
+def _read_cached(path: Path) -> str:
+    """Read an instructions file, reusing the last content while it is unchanged.
+
+    Args:
+        path: File to read
+
+    Returns:
+        File content with universal newlines
+    """
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CONTENT_CACHE.get(str(path))
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, path.read_text(encoding='utf-8'))
+        _CONTENT_CACHE[str(path)] = cached
+    return cached[1]
+
+
+def _write_cached(path: Path, content: str) -> None:
+    """Atomically write an instructions file and remember its content.
+
+    The content goes to a temp file beside the real target (symlinks such as
+    ``CLAUDE.md -> AGENTS.md`` are resolved, so the link survives) which takes
+    the original's permissions and is moved into place with ``os.replace``, so
+    an agent re-reading the file never sees a partial write. If the target is
+    held open without delete sharing (Windows editors), it is written in place.
+
+    Args:
+        path: File to write
+        content: New file content
+    """
+    target = os.path.realpath(path)
+    tmp_path = target + '.pyav.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        with contextlib.suppress(OSError):
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except OSError as e:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        if not isinstance(e, PermissionError):
+            raise
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(content)
+    st = path.stat()
+    _CONTENT_CACHE[str(path)] = ((st.st_mtime_ns, st.st_size), content)
 
 
 def find_instructions_file(filename: str = 'CLAUDE.md') -> Optional[Path]:
     """Find instructions file via current dir, parent, or sessions-index.json.
 
+    A previous hit for the same cwd, home, and filename is reused while the
+    file still exists, so repeated inject/remove calls skip the project scan.
+
     Args:
         filename: Name of instructions file (default: CLAUDE.md)
     """
-    cwd = Path.cwd()
-    if (file := cwd / filename).exists():
-        return file
+    key = (os.getcwd(), os.path.expanduser('~'), filename)
+    cached = _FOUND_INSTRUCTIONS.get(key)
+    if cached is not None and os.path.exists(cached):
+        return Path(cached)
+
+    found = _search_instructions_file(*key)
+    if found is None:
+        _FOUND_INSTRUCTIONS.pop(key, None)
+        return None
+    _FOUND_INSTRUCTIONS[key] = found
+    return Path(found)
+
+
+def _search_instructions_file(cwd: str, home: str, filename: str) -> Optional[str]:
+    """Search cwd, its parent, then the most recent Claude project for the file.
 
-    if (parent_file := cwd.parent / filename).exists():
+    Works on plain str paths; the caller wraps the result in a Path.
+
+    Args:
+        cwd: Current working directory
+        home: User home directory
+        filename: Name of instructions file
+    """
+    # Direct probes: one stat each, and case-insensitive wherever the filesystem is
+    if os.path.isfile(cwd_file := os.path.join(cwd, filename)):
+        return cwd_file
+
+    if os.path.isfile(parent_file := os.path.join(os.path.dirname(cwd), filename)):
         return parent_file
 
-    home = Path.home()
-    projects_dir = home / '.claude' / 'projects'
-    if not projects_dir.exists():
+    projects_dir = os.path.join(home, '.claude', 'projects')
+    if not os.path.exists(projects_dir):
         return None
 
-    project_dirs = [d for d in projects_dir.iterdir() if d.is_dir()]
-    if not project_dirs:
+    # Most recently modified project directory, in one scandir pass with a
+    # single stat per entry answering both the type and the mtime
+    recent = None
+    recent_mtime = -1.0
+    with os.scandir(projects_dir) as entries:
+        for entry in entries:
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            if stat.S_ISDIR(st.st_mode) and st.st_mtime > recent_mtime:
+                recent_mtime, recent = st.st_mtime, entry.path
+
+    if recent is None:
         return None
 
-    recent = max(project_dirs, key=lambda p: p.stat().st_mtime)
-    sessions_index = recent / 'sessions-index.json'
+    sessions_index = os.path.join(recent, 'sessions-index.json')
 
-    if sessions_index.exists():
+    if os.path.exists(sessions_index):
         try:
-            with open(sessions_index, encoding='utf-8') as f:
-                data = json.load(f)
-                if original_path := data.get('originalPath'):
-                    if (file := Path(original_path) / filename).exists():
-                        return file
+            if original_path := _read_original_path(sessions_index):
+                if os.path.exists(file := os.path.join(original_path, filename)):
+                    return file
         except Exception as e:
             logger.warning(f'Could not read sessions-index.json: {e}')
 
-    if (project_file := recent / filename).exists():
+    if os.path.exists(project_file := os.path.join(recent, filename)):
         return project_file
 
     return None
@@ -201,6 +423,7 @@ def inject_voice_instructions(
     Returns:
         Tuple of (success: bool, message_to_agent: Optional[str])
         If successful, returns a message that should be sent to the agent to refresh the file.
+        The message is None when the file already held identical instructions.
     """
     if not instructions_path:
         instructions_path = find_instructions_file()
@@ -210,25 +433,41 @@ def inject_voice_instructions(
         return False, None
 
     try:
-        content = instructions_path.read_text(encoding='utf-8')
+        content = _read_cached(instructions_path)
     except Exception as e:
         logger.error(f'Error reading instructions file: {e}')
         return False, None
 
-    # Generate instructions dynamically
-    voice_instructions = _generate_voice_instructions(config, profile_name)
+    # Only the profile section varies between runs; the static body is
+    # compared in place so an up-to-date file never builds the full block
+    profile_section = _generate_profile_section(config, profile_name)
 
     # If instructions already exist, update them instead of duplicating
-    if VOICE_SECTION_MARKER_START in content:
+    start = content.find(VOICE_SECTION_MARKER_START)
+    if start != -1:
+        # Leave the file (and its mtime) alone when the block is already current
+        end = content.find(VOICE_SECTION_MARKER_END, start)
+        section_start = start + len(_BASE_INSTRUCTIONS)
+        if (
+            end != -1
+            and content.startswith(_BASE_INSTRUCTIONS, start)
+            and content[section_start:end + len(VOICE_SECTION_MARKER_END)] == profile_section
+        ):
+            logger.debug('Voice instructions already up to date')
+            return True, None
+
         logger.debug('Updating existing voice instructions')
-        pattern = rf'{re.escape(VOICE_SECTION_MARKER_START)}.*?{re.escape(VOICE_SECTION_MARKER_END)}'
-        new_content = re.sub(pattern, voice_instructions, content, flags=re.DOTALL)
+        new_content = _replace_voice_blocks(content, _BASE_INSTRUCTIONS + profile_section)
     else:
         logger.debug('Injecting new voice instructions')
-        new_content = content.rstrip() + '\n\n' + voice_instructions.strip() + '\n'
+        new_content = content.rstrip() + '\n\n' + _BASE_INSTRUCTIONS + profile_section + '\n'
+
+    if new_content == content:
+        logger.debug('Instructions file unchanged, skipping write')
+        return True, None
 
     try:
-        instructions_path.write_text(new_content, encoding='utf-8')
+        _write_cached(instructions_path, new_content)
         logger.info(f'Injected voice instructions into: {instructions_path}')
 
         refresh_message = (
@@ -252,21 +491,30 @@ def remove_voice_instructions(instructions_path: Optional[Path] = None) -> bool:
         return False
 
     try:
-        content = instructions_path.read_text(encoding='utf-8')
+        # Content this process last wrote is reused as-is; otherwise probe the
+        # file so one without a voice block is never fully decoded
+        st = instructions_path.stat()
+        cached = _CONTENT_CACHE.get(str(instructions_path))
+        if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+            content = cached[1] if VOICE_SECTION_MARKER_START in cached[1] else None
+        else:
+            content = _read_if_contains(instructions_path, VOICE_SECTION_MARKER_START)
     except Exception as e:
         logger.error(f'Error reading instructions file: {e}')
         return False
 
-    if VOICE_SECTION_MARKER_START not in content:
+    if content is None:
         logger.debug('No voice instructions to remove')
         return True
 
-    pattern = rf'{re.escape(VOICE_SECTION_MARKER_START)}.*?{re.escape(VOICE_SECTION_MARKER_END)}'
-    new_content = re.sub(pattern, '', content, flags=re.DOTALL)
-    new_content = re.sub(r'\n\n\n+', '\n\n', new_content).strip() + '\n'
+    new_content = _remove_voice_blocks(content)
+
+    if new_content == content:
+        logger.debug('Instructions file unchanged, skipping write')
+        return True
 
     try:
-        instructions_path.write_text(new_content, encoding='utf-8')
+        _write_cached(instructions_path, new_content)
         logger.info(f'Removed voice instructions from: {instructions_path}')
         return True
     except Exception as e:
@@ -0,0 +1,63 @@
+"""Event-driven watching of PyAgentVox IPC files.
+
+PyAgentVox processes talk through small files in the temp directory (TTS
+input, emotion state, control commands). When watchdog is installed, both the
+main process and the avatar widget watch that directory with an OS-level
+observer (inotify, ReadDirectoryChangesW, FSEvents) and route events for the
+files they care about to callbacks; without it they fall back to polling.
+
+Usage:
+    from pyagentvox.ipc_watch import IPCFileEventHandler, Observer
+
+    if Observer is not None:
+        observer = Observer()
+        observer.schedule(IPCFileEventHandler(callbacks, dispatch), tempfile.gettempdir())
+        observer.start()
+
+Author:
+    Jake Meador <jameador13@gmail.com>
+"""
+
+from pathlib import Path
+from typing import Any, Callable
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object  # type: ignore[assignment,misc]
+    Observer = None  # type: ignore[assignment,misc]
+
+__author__ = 'Jake Meador <jameador13@gmail.com>'
+__all__ = ['IPCFileEventHandler', 'Observer']
+
+
+class IPCFileEventHandler(FileSystemEventHandler):
+    """Route watchdog events for specific IPC filenames to callbacks.
+
+    Args:
+        callbacks: Mapping of watched filename -> callback to run on change.
+        dispatch: Function that schedules a callback on the owner's loop
+            (the Tk main loop or the asyncio event loop); watchdog calls
+            handlers from its own thread.
+    """
+
+    def __init__(
+        self,
+        callbacks: dict[str, Callable[[], Any]],
+        dispatch: Callable[[Callable[[], Any]], None],
+    ) -> None:
+        super().__init__()
+        self._callbacks = callbacks
+        self._dispatch = dispatch
+
+    def on_any_event(self, event: Any) -> None:
+        """Dispatch the callback for a created, modified, moved, or deleted IPC file."""
+        if event.is_directory:
+            return
+        # Atomic writes arrive as moves, so the destination name matters too
+        for path in (event.src_path, getattr(event, 'dest_path', '')):
+            callback = self._callbacks.get(Path(path).name) if path else None
+            if callback is not None:
+                self._dispatch(callback)
+                return
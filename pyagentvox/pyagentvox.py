@@ -28,23 +28,26 @@ import asyncio
 import atexit
 import contextlib
 import hashlib
+import io
 import logging
 import os
 import psutil
+import queue
 import re
+import stat
 import subprocess
 import sys
 import tempfile
 import threading
 import time
 import traceback
+from collections import OrderedDict, deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 import edge_tts
 import pygame
-from mutagen.mp3 import MP3
 
 try:
     import speech_recognition as sr
@@ -73,15 +76,100 @@ __all__ = ['PyAgentVox', 'run', 'main']
 try:
     from . import config
     from .avatar_widget import cleanup_emotion_file, write_emotion_state
+    from .ipc_watch import IPCFileEventHandler, Observer
 except ImportError:
     import config
     from avatar_widget import cleanup_emotion_file, write_emotion_state
+    from ipc_watch import IPCFileEventHandler, Observer
 
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
 logger = logging.getLogger('pyagentvox')
 
+TTS_GENERATION_CONCURRENCY = 2  # Segments synthesized at once while earlier ones play
+PLAYBACK_TAIL_MARGIN = 0.2  # Seconds before the MP3's reported end to start polling
+PLAYBACK_POLL_INTERVAL = 0.01  # Seconds between get_busy() checks near the end of a clip
+CHILD_STARTUP_GRACE = 0.5  # Seconds child processes get to fail fast before counting as started
+AVATAR_STDOUT_READ_TIMEOUT = 2.0  # Seconds to wait for a dead avatar's captured stdout
+AVATAR_STDOUT_TAIL_LINES = 20  # Lines of avatar stdout kept for crash diagnostics
+TTS_CACHE_MAX_BYTES = 16 * 1024 * 1024  # Synthesized audio kept for reuse before the oldest clips are deleted
+FILE_POLL_INTERVAL = 0.25  # Seconds between input/control file polls when watchdog is unavailable
+PID_START_TIME_TOLERANCE = 0.1  # Seconds of start-time drift still treated as the lock owner
+
+# Child process scripts shipped alongside this module
+_SCRIPT_DIR = Path(__file__).parent
+_INJECTOR_SCRIPT = _SCRIPT_DIR / 'injection.py'
+_TTS_MONITOR_SCRIPT = _SCRIPT_DIR / 'tts.py'
+_AVATAR_SCRIPT = _SCRIPT_DIR / 'avatar_widget.py'
+
+# Layer III bitrates (kbps) by header index, for MPEG-1 and MPEG-2/2.5
+_MP3_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0)
+_MP3_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0)
+
+# Emotion tags like [cheerful] that switch voices mid-message
+_EMOTION_TAG_PATTERN = re.compile(r'\[(\w+)\]')
+
+# Markdown cleanup patterns for _clean_text_for_speech
+_BOLD_ITALIC_PATTERN = re.compile(r'\*\*\*(.+?)\*\*\*')
+_BOLD_PATTERN = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC_PATTERN = re.compile(r'\*(.+?)\*')
+_UNDERSCORE_BOLD_PATTERN = re.compile(r'__(.+?)__')
+_UNDERSCORE_ITALIC_PATTERN = re.compile(r'_(.+?)_')
+_LINK_PATTERN = re.compile(r'\[(.+?)\]\(.+?\)')
+_INLINE_CODE_PATTERN = re.compile(r'`(.+?)`')
+_ESCAPE_PATTERN = re.compile(r'\\(.)')
+# [ \t] rather than \s so a bare '-' line never swallows the newline after it
+_BULLET_PATTERN = re.compile(r'^[-*][ \t]+', re.MULTILINE)
+
+# Signed integer in voice settings like '+20Hz' or '-5%', for _adjust_value
+_SIGNED_INT_PATTERN = re.compile(r'[+-]?\d+')
+
+
+def _estimate_mp3_duration(audio: bytes) -> float:
+    """Estimate a constant-bitrate MP3's duration from its first frame header.
+
+    Edge TTS produces CBR audio, so the size divided by the bitrate of the
+    first frame is accurate without scanning every frame.
+
+    Args:
+        audio: MP3 audio bytes
+
+    Returns:
+        Duration in seconds, or 0.0 if the header could not be read
+    """
+    offset = 0
+    if audio[:3] == b'ID3' and len(audio) >= 10:
+        # Skip the ID3v2 tag (syncsafe size excludes its 10-byte header)
+        offset = 10 + (audio[6] << 21 | audio[7] << 14 | audio[8] << 7 | audio[9])
+    header = audio[offset:offset + 4]
+
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0 or (header[1] >> 1) & 0x03 != 1:
+        return 0.0  # Not a Layer III frame header
+    version = (header[1] >> 3) & 0x03
+    if version == 1:
+        return 0.0  # Reserved version
+    bitrates = _MP3_BITRATES_V1 if version == 3 else _MP3_BITRATES_V2
+    kbps = bitrates[header[2] >> 4]
+    if not kbps:
+        return 0.0
+    return (len(audio) - offset) * 8 / (kbps * 1000)
+
+
+def _settle_future(future: asyncio.Future, error: Optional[BaseException]) -> None:
+    """Resolve a future unless its waiter already gave up on it.
+
+    Args:
+        future: Future to settle
+        error: Exception to set, or None for a plain result
+    """
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
 
 def _find_conversation_file() -> Path | None:
     """Find the Claude Code conversation file for per-window locking.
@@ -113,20 +201,49 @@ def _find_conversation_file() -> Path | None:
         if not search_path.exists():
             continue
 
-        # Search all subdirectories for .jsonl files, excluding subagents
-        for jsonl_file in search_path.rglob('*.jsonl'):
-            # Skip subagent files
-            if 'subagents' in str(jsonl_file):
-                continue
-
-            mtime = jsonl_file.stat().st_mtime
-            if mtime > latest_time:
-                latest_time = mtime
-                latest_file = jsonl_file
+        mtime, jsonl_file = _newest_jsonl(str(search_path))
+        if jsonl_file is not None and mtime > latest_time:
+            latest_time = mtime
+            latest_file = Path(jsonl_file)
 
     return latest_file
 
 
+def _newest_jsonl(root: str) -> tuple[float, Optional[str]]:
+    """Find the most recently modified .jsonl file below a directory.
+
+    Walks the tree with os.scandir, pruning subagents directories instead of
+    filtering every path under them, and stats only .jsonl entries.
+
+    Args:
+        root: Directory to search
+
+    Returns:
+        Tuple of (mtime, path), or (0.0, None) if no file was found
+    """
+    latest_time = 0.0
+    latest_file = None
+    pending = [root]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != 'subagents':
+                        pending.append(entry.path)
+                elif entry.name.endswith('.jsonl'):
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    if mtime > latest_time:
+                        latest_time, latest_file = mtime, entry.path
+    return latest_time, latest_file
+
+
 def _get_lock_id() -> str:
     """Get unique lock ID for this Claude Code window.
 
@@ -140,7 +257,7 @@ def _get_lock_id() -> str:
         return 'global'
 
     # Create short hash of conversation file path
-    path_hash = hashlib.md5(str(conv_file).encode()).hexdigest()[:8]
+    path_hash = hashlib.blake2b(str(conv_file).encode(), digest_size=4).hexdigest()
     return path_hash
 
 
@@ -182,15 +299,26 @@ class PyAgentVox:
             # Check if PID file exists
             if pid_file.exists():
                 try:
-                    existing_pid = int(pid_file.read_text().strip())
+                    # PID file holds the owner's PID and process start time
+                    pid_text, _, started_text = pid_file.read_text().partition('\n')
+                    existing_pid = int(pid_text)
+                    owner_started = float(started_text) if started_text.strip() else None
 
                     # Check if that process is still running
                     if psutil.pid_exists(existing_pid):
                         try:
                             process = psutil.Process(existing_pid)
-                            # Check if it's a Python process
-                            cmdline = ' '.join(process.cmdline())
-                            if 'python' in process.name().lower() and 'pyagentvox' in cmdline.lower():
+                            if owner_started is not None:
+                                # Same start time means the same process, so no
+                                # cross-process command line read is needed
+                                is_pyagentvox = abs(process.create_time() - owner_started) < PID_START_TIME_TOLERANCE
+                                description = 'started at a different time'
+                            else:
+                                # Lock file from an older version: check the command line
+                                cmdline = ' '.join(process.cmdline())
+                                is_pyagentvox = 'python' in process.name().lower() and 'pyagentvox' in cmdline.lower()
+                                description = cmdline[:100]
+                            if is_pyagentvox:
                                 # Process is running and is PyAgentVox
                                 raise RuntimeError(
                                     f'PyAgentVox is already running (PID: {existing_pid})\n'
@@ -198,7 +326,7 @@ class PyAgentVox:
                                 )
                             else:
                                 # Process exists but isn't PyAgentVox - might be stale
-                                logger.warning(f'PID {existing_pid} exists but is not PyAgentVox: {cmdline[:100]}')
+                                logger.warning(f'PID {existing_pid} exists but is not PyAgentVox: {description}')
                         except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
                             logger.debug(f'Process {existing_pid} check failed: {e}')
 
@@ -233,7 +361,7 @@ class PyAgentVox:
 
             # Create PID file with current process ID
             try:
-                pid_file.write_text(str(current_pid))
+                pid_file.write_text(f'{current_pid}\n{psutil.Process(current_pid).create_time()}\n')
                 logger.debug(f'Created PID lock file: {pid_file} (PID: {current_pid})')
                 return pid_file
             except OSError as e:
@@ -290,9 +418,7 @@ class PyAgentVox:
             self.config, self.config_file = config.load_config(config_path)
 
         self.emotion_voices: dict[str, tuple[str, str, str]] = {}
-        standard_emotions = ['neutral', 'cheerful', 'excited', 'empathetic', 'warm', 'calm', 'focused']
-
-        for emotion in standard_emotions:
+        for emotion in config.STANDARD_EMOTIONS:
             if emotion in self.config and isinstance(self.config[emotion], dict):
                 settings = self.config[emotion]
                 voice = settings.get('voice', 'en-US-MichelleNeural')
@@ -315,19 +441,26 @@ class PyAgentVox:
             logger.error(f'Failed to initialize pygame mixer: {e}')
             raise RuntimeError('Cannot initialize audio playback') from e
 
+        # Audio plays on its own thread; _play_audio queues (audio, loop, future)
+        self._playback_queue: queue.Queue[Optional[tuple[bytes, asyncio.AbstractEventLoop, asyncio.Future]]] = queue.Queue()
+        self._playback_thread = threading.Thread(target=self._playback_worker, name='pyagentvox-playback', daemon=True)
+        self._playback_thread.start()
+
         try:
-            self.input_file = tempfile.NamedTemporaryFile(
-                mode='w+', suffix='.txt', prefix='agent_input_', delete=False, encoding='utf-8'
-            )
-            self.output_file = tempfile.NamedTemporaryFile(
-                mode='w+', suffix='.txt', prefix='agent_output_', delete=False, encoding='utf-8'
-            )
+            # Only the paths are kept; the child processes open the files themselves
+            fd, self.input_file_name = tempfile.mkstemp(suffix='.txt', prefix='agent_input_', text=True)
+            os.close(fd)
+            fd, self.output_file_name = tempfile.mkstemp(suffix='.txt', prefix='agent_output_', text=True)
+            os.close(fd)
         except OSError as e:
             logger.error(f'Failed to create temporary files: {e}')
             raise RuntimeError('Cannot initialize PyAgentVox: temp file creation failed') from e
 
-        logger.info(f'Input file (for TTS): {self.input_file.name}')
-        logger.info(f'Output file (from STT): {self.output_file.name}')
+        # Synthesized clips persist here for later runs; None keeps the cache in memory only
+        self._tts_cache_dir: Optional[str] = self._open_tts_cache_dir()
+
+        logger.info(f'Input file (for TTS): {self.input_file_name}')
+        logger.info(f'Output file (from STT): {self.output_file_name}')
 
         atexit.register(self._cleanup)
 
@@ -338,6 +471,30 @@ class PyAgentVox:
         self.avatar_process: Optional[subprocess.Popen] = None
         self.tts_queue: Optional[asyncio.Queue] = None  # Created in run()
 
+        # Input and control files, with the last state seen by their handlers
+        self._pid = os.getpid()
+        tmp_dir = Path(tempfile.gettempdir())
+        self._profile_control_file = tmp_dir / f'agent_profile_{self._pid}.txt'
+        self._control_file = tmp_dir / f'agent_control_{self._pid}.txt'
+        self._modify_file = tmp_dir / f'agent_modify_{self._pid}.txt'
+        self._avatar_tts_file = tmp_dir / f'pyagentvox_tts_enabled_{self._pid}.txt'
+        self._avatar_stt_file = tmp_dir / f'pyagentvox_stt_enabled_{self._pid}.txt'
+        self._last_input_content = ''
+        self._input_file_stamp: Optional[tuple[int, int]] = None
+        self._profile_control_mtime = 0.0
+        self._control_file_mtime = 0.0
+        self._modify_file_mtime = 0.0
+        self._last_avatar_tts_state: Optional[str] = None
+        self._last_avatar_stt_state: Optional[str] = None
+        self._avatar_tts_mtime = 0
+        self._avatar_stt_mtime = 0
+        self._file_observer: Any = None  # watchdog Observer when event-driven watching is active
+        self._file_events: Optional[asyncio.Queue] = None  # Created in _start_file_watch()
+
+        # Synthesized audio by blake2b(text|voice|rate|pitch), least recently used first
+        self._tts_cache: OrderedDict[str, bytes] = OrderedDict()
+        self._tts_cache_bytes: int = 0
+
         # Auto-pause for speech recognition
         self.last_speech_time: float = time.time()
         self.stt_paused: bool = False
@@ -353,6 +510,11 @@ class PyAgentVox:
         if avatar:
             self._start_avatar_widget()
 
+        # All children start concurrently; one shared grace period confirms them
+        if self.injector_process or self.tts_monitor_process or self.avatar_process:
+            time.sleep(CHILD_STARTUP_GRACE)
+            self._check_children_started()
+
         # Voice instructions are now provided via the voice-context skill
         # (progressive disclosure) instead of CLAUDE.md injection.
 
@@ -361,28 +523,28 @@ class PyAgentVox:
 
     def _print_header(self) -> None:
         """Print session header with configuration info."""
-        logger.info('\n' + '=' * 60)
-        logger.info('PYAGENTVOX - Two-Way Voice Communication')
-        logger.info('=' * 60)
-        logger.info(f'\nVoice: {self.voice}')
-        logger.info(f'Speed: {self.rate} | Pitch: {self.pitch}')
-        logger.info('\nInput file (write text for agent to speak):')
-        logger.info(f'  {self.input_file.name}')
-        logger.info('\nOutput file (your spoken words appear here):')
-        logger.info(f'  {self.output_file.name}')
-        logger.info('\nRuntime Controls:')
-        profile_file = Path(tempfile.gettempdir()) / f'agent_profile_{os.getpid()}.txt'
-        control_file = Path(tempfile.gettempdir()) / f'agent_control_{os.getpid()}.txt'
-        modify_file = Path(tempfile.gettempdir()) / f'agent_modify_{os.getpid()}.txt'
-        logger.info(f'  Profile: echo <profile> > {profile_file}')
-        logger.info(f'  TTS/STT: echo tts:on|off > {control_file}')
-        logger.info(f'  Modify:  echo pitch=+5 > {modify_file}')
-        logger.info(f'  Or use: python -m pyagentvox switch/tts/stt/modify <args>')
-        logger.info('\nBackground services:')
-        logger.info('  - Voice Injector: Sends your speech to Claude Code')
-        logger.info('  - TTS Monitor: Sends Claude responses to voice output')
-        logger.info('\nPress Ctrl+C to stop\n')
-        logger.info('=' * 60 + '\n')
+        # One log record for the whole banner instead of one per line
+        logger.info('\n'.join([
+            '\n' + '=' * 60,
+            'PYAGENTVOX - Two-Way Voice Communication',
+            '=' * 60,
+            f'\nVoice: {self.voice}',
+            f'Speed: {self.rate} | Pitch: {self.pitch}',
+            '\nInput file (write text for agent to speak):',
+            f'  {self.input_file_name}',
+            '\nOutput file (your spoken words appear here):',
+            f'  {self.output_file_name}',
+            '\nRuntime Controls:',
+            f'  Profile: echo <profile> > {self._profile_control_file}',
+            f'  TTS/STT: echo tts:on|off > {self._control_file}',
+            f'  Modify:  echo pitch=+5 > {self._modify_file}',
+            '  Or use: python -m pyagentvox switch/tts/stt/modify <args>',
+            '\nBackground services:',
+            '  - Voice Injector: Sends your speech to Claude Code',
+            '  - TTS Monitor: Sends Claude responses to voice output',
+            '\nPress Ctrl+C to stop\n',
+            '=' * 60 + '\n',
+        ]))
 
     def _start_voice_injector(self) -> None:
         """Start voice injector process in background."""
@@ -391,27 +553,20 @@ class PyAgentVox:
                 logger.warning('Voice injector only supported on Windows')
                 return
 
-            script_dir = Path(__file__).parent
-            injector_script = script_dir / 'injection.py'
+            injector_script = _INJECTOR_SCRIPT
 
             if not injector_script.exists():
                 logger.warning(f'Voice injector not found: {injector_script}')
                 return
 
             self.injector_process = subprocess.Popen(
-                [sys.executable, str(injector_script), '--output-file', self.output_file.name, '--use-foreground'],
-                stderr=subprocess.PIPE,
-                stdout=subprocess.PIPE
+                [sys.executable, str(injector_script), '--output-file', self.output_file_name, '--use-foreground'],
+                stderr=subprocess.DEVNULL,  # Never read; a full pipe would stall the child
+                stdout=subprocess.DEVNULL
             )
 
             logger.info(f'Voice injector started (PID: {self.injector_process.pid})')
 
-            time.sleep(0.5)
-
-            if self.injector_process.poll() is not None:
-                logger.error('Voice injector failed to start!')
-                self.injector_process = None
-
         except Exception as e:
             logger.warning(f'Failed to start voice injector: {e}')
             logger.info('You can still run it manually: uv run voice_injector.py')
@@ -419,8 +574,7 @@ class PyAgentVox:
     def _start_tts_monitor(self) -> None:
         """Start TTS monitor process in background."""
         try:
-            script_dir = Path(__file__).parent
-            monitor_script = script_dir / 'tts.py'
+            monitor_script = _TTS_MONITOR_SCRIPT
 
             if not monitor_script.exists():
                 logger.warning(f'TTS monitor not found: {monitor_script}')
@@ -428,21 +582,13 @@ class PyAgentVox:
 
             logger.info('Starting TTS monitor...')
             self.tts_monitor_process = subprocess.Popen(
-                [sys.executable, str(monitor_script), '--input-file', self.input_file.name],
-                stderr=subprocess.PIPE,
-                stdout=subprocess.PIPE
+                [sys.executable, str(monitor_script), '--input-file', self.input_file_name],
+                stderr=subprocess.DEVNULL,  # Never read; a full pipe would stall the child
+                stdout=subprocess.DEVNULL
             )
 
             logger.info(f'TTS monitor started (PID: {self.tts_monitor_process.pid})')
 
-            time.sleep(0.5)
-
-            if self.tts_monitor_process.poll() is not None:
-                logger.error('TTS monitor failed to start!')
-                self.tts_monitor_process = None
-            else:
-                logger.debug('TTS monitor running successfully')
-
         except Exception as e:
             logger.error(f'Failed to start TTS monitor: {e}')
             logger.info('You can still run it manually: uv run python tts_monitor.py')
@@ -454,8 +600,7 @@ class PyAgentVox:
         is visible. Captures stderr for crash diagnostics.
         """
         try:
-            script_dir = Path(__file__).parent
-            avatar_script = script_dir / 'avatar_widget.py'
+            avatar_script = _AVATAR_SCRIPT
 
             if not avatar_script.exists():
                 logger.warning(f'Avatar widget not found: {avatar_script}')
@@ -464,7 +609,7 @@ class PyAgentVox:
             cmd = [sys.executable, str(avatar_script)]
 
             # Pass our PID so avatar can monitor our emotion state file
-            cmd.extend(['--pid', str(os.getpid())])
+            cmd.extend(['--pid', str(self._pid)])
 
             avatar_config = self.config.get('avatar', {})
             avatar_size = avatar_config.get('size')
@@ -476,7 +621,7 @@ class PyAgentVox:
                 cmd.append('--debug')
 
             # Write initial waiting state so avatar starts in idle mode
-            write_emotion_state(os.getpid(), 'waiting')
+            write_emotion_state(self._pid, 'waiting')
 
             logger.debug(f'Avatar widget command: {" ".join(cmd)}')
 
@@ -488,24 +633,61 @@ class PyAgentVox:
                 stderr=None,  # Inherit parent stderr so logging output is visible
             )
 
-            logger.info(f'Avatar widget started (PID: {self.avatar_process.pid})')
-
-            time.sleep(0.5)
+            # Drain stdout continuously so the pipe never fills, keeping the
+            # tail for crash diagnostics
+            self._avatar_stdout_tail = deque(maxlen=AVATAR_STDOUT_TAIL_LINES)
+            self._avatar_stdout_thread = threading.Thread(
+                target=self._avatar_stdout_tail.extend,
+                args=(self.avatar_process.stdout,),
+                name='pyagentvox-avatar-stdout',
+                daemon=True,
+            )
+            self._avatar_stdout_thread.start()
 
-            if self.avatar_process.poll() is not None:
-                returncode = self.avatar_process.returncode
-                logger.warning(f'Avatar widget failed to start (exit code: {returncode})')
-                # Try to read any stdout for diagnostics
-                if self.avatar_process.stdout:
-                    stdout_output = self.avatar_process.stdout.read().decode('utf-8', errors='replace')
-                    if stdout_output.strip():
-                        logger.warning(f'Avatar stdout: {stdout_output[:500]}')
-                self.avatar_process = None
+            logger.info(f'Avatar widget started (PID: {self.avatar_process.pid})')
 
         except Exception as e:
             logger.warning(f'Failed to start avatar widget: {e}')
             logger.debug(f'Avatar start error details:', exc_info=True)
 
+    def _check_children_started(self) -> None:
+        """Drop any child process that exited during its startup grace period.
+
+        The children are launched back to back and share a single
+        CHILD_STARTUP_GRACE wait before this runs, instead of each launch
+        sleeping on its own.
+        """
+        if self.injector_process is not None and self.injector_process.poll() is not None:
+            logger.error('Voice injector failed to start!')
+            self.injector_process = None
+
+        if self.tts_monitor_process is not None:
+            if self.tts_monitor_process.poll() is not None:
+                logger.error('TTS monitor failed to start!')
+                self.tts_monitor_process = None
+            else:
+                logger.debug('TTS monitor running successfully')
+
+        self._check_avatar_started()
+
+    def _check_avatar_started(self) -> None:
+        """Drop the avatar process if it exited during its startup grace period."""
+        if self.avatar_process is not None and self.avatar_process.poll() is not None:
+            returncode = self.avatar_process.returncode
+            logger.warning(f'Avatar widget failed to start (exit code: {returncode})')
+            # Log any captured stdout for diagnostics
+            if stdout_output := self._avatar_stdout():
+                logger.warning(f'Avatar stdout: {stdout_output[-500:]}')
+            self.avatar_process = None
+
+    def _avatar_stdout(self) -> str:
+        """Return the tail of an exited avatar's stdout once the drain thread finishes.
+
+        Blocks for up to AVATAR_STDOUT_READ_TIMEOUT seconds.
+        """
+        self._avatar_stdout_thread.join(timeout=AVATAR_STDOUT_READ_TIMEOUT)
+        return b''.join(self._avatar_stdout_tail).decode('utf-8', errors='replace').strip()
+
     async def _watch_avatar_process(self) -> None:
         """Monitor the avatar widget subprocess and restart if it dies.
 
@@ -527,12 +709,11 @@ class PyAgentVox:
                 # Process exited
                 logger.warning(f'[AVATAR] Widget process exited (code: {rc})')
 
-                # Read any captured stdout for diagnostics
-                if self.avatar_process.stdout:
-                    with contextlib.suppress(Exception):
-                        stdout_data = self.avatar_process.stdout.read().decode('utf-8', errors='replace')
-                        if stdout_data.strip():
-                            logger.warning(f'[AVATAR] Widget stdout: {stdout_data[:500]}')
+                # Log any captured stdout for diagnostics, waiting for the
+                # drain thread off the event loop
+                with contextlib.suppress(Exception):
+                    if stdout_data := await asyncio.to_thread(self._avatar_stdout):
+                        logger.warning(f'[AVATAR] Widget stdout: {stdout_data[-500:]}')
 
                 self.avatar_process = None
 
@@ -540,6 +721,8 @@ class PyAgentVox:
                     restart_count += 1
                     logger.info(f'[AVATAR] Restarting widget (attempt {restart_count}/{max_restarts})')
                     self._start_avatar_widget()
+                    await asyncio.sleep(CHILD_STARTUP_GRACE)
+                    await asyncio.to_thread(self._check_avatar_started)
                 else:
                     logger.error(f'[AVATAR] Widget crashed {max_restarts} times, giving up')
                     break
@@ -554,30 +737,42 @@ class PyAgentVox:
         Returns:
             Cleaned text suitable for speech synthesis
         """
+        # Each markdown pass only runs when its marker character is present;
+        # most spoken lines contain none, so they skip the regex scans entirely
+
         # Remove markdown bold/italic
-        text = re.sub(r'\*\*\*(.+?)\*\*\*', r'\1', text)  # ***bold italic***
-        text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)      # **bold**
-        text = re.sub(r'\*(.+?)\*', r'\1', text)          # *italic*
-        text = re.sub(r'__(.+?)__', r'\1', text)          # __bold__
-        text = re.sub(r'_(.+?)_', r'\1', text)            # _italic_
+        if '*' in text:
+            text = _BOLD_ITALIC_PATTERN.sub(r'\1', text)  # ***bold italic***
+            text = _BOLD_PATTERN.sub(r'\1', text)         # **bold**
+            text = _ITALIC_PATTERN.sub(r'\1', text)       # *italic*
+        if '_' in text:
+            text = _UNDERSCORE_BOLD_PATTERN.sub(r'\1', text)    # __bold__
+            text = _UNDERSCORE_ITALIC_PATTERN.sub(r'\1', text)  # _italic_
 
         # Remove markdown links but keep text
-        text = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', text)   # [text](url)
+        if '[' in text:
+            text = _LINK_PATTERN.sub(r'\1', text)         # [text](url)
 
         # Remove inline code
-        text = re.sub(r'`(.+?)`', r'\1', text)            # `code`
+        if '`' in text:
+            text = _INLINE_CODE_PATTERN.sub(r'\1', text)  # `code`
 
         # Remove backslashes (escape characters)
-        text = re.sub(r'\\(.)', r'\1', text)              # \x -> x
+        if '\\' in text:
+            text = _ESCAPE_PATTERN.sub(r'\1', text)       # \x -> x
 
         # Remove bullet markers from lists (keeps the content, just removes "- " or "* ")
         # This ensures each list item becomes a separate line without the marker
-        text = re.sub(r'^[-*]\s+', '', text, flags=re.MULTILINE)  # Remove bullets at line start
-        text = re.sub(r'\n[-*]\s+', '\n', text)  # Remove bullets after newlines
+        if '-' in text or '*' in text:
+            text = _BULLET_PATTERN.sub('', text)  # Remove one bullet at each line start
 
-        # Clean up multiple spaces BUT preserve single newlines
-        text = re.sub(r'[ \t]+', ' ', text)               # Collapse spaces/tabs only
-        text = re.sub(r'\n\n+', '\n', text)               # Multiple newlines → single newline
+        # Clean up multiple spaces BUT preserve single newlines (plain str
+        # replaces; each pass halves the longest run, so runs go in a few)
+        text = text.replace('\t', ' ')
+        while '  ' in text:
+            text = text.replace('  ', ' ')               # Collapse spaces/tabs only
+        while '\n\n' in text:
+            text = text.replace('\n\n', '\n')           # Multiple newlines → single newline
 
         return text.strip()
 
@@ -613,8 +808,7 @@ class PyAgentVox:
                 [(None, 'Hello'), ('cheerful', 'there'), ('calm', 'friend!')]
         """
         # Split by emotion tags while capturing them
-        emotion_pattern = re.compile(r'\[(\w+)\]')
-        parts = emotion_pattern.split(text)
+        parts = _EMOTION_TAG_PATTERN.split(text)
 
         segments = []
         current_emotion = None
@@ -622,12 +816,11 @@ class PyAgentVox:
         for i, part in enumerate(parts):
             if i % 2 == 0:
                 if part.strip():
-                    lines = part.split('\n')
-                    for line in lines:
-                        if line.strip():
-                            cleaned_text = self._clean_text_for_speech(line)
-                            if cleaned_text:
-                                segments.append((current_emotion, cleaned_text))
+                    # Clean the whole part once (markdown patterns don't span
+                    # lines), then split it into per-line segments
+                    for line in self._clean_text_for_speech(part).split('\n'):
+                        if cleaned_text := line.strip():
+                            segments.append((current_emotion, cleaned_text))
             else:
                 current_emotion = part.lower()
 
@@ -638,21 +831,25 @@ class PyAgentVox:
 
         return segments
 
-    async def _generate_tts_file(self, emotion: Optional[str], text: str) -> Optional[str]:
-        """Generate TTS audio file for a text segment.
+    async def _generate_tts_audio(self, emotion: Optional[str], text: str) -> Optional[bytes]:
+        """Generate TTS audio for a text segment.
+
+        Audio is streamed from edge-tts straight into memory; the on-disk
+        copy only exists so later runs can reuse it.
 
         Args:
             emotion: Emotion tag or None for default
             text: Text to speak
 
         Returns:
-            Path to generated audio file, or None if generation failed
+            MP3 audio bytes, or None if generation failed
         """
         if not text.strip():
             return None
 
-        if emotion and emotion in self.emotion_voices:
-            voice, rate, pitch = self.emotion_voices[emotion]
+        settings = self.emotion_voices.get(emotion) if emotion else None
+        if settings is not None:
+            voice, rate, pitch = settings
             logger.debug(f'[TTS] Generating {emotion} -> Voice: {voice}')
         else:
             voice = self.voice
@@ -660,33 +857,137 @@ class PyAgentVox:
             pitch = self.pitch
             logger.debug(f'[TTS] Generating with default voice: {voice}')
 
-        temp_fd, temp_path = tempfile.mkstemp(suffix='.mp3', prefix='agent_voice_')
+        # Repeated phrases reuse audio synthesized earlier (this run or a previous one)
+        key = hashlib.blake2b(f'{text}|{voice}|{rate}|{pitch}'.encode(), digest_size=16).hexdigest()
+        cached = self._tts_cache.get(key)
+        if cached is not None:
+            self._tts_cache.move_to_end(key)
+            logger.debug(f'[TTS] Cache hit: {key}')
+            return cached
+
+        cache_path = os.path.join(self._tts_cache_dir, f'{key}.mp3') if self._tts_cache_dir else None
+        if cache_path:
+            with contextlib.suppress(OSError), open(cache_path, 'rb') as f:
+                if audio := f.read():
+                    logger.debug(f'[TTS] Cache hit on disk: {cache_path}')
+                    os.utime(cache_path)  # Recency for startup pruning
+                    self._remember_tts_audio(key, audio)
+                    return audio
 
         try:
-            os.close(temp_fd)
             communicate = edge_tts.Communicate(text, voice, rate=rate, pitch=pitch)
-            await communicate.save(temp_path)
-            logger.debug(f'[TTS] Generated: {temp_path}')
-            return temp_path
+            audio = b''.join([chunk['data'] async for chunk in communicate.stream() if chunk['type'] == 'audio'])
         except Exception as e:
             logger.error(f'TTS generation error: {e}')
             return None
 
-    async def _play_audio_file(self, audio_path: str, text_length: int = 0) -> None:
-        """Play an audio file with pygame.
+        if not audio:
+            logger.error('TTS generation error: no audio received')
+            return None
+
+        logger.debug(f'[TTS] Generated {len(audio)} bytes')
+        self._remember_tts_audio(key, audio)
+
+        # Persist for later runs; a failed write only costs a regeneration then
+        if cache_path:
+            try:
+                temp_fd, temp_path = tempfile.mkstemp(suffix='.mp3', prefix='agent_voice_', dir=self._tts_cache_dir)
+            except OSError as e:
+                logger.debug(f'[TTS] Could not persist cached audio: {e}')
+                return audio
+            try:
+                with os.fdopen(temp_fd, 'wb') as f:
+                    f.write(audio)
+                os.replace(temp_path, cache_path)
+            except OSError as e:
+                logger.debug(f'[TTS] Could not persist cached audio: {e}')
+                self._cleanup_audio_file(temp_path)
+
+        return audio
+
+    def _remember_tts_audio(self, key: str, audio: bytes) -> None:
+        """Record cached audio, evicting the least recently used beyond TTS_CACHE_MAX_BYTES.
+
+        Evicted entries also lose their on-disk copy.
 
         Args:
-            audio_path: Path to MP3 file
-            text_length: Length of original text (for fallback timing)
+            key: Cache key for the text and voice settings
+            audio: MP3 audio bytes
         """
+        previous = self._tts_cache.pop(key, None)
+        if previous is not None:
+            self._tts_cache_bytes -= len(previous)
+        self._tts_cache[key] = audio
+        self._tts_cache_bytes += len(audio)
+        # The newest clip always stays, even if it alone exceeds the cap
+        while self._tts_cache_bytes > TTS_CACHE_MAX_BYTES and len(self._tts_cache) > 1:
+            evicted_key, evicted = self._tts_cache.popitem(last=False)
+            self._tts_cache_bytes -= len(evicted)
+            if self._tts_cache_dir:
+                self._cleanup_audio_file(os.path.join(self._tts_cache_dir, f'{evicted_key}.mp3'))
+
+    @staticmethod
+    def _open_tts_cache_dir() -> Optional[str]:
+        """Create (or reuse) this user's TTS cache directory and prune it.
+
+        The directory is private to the current user: on POSIX it carries the
+        uid, is created 0700, and is rejected if another user owns it or can
+        write to it, since cached clips are played back without validation.
+        Clips beyond TTS_CACHE_MAX_BYTES in total are removed, least recently
+        used first.
+
+        Returns:
+            Cache directory path, or None to keep the cache in memory only
+        """
+        uid = os.getuid() if hasattr(os, 'getuid') else None
+        name = 'pyagentvox_tts_cache' if uid is None else f'pyagentvox_tts_cache_{uid}'
+        cache_dir = os.path.join(tempfile.gettempdir(), name)
         try:
-            pygame.mixer.music.load(audio_path)
-            pygame.mixer.music.play()
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            st = os.lstat(cache_dir)
+            if not stat.S_ISDIR(st.st_mode) or (
+                uid is not None and (st.st_uid != uid or st.st_mode & 0o077)
+            ):
+                logger.warning(f'Not using TTS disk cache (not a private directory): {cache_dir}')
+                return None
+
+            # Temp files left by interrupted writes always go; clips oldest first
+            clips = []
+            with os.scandir(cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.mp3') or not entry.is_file(follow_symlinks=False):
+                        continue
+                    if entry.name.startswith('agent_voice_'):
+                        with contextlib.suppress(OSError):
+                            os.unlink(entry.path)
+                    else:
+                        st = entry.stat(follow_symlinks=False)
+                        clips.append((st.st_mtime, st.st_size, entry.path))
+            clips.sort(reverse=True)
+            kept = 0
+            for _, size, path in clips:
+                kept += size
+                if kept > TTS_CACHE_MAX_BYTES:
+                    with contextlib.suppress(OSError):
+                        os.unlink(path)
+        except OSError as e:
+            logger.warning(f'Not using TTS disk cache: {e}')
+            return None
+
+        return cache_dir
 
-            # Wait for playback to finish
-            while pygame.mixer.music.get_busy():
-                await asyncio.sleep(0.1)
+    async def _play_audio(self, audio: bytes, text_length: int = 0) -> None:
+        """Play MP3 audio with pygame on the playback thread.
 
+        Args:
+            audio: MP3 audio bytes
+            text_length: Length of original text (for fallback timing)
+        """
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        self._playback_queue.put((audio, loop, done))
+        try:
+            await done
             logger.debug('[TTS] Playback complete')
         except Exception as e:
             logger.error(f'Pygame playback error: {e}')
@@ -694,6 +995,36 @@ class PyAgentVox:
             if text_length > 0:
                 await asyncio.sleep((text_length / 14.0) + 0.5)
 
+    def _playback_worker(self) -> None:
+        """Play queued audio one clip at a time, off the event loop.
+
+        pygame's load() parses the clip synchronously, so running
+        it here keeps STT and control-file coroutines responsive. Each item's
+        future is settled on its loop when playback ends. A None item stops
+        the worker.
+        """
+        while (item := self._playback_queue.get()) is not None:
+            audio, loop, done = item
+            error = None
+            try:
+                pygame.mixer.music.load(io.BytesIO(audio), 'mp3')
+                pygame.mixer.music.play()
+
+                # Sleep through most of the clip in one wait, then poll the tail
+                # finely so the segment ends without up to 100 ms of extra lag
+                remaining = _estimate_mp3_duration(audio) - PLAYBACK_TAIL_MARGIN
+                if remaining > 0:
+                    time.sleep(remaining)
+
+                # Wait for playback to finish
+                while pygame.mixer.music.get_busy():
+                    time.sleep(PLAYBACK_POLL_INTERVAL)
+            except Exception as e:
+                error = e
+
+            with contextlib.suppress(RuntimeError):  # Loop already closed
+                loop.call_soon_threadsafe(_settle_future, done, error)
+
     def _cleanup_audio_file(self, audio_path: str) -> None:
         """Delete a temporary audio file.
 
@@ -730,35 +1061,45 @@ class PyAgentVox:
             return
 
         segments = self._parse_segments(text)
-        logger.info(f'[TTS] Generating {len(segments)} segment(s) in parallel...')
+        logger.info(f'[TTS] Streaming {len(segments)} segment(s)...')
+
+        # Generate ahead of playback with bounded concurrency, so the first
+        # segment plays as soon as it is ready while later ones are produced
+        generation_slots = asyncio.Semaphore(TTS_GENERATION_CONCURRENCY)
+
+        async def generate(emotion: Optional[str], segment_text: str) -> Optional[bytes]:
+            async with generation_slots:
+                return await self._generate_tts_audio(emotion, segment_text)
 
-        # Generate all audio files in parallel for faster playback
         generation_tasks = [
-            self._generate_tts_file(emotion, segment_text)
+            asyncio.create_task(generate(emotion, segment_text))
             for emotion, segment_text in segments
         ]
-        audio_paths = await asyncio.gather(*generation_tasks)
-
-        # Play all segments sequentially (no generation delays between!)
-        logger.info(f'[TTS] Playing {len(segments)} segment(s) sequentially...')
-        my_pid = os.getpid()
-        for idx, (audio_path, (emotion, segment_text)) in enumerate(zip(audio_paths, segments)):
-            if audio_path:
-                # Signal avatar widget: emotion starts playing
-                avatar_emotion = emotion or 'neutral'
-                write_emotion_state(my_pid, avatar_emotion)
-                logger.debug(f'[TTS] Playing segment {idx+1}/{len(segments)}')
-                await self._play_audio_file(audio_path, len(segment_text))
-            else:
-                logger.warning(f'[TTS] Skipping segment {idx+1} (generation failed)')
 
-        # Signal avatar widget: all audio finished, return to waiting
-        write_emotion_state(my_pid, 'waiting')
+        # Play segments in order as each one finishes generating
+        last_avatar_emotion = None
+        try:
+            for idx, (task, (emotion, segment_text)) in enumerate(zip(generation_tasks, segments)):
+                audio = await task
+                if audio:
+                    # Signal avatar widget: emotion starts playing. Runs of
+                    # same-emotion segments write once, so the avatar isn't
+                    # woken to re-read an unchanged state file.
+                    avatar_emotion = emotion or 'neutral'
+                    if avatar_emotion != last_avatar_emotion:
+                        write_emotion_state(self._pid, avatar_emotion)
+                        last_avatar_emotion = avatar_emotion
+                    logger.debug(f'[TTS] Playing segment {idx+1}/{len(segments)}')
+                    await self._play_audio(audio, len(segment_text))
+                else:
+                    logger.warning(f'[TTS] Skipping segment {idx+1} (generation failed)')
+        finally:
+            # Don't leave generation running if playback was cancelled
+            for task in generation_tasks:
+                task.cancel()
 
-        # Cleanup all audio files after playback
-        for audio_path in audio_paths:
-            if audio_path:
-                self._cleanup_audio_file(audio_path)
+        # Signal avatar widget: all audio finished, return to waiting
+        write_emotion_state(self._pid, 'waiting')
 
     async def _process_tts_queue(self) -> None:
         """Process TTS messages from queue sequentially."""
@@ -776,10 +1117,15 @@ class PyAgentVox:
                 except asyncio.QueueEmpty:
                     pass  # No more profile switches to process
 
+                # Backlogged messages are taken directly; only an empty queue
+                # pays for the timed wait
                 try:
-                    text = await asyncio.wait_for(self.tts_queue.get(), timeout=0.5)
-                except asyncio.TimeoutError:
-                    continue
+                    text = self.tts_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    try:
+                        text = await asyncio.wait_for(self.tts_queue.get(), timeout=0.5)
+                    except asyncio.TimeoutError:
+                        continue
 
                 # Check if TTS is enabled before speaking
                 if self.tts_enabled:
@@ -796,217 +1142,309 @@ class PyAgentVox:
             except Exception as e:
                 logger.error(f'Error processing TTS queue: {e}')
 
-    async def _watch_input_file(self) -> None:
-        """Watch input file for new text to queue for TTS."""
-        last_content = ''
-        logger.info('Started watching input file for TTS requests...')
-        logger.debug(f'Watching: {self.input_file.name}')
-
-        while self.running:
+    async def _check_input_file(self) -> None:
+        """Queue the input file's text for TTS if it changed since the last check."""
+        input_path = self.input_file_name
+        try:
             try:
-                input_path = Path(self.input_file.name)
-                if input_path.exists():
-                    # Get file size to detect if it's still being written
-                    size1 = input_path.stat().st_size
-                    await asyncio.sleep(0.05)  # Wait 50ms
-                    size2 = input_path.stat().st_size
-
-                    # If size changed, wait a bit more for write to complete
-                    if size1 != size2:
-                        await asyncio.sleep(0.05)
-
-                    new_content = input_path.read_text(encoding='utf-8').strip()
-                else:
-                    logger.error(f'Input file was deleted: {input_path}')
-                    logger.error('PyAgentVox cannot continue without the input file. Exiting...')
-                    self.running = False
-                    break
-            except Exception as e:
-                logger.error(f'Error reading input file: {e}')
-                new_content = ''
+                st = os.stat(input_path)
+            except FileNotFoundError:
+                logger.error(f'Input file was deleted: {input_path}')
+                logger.error('PyAgentVox cannot continue without the input file. Exiting...')
+                self.running = False
+                return
 
-            if new_content and new_content != last_content:
-                logger.debug(f'[TTS] Queuing message: {new_content[:60]}...')
-                await self.tts_queue.put(new_content)
-                last_content = new_content
+            # Unchanged since the last read: nothing to do, no settle delay
+            stamp = (st.st_mtime_ns, st.st_size)
+            if stamp == self._input_file_stamp:
+                return
 
-            await asyncio.sleep(0.4)  # Reduced from 0.5 since we added delays above
+            # Changed: give the writer 50ms, and another 50ms if it was still writing
+            await asyncio.sleep(0.05)
+            st = os.stat(input_path)
+            if (st.st_mtime_ns, st.st_size) != stamp:
+                await asyncio.sleep(0.05)
+                st = os.stat(input_path)
 
-    async def _watch_profile_control(self) -> None:
-        """Watch control file for profile hot-swap requests."""
-        control_file = Path(tempfile.gettempdir()) / f'agent_profile_{os.getpid()}.txt'
-        last_mtime = 0.0
+            with open(input_path, encoding='utf-8') as f:
+                new_content = f.read().strip()
 
-        logger.info('Started watching for profile hot-swap requests...')
-        logger.debug(f'Control file: {control_file}')
+            # Only a successful read counts as seen; a failed one is retried next check
+            self._input_file_stamp = (st.st_mtime_ns, st.st_size)
+        except Exception as e:
+            logger.error(f'Error reading input file: {e}')
+            return
 
-        while self.running:
-            try:
-                if control_file.exists():
-                    current_mtime = control_file.stat().st_mtime
+        if new_content and new_content != self._last_input_content:
+            logger.debug(f'[TTS] Queuing message: {new_content[:60]}...')
+            await self.tts_queue.put(new_content)
+            self._last_input_content = new_content
 
-                    if current_mtime != last_mtime:
-                        last_mtime = current_mtime
+    async def _check_profile_control(self) -> None:
+        """Queue a profile hot-swap if the profile control file was written."""
+        control_file = self._profile_control_file
+        try:
+            if control_file.exists():
+                current_mtime = control_file.stat().st_mtime
 
-                        # Wait for write to complete
-                        await asyncio.sleep(0.1)
+                if current_mtime != self._profile_control_mtime:
+                    self._profile_control_mtime = current_mtime
 
-                        # Read profile name
-                        profile_name = control_file.read_text(encoding='utf-8').strip()
+                    # Wait for write to complete
+                    await asyncio.sleep(0.1)
 
-                        if profile_name:
-                            logger.info(f'[PROFILE] Hot-swap request: {profile_name}')
+                    # Read profile name
+                    profile_name = control_file.read_text(encoding='utf-8').strip()
 
-                            # Add to queue (will be processed in order)
-                            await self.profile_switch_queue.put(profile_name)
-                            logger.debug(f'[PROFILE] Switch queued (position: {self.profile_switch_queue.qsize()})')
+                    if profile_name:
+                        logger.info(f'[PROFILE] Hot-swap request: {profile_name}')
 
-                        # Delete control file after processing
-                        try:
-                            control_file.unlink()
-                            logger.debug('[PROFILE] Control file removed')
-                        except OSError as e:
-                            logger.warning(f'Could not remove control file: {e}')
+                        # Add to queue (will be processed in order)
+                        await self.profile_switch_queue.put(profile_name)
+                        logger.debug(f'[PROFILE] Switch queued (position: {self.profile_switch_queue.qsize()})')
 
-            except Exception as e:
-                logger.error(f'Error watching profile control file: {e}')
+                    # Delete control file after processing
+                    try:
+                        control_file.unlink()
+                        logger.debug('[PROFILE] Control file removed')
+                    except OSError as e:
+                        logger.warning(f'Could not remove control file: {e}')
 
-            await asyncio.sleep(0.5)
+        except Exception as e:
+            logger.error(f'Error watching profile control file: {e}')
 
-    async def _watch_control_file(self) -> None:
-        """Watch control file for TTS/STT on/off commands.
+    async def _check_control_file(self) -> None:
+        """Apply a TTS/STT on/off command if the control file was written.
 
         File format: agent_control_{pid}.txt
         Content: "tts:on", "tts:off", "stt:on", "stt:off"
         """
-        control_file = Path(tempfile.gettempdir()) / f'agent_control_{os.getpid()}.txt'
-        last_mtime = 0.0
+        control_file = self._control_file
+        try:
+            if control_file.exists():
+                current_mtime = control_file.stat().st_mtime
+
+                if current_mtime != self._control_file_mtime:
+                    self._control_file_mtime = current_mtime
+
+                    # Wait for write to complete
+                    await asyncio.sleep(0.1)
+
+                    # Read command
+                    command = control_file.read_text(encoding='utf-8').strip()
+
+                    if command == 'tts:off':
+                        self.tts_enabled = False
+                        logger.info('[CONTROL] TTS disabled')
+                    elif command == 'tts:on':
+                        self.tts_enabled = True
+                        logger.info('[CONTROL] TTS enabled')
+                    elif command == 'stt:off':
+                        self.stt_enabled = False
+                        logger.info('[CONTROL] STT disabled')
+                    elif command == 'stt:on':
+                        self.stt_enabled = True
+                        logger.info('[CONTROL] STT enabled')
+                    else:
+                        logger.warning(f'[CONTROL] Unknown command: {command}')
 
-        logger.info('Started watching for TTS/STT control commands...')
-        logger.debug(f'Control file: {control_file}')
+                    # Delete control file after processing
+                    try:
+                        control_file.unlink()
+                        logger.debug('[CONTROL] Control file removed')
+                    except OSError as e:
+                        logger.warning(f'Could not remove control file: {e}')
 
-        while self.running:
-            try:
-                if control_file.exists():
-                    current_mtime = control_file.stat().st_mtime
-
-                    if current_mtime != last_mtime:
-                        last_mtime = current_mtime
-
-                        # Wait for write to complete
-                        await asyncio.sleep(0.1)
-
-                        # Read command
-                        command = control_file.read_text(encoding='utf-8').strip()
-
-                        if command == 'tts:off':
-                            self.tts_enabled = False
-                            logger.info('[CONTROL] TTS disabled')
-                        elif command == 'tts:on':
-                            self.tts_enabled = True
-                            logger.info('[CONTROL] TTS enabled')
-                        elif command == 'stt:off':
-                            self.stt_enabled = False
-                            logger.info('[CONTROL] STT disabled')
-                        elif command == 'stt:on':
-                            self.stt_enabled = True
-                            logger.info('[CONTROL] STT enabled')
-                        else:
-                            logger.warning(f'[CONTROL] Unknown command: {command}')
-
-                        # Delete control file after processing
-                        try:
-                            control_file.unlink()
-                            logger.debug('[CONTROL] Control file removed')
-                        except OSError as e:
-                            logger.warning(f'Could not remove control file: {e}')
+        except Exception as e:
+            logger.error(f'Error watching control file: {e}')
 
-            except Exception as e:
-                logger.error(f'Error watching control file: {e}')
+    async def _check_avatar_controls(self) -> None:
+        """Apply TTS/STT toggles from the avatar widget's state files.
 
-            await asyncio.sleep(0.5)
+        The avatar widget writes separate state files when users toggle
+        TTS/STT via its interactive controls.
+        """
+        try:
+            # Check TTS state file (only re-read when its mtime moves)
+            tts_file = self._avatar_tts_file
+            try:
+                tts_mtime = os.stat(tts_file).st_mtime_ns
+            except FileNotFoundError:
+                tts_mtime = None
+            if tts_mtime is not None and tts_mtime != self._avatar_tts_mtime:
+                self._avatar_tts_mtime = tts_mtime
+                tts_state = tts_file.read_text(encoding='utf-8').strip()
+                if tts_state != self._last_avatar_tts_state:
+                    self._last_avatar_tts_state = tts_state
+                    self.tts_enabled = (tts_state == '1')
+                    logger.info(f'[AVATAR] TTS {"enabled" if self.tts_enabled else "disabled"}')
+
+            # Check STT state file (only re-read when its mtime moves)
+            stt_file = self._avatar_stt_file
+            try:
+                stt_mtime = os.stat(stt_file).st_mtime_ns
+            except FileNotFoundError:
+                stt_mtime = None
+            if stt_mtime is not None and stt_mtime != self._avatar_stt_mtime:
+                self._avatar_stt_mtime = stt_mtime
+                stt_state = stt_file.read_text(encoding='utf-8').strip()
+                if stt_state != self._last_avatar_stt_state:
+                    self._last_avatar_stt_state = stt_state
+                    new_stt_enabled = (stt_state == '1')
+
+                    # Only log and update if state actually changed
+                    if new_stt_enabled != self.stt_enabled:
+                        self.stt_enabled = new_stt_enabled
+                        logger.info(f'[AVATAR] STT {"enabled" if self.stt_enabled else "disabled"}')
+
+        except Exception as e:
+            logger.error(f'Error watching avatar control states: {e}')
 
-    async def _watch_avatar_controls(self) -> None:
-        """Watch avatar widget TTS/STT state files for control changes.
+    async def _check_modify_file(self) -> None:
+        """Apply a runtime voice setting change if the modify file was written.
 
-        Monitors separate state files written by the avatar widget when users
-        toggle TTS/STT via the interactive controls.
+        File format: agent_modify_{pid}.txt
+        Content: "pitch=+5", "neutral.speed=-10", "all.pitch=+3"
         """
-        tts_file = Path(tempfile.gettempdir()) / f'pyagentvox_tts_enabled_{os.getpid()}.txt'
-        stt_file = Path(tempfile.gettempdir()) / f'pyagentvox_stt_enabled_{os.getpid()}.txt'
-        last_tts_state = None
-        last_stt_state = None
+        modify_file = self._modify_file
+        try:
+            if modify_file.exists():
+                current_mtime = modify_file.stat().st_mtime
 
-        logger.debug('Started watching avatar widget control states...')
+                if current_mtime != self._modify_file_mtime:
+                    self._modify_file_mtime = current_mtime
 
-        while self.running:
-            try:
-                # Check TTS state file
-                if tts_file.exists():
-                    tts_state = tts_file.read_text(encoding='utf-8').strip()
-                    if tts_state != last_tts_state:
-                        last_tts_state = tts_state
-                        self.tts_enabled = (tts_state == '1')
-                        logger.info(f'[AVATAR] TTS {"enabled" if self.tts_enabled else "disabled"}')
-
-                # Check STT state file
-                if stt_file.exists():
-                    stt_state = stt_file.read_text(encoding='utf-8').strip()
-                    if stt_state != last_stt_state:
-                        last_stt_state = stt_state
-                        new_stt_enabled = (stt_state == '1')
-
-                        # Only log and update if state actually changed
-                        if new_stt_enabled != self.stt_enabled:
-                            self.stt_enabled = new_stt_enabled
-                            logger.info(f'[AVATAR] STT {"enabled" if self.stt_enabled else "disabled"}')
+                    # Wait for write to complete
+                    await asyncio.sleep(0.1)
 
-            except Exception as e:
-                logger.error(f'Error watching avatar control states: {e}')
+                    # Read modification command
+                    modification = modify_file.read_text(encoding='utf-8').strip()
 
-            await asyncio.sleep(0.5)
+                    if modification:
+                        logger.info(f'[MODIFY] Processing: {modification}')
+                        await self._apply_modification(modification)
 
-    async def _watch_modify_file(self) -> None:
-        """Watch modify file for runtime voice setting changes.
+                    # Delete modify file after processing
+                    try:
+                        modify_file.unlink()
+                        logger.debug('[MODIFY] Modify file removed')
+                    except OSError as e:
+                        logger.warning(f'Could not remove modify file: {e}')
 
-        File format: agent_modify_{pid}.txt
-        Content: "pitch=+5", "neutral.speed=-10", "all.pitch=+3"
+        except Exception as e:
+            logger.error(f'Error watching modify file: {e}')
+
+    def _start_file_watch(self) -> bool:
+        """Watch the input and control files with OS change notifications.
+
+        Uses watchdog (inotify, ReadDirectoryChangesW, FSEvents) when it is
+        installed. Events arrive on the observer thread and are handed to the
+        event loop through ``_file_events``.
+
+        Returns:
+            True if the watch is running, False if the caller should fall back
+            to polling.
         """
-        modify_file = Path(tempfile.gettempdir()) / f'agent_modify_{os.getpid()}.txt'
-        last_mtime = 0.0
+        if Observer is None:
+            return False
+
+        loop = asyncio.get_running_loop()
+        self._file_events = asyncio.Queue()
+
+        def dispatch(handler: Callable[[], Awaitable[None]]) -> None:
+            with contextlib.suppress(RuntimeError):  # Loop already closed
+                loop.call_soon_threadsafe(self._file_events.put_nowait, handler)
+
+        callbacks = {
+            Path(self.input_file_name).name: self._check_input_file,
+            self._profile_control_file.name: self._check_profile_control,
+            self._control_file.name: self._check_control_file,
+            self._avatar_tts_file.name: self._check_avatar_controls,
+            self._avatar_stt_file.name: self._check_avatar_controls,
+            self._modify_file.name: self._check_modify_file,
+        }
+        watch_dirs = {tempfile.gettempdir(), os.path.dirname(self.input_file_name)}
+        try:
+            observer = Observer()
+            event_handler = IPCFileEventHandler(callbacks, dispatch)
+            for watch_dir in watch_dirs:
+                observer.schedule(event_handler, watch_dir)
+            observer.daemon = True
+            observer.start()
+        except Exception as e:
+            logger.warning(f'File watch unavailable, falling back to polling: {e}')
+            return False
+
+        self._file_observer = observer
+        return True
+
+    async def _dispatch_file_events(self) -> None:
+        """Run file handlers as the watchdog observer reports changes."""
+        logger.info('Started watching input and control files for changes...')
 
-        logger.info('Started watching for voice modification commands...')
-        logger.debug(f'Modify file: {modify_file}')
+        # Pick up anything written before the watch started
+        for handler in (self._check_input_file, self._check_profile_control, self._check_control_file,
+                        self._check_avatar_controls, self._check_modify_file):
+            await handler()
 
         while self.running:
             try:
-                if modify_file.exists():
-                    current_mtime = modify_file.stat().st_mtime
-
-                    if current_mtime != last_mtime:
-                        last_mtime = current_mtime
+                handler = await asyncio.wait_for(self._file_events.get(), timeout=0.5)
+            except asyncio.TimeoutError:
+                # Retry an input read that failed; a no-op stat while it's unchanged
+                await self._check_input_file()
+                continue
 
-                        # Wait for write to complete
-                        await asyncio.sleep(0.1)
+            # One write raises several events; run each handler once per batch
+            handlers = [handler]
+            while not self._file_events.empty():
+                handler = self._file_events.get_nowait()
+                if handler not in handlers:
+                    handlers.append(handler)
 
-                        # Read modification command
-                        modification = modify_file.read_text(encoding='utf-8').strip()
+            for handler in handlers:
+                await handler()
 
-                        if modification:
-                            logger.info(f'[MODIFY] Processing: {modification}')
-                            await self._apply_modification(modification)
+    async def _poll_watched_files(self) -> None:
+        """Poll the input and control files when OS change notifications are unavailable.
 
-                        # Delete modify file after processing
-                        try:
-                            modify_file.unlink()
-                            logger.debug('[MODIFY] Modify file removed')
-                        except OSError as e:
-                            logger.warning(f'Could not remove modify file: {e}')
+        One task stats every control file per tick and runs the handlers whose
+        files changed (or appeared/disappeared), instead of one polling loop per
+        file. The input handler runs every tick: it is stamp-gated itself and
+        must retry reads that failed.
+        """
+        watched = [
+            (str(self._profile_control_file), self._check_profile_control),
+            (str(self._control_file), self._check_control_file),
+            (str(self._avatar_tts_file), self._check_avatar_controls),
+            (str(self._avatar_stt_file), self._check_avatar_controls),
+            (str(self._modify_file), self._check_modify_file),
+        ]
+        stamps: dict[str, Optional[tuple[int, int]]] = {}
 
-            except Exception as e:
-                logger.error(f'Error watching modify file: {e}')
+        logger.info('Started polling input and control files for changes...')
+        logger.debug(f'Watching: {self.input_file_name}')
 
-            await asyncio.sleep(0.5)
+        while self.running:
+            due = [self._check_input_file]
+            for path, handler in watched:
+                try:
+                    st = os.stat(path)
+                    stamp = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    stamp = None
+                # First tick always runs, so state written before startup is picked up
+                if path not in stamps or stamps[path] != stamp:
+                    stamps[path] = stamp
+                    if handler not in due:
+                        due.append(handler)
+
+            for handler in due:
+                await handler()
+                if not self.running:
+                    return
+
+            await asyncio.sleep(FILE_POLL_INTERVAL)
 
     async def _apply_modification(self, modification: str) -> None:
         """Apply runtime voice modification.
@@ -1030,7 +1468,7 @@ class PyAgentVox:
 
                 if emotion == 'all':
                     # Apply to all emotions
-                    emotions = ['neutral', 'cheerful', 'excited', 'empathetic', 'warm', 'calm', 'focused']
+                    emotions = config.STANDARD_EMOTIONS
                 else:
                     emotions = [emotion]
 
@@ -1054,7 +1492,7 @@ class PyAgentVox:
                         logger.warning(f'[MODIFY] Unknown emotion: {emo}')
             else:
                 # Global modification: pitch=+5 (applies to all)
-                emotions = ['neutral', 'cheerful', 'excited', 'empathetic', 'warm', 'calm', 'focused']
+                emotions = config.STANDARD_EMOTIONS
                 setting = key
 
                 for emo in emotions:
@@ -1086,7 +1524,7 @@ class PyAgentVox:
         - _adjust_value('+10%', '-5%') → '+5%'
         """
         # Extract number from current value (including negative sign)
-        current_match = re.search(r'[+-]?\d+', current)
+        current_match = _SIGNED_INT_PATTERN.search(current)
         if not current_match:
             logger.warning(f'[MODIFY] Could not parse current value: {current}')
             return current
@@ -1094,7 +1532,7 @@ class PyAgentVox:
         current_num = int(current_match.group())
 
         # Extract number and sign from modifier
-        modifier_match = re.search(r'([+-]?\d+)', modifier)
+        modifier_match = _SIGNED_INT_PATTERN.search(modifier)
         if not modifier_match:
             logger.warning(f'[MODIFY] Could not parse modifier: {modifier}')
             return current
@@ -1131,9 +1569,7 @@ class PyAgentVox:
 
             # Reinitialize emotion voices with new profile
             self.emotion_voices = {}
-            standard_emotions = ['neutral', 'cheerful', 'excited', 'empathetic', 'warm', 'calm', 'focused']
-
-            for emotion in standard_emotions:
+            for emotion in config.STANDARD_EMOTIONS:
                 if emotion in self.config and isinstance(self.config[emotion], dict):
                     settings = self.config[emotion]
                     voice = settings.get('voice', 'en-US-MichelleNeural')
@@ -1148,7 +1584,7 @@ class PyAgentVox:
             # Log voice configuration
             logger.info(f'[PROFILE] ✓ Successfully switched to profile: {profile_name}')
             logger.info(f'[PROFILE] Voice config:')
-            for emotion in standard_emotions:
+            for emotion in config.STANDARD_EMOTIONS:
                 if emotion in self.emotion_voices:
                     voice, speed, pitch = self.emotion_voices[emotion]
                     logger.info(f'  [{emotion}] {voice} @ {speed}, {pitch}')
@@ -1179,6 +1615,15 @@ class PyAgentVox:
             self.last_speech_time = time.time()
             logger.info('[STT] Resumed listening after TTS activity')
 
+    def _append_output(self, text: str) -> None:
+        """Append text to the STT output file.
+
+        Args:
+            text: Text to append.
+        """
+        with open(self.output_file_name, 'a', encoding='utf-8') as f:
+            f.write(text)
+
     def _speech_recognition_loop(self) -> None:
         """Run speech recognition loop with auto-pause on idle."""
         recognizer = sr.Recognizer()
@@ -1189,10 +1634,11 @@ class PyAgentVox:
 
         logger.info(f'[STT] Microphone sensitivity: {self.energy_threshold} (lower = more sensitive)')
 
-        self.output_file.write(f"\n{'=' * 60}\n")
-        self.output_file.write(f"Voice session started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        self.output_file.write(f"{'=' * 60}\n\n")
-        self.output_file.flush()
+        self._append_output(
+            f"\n{'=' * 60}\n"
+            f"Voice session started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"{'=' * 60}\n\n"
+        )
 
         logger.info('[STT] Voice recognition ready! (Auto-pauses after 10 min idle)\n')
 
@@ -1223,8 +1669,7 @@ class PyAgentVox:
                     timestamp = datetime.now().strftime('%H:%M:%S')
                     log_entry = f'[{timestamp}] {text}\n'
                     logger.info(f'[STT] You: {text}')
-                    self.output_file.write(log_entry)
-                    self.output_file.flush()
+                    self._append_output(log_entry)
 
                     # Update last speech time on successful recognition
                     self.last_speech_time = time.time()
@@ -1267,6 +1712,16 @@ class PyAgentVox:
             except Exception as e:
                 logger.warning(f'Error stopping avatar widget: {e}')
 
+        # Stop watching the input and control files
+        if getattr(self, '_file_observer', None) is not None:
+            with contextlib.suppress(Exception):
+                self._file_observer.stop()
+
+        # Stop the playback thread before the mixer goes away
+        if hasattr(self, '_playback_queue'):
+            self._playback_queue.put(None)
+            self._playback_thread.join(timeout=2)
+
         # Cleanup pygame mixer
         try:
             pygame.mixer.quit()
@@ -1275,35 +1730,32 @@ class PyAgentVox:
             logger.warning(f'Error stopping pygame mixer: {e}')
 
         # Clean up input file (separate try/except)
-        if hasattr(self, 'input_file'):
+        if hasattr(self, 'input_file_name'):
             try:
-                path = Path(self.input_file.name)
-                self.input_file.close()
+                path = Path(self.input_file_name)
                 if path.exists():
                     path.unlink()
             except Exception as e:
                 logger.warning(f'Error cleaning input file: {e}')
 
         # Clean up output file (separate try/except)
-        if hasattr(self, 'output_file'):
+        if hasattr(self, 'output_file_name'):
             try:
-                path = Path(self.output_file.name)
-                self.output_file.close()
+                path = Path(self.output_file_name)
                 if path.exists():
                     path.unlink()
             except Exception as e:
                 logger.warning(f'Error cleaning output file: {e}')
 
-        # Clean up avatar emotion IPC file
-        cleanup_emotion_file(os.getpid())
+        if hasattr(self, '_pid'):
+            # Clean up avatar emotion IPC file
+            cleanup_emotion_file(self._pid)
 
-        # Clean up avatar control state files
-        tts_state_file = Path(tempfile.gettempdir()) / f'pyagentvox_tts_enabled_{os.getpid()}.txt'
-        stt_state_file = Path(tempfile.gettempdir()) / f'pyagentvox_stt_enabled_{os.getpid()}.txt'
-        with contextlib.suppress(OSError):
-            tts_state_file.unlink(missing_ok=True)
-        with contextlib.suppress(OSError):
-            stt_state_file.unlink(missing_ok=True)
+            # Clean up avatar control state files
+            with contextlib.suppress(OSError):
+                self._avatar_tts_file.unlink(missing_ok=True)
+            with contextlib.suppress(OSError):
+                self._avatar_stt_file.unlink(missing_ok=True)
 
         # Remove PID lock file
         if hasattr(self, 'pid_file'):
@@ -1326,22 +1778,22 @@ class PyAgentVox:
         else:
             logger.info('[STT] Speech recognition disabled (TTS-only mode)\n')
 
+        if self._start_file_watch():
+            file_watcher = self._dispatch_file_events()
+        else:
+            file_watcher = self._poll_watched_files()
+
         try:
             # Run all watchers and queue processor concurrently
             await asyncio.gather(
-                self._watch_input_file(),
-                self._watch_profile_control(),
-                self._watch_control_file(),      # TTS/STT control (legacy)
-                self._watch_avatar_controls(),   # Avatar widget TTS/STT control
-                self._watch_modify_file(),       # Voice modifications
+                file_watcher,                    # Input, profile, control, avatar and modify files
                 self._watch_avatar_process(),    # Avatar subprocess watchdog
                 self._process_tts_queue()
             )
         except KeyboardInterrupt:
             logger.info('\n\nPyAgentVox stopped!')
             self.running = False
-            self.output_file.write(f"\nSession ended: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            self.output_file.flush()
+            self._append_output(f"\nSession ended: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             self._cleanup()
 
 
@@ -284,6 +284,35 @@ class TestIPCStateFiles:
         # Cleanup
         state_file.unlink()
 
+    def test_write_state_skips_unchanged_value(self, widget):
+        """Test that rewriting the same state does not touch the file."""
+        widget._write_tts_state(True)
+        state_file = Path(tempfile.gettempdir()) / f'pyagentvox_tts_enabled_{widget.monitor_pid}.txt'
+
+        with patch('pyagentvox.avatar_widget.os.replace') as mock_replace:
+            widget._write_tts_state(True)
+            mock_replace.assert_not_called()
+
+        widget._write_tts_state(False)
+        assert state_file.read_text() == '0'
+        assert not state_file.with_suffix('.tmp').exists()
+
+        # Cleanup
+        state_file.unlink()
+
+    def test_write_state_rewrites_missing_file(self, widget):
+        """Test that an unchanged state is rewritten if its file was removed."""
+        widget._write_stt_state(True)
+        state_file = Path(tempfile.gettempdir()) / f'pyagentvox_stt_enabled_{widget.monitor_pid}.txt'
+        state_file.unlink()
+
+        widget._write_stt_state(True)
+
+        assert state_file.read_text() == '1'
+
+        # Cleanup
+        state_file.unlink()
+
     def test_state_files_cleaned_on_stop(self, widget):
         """Test that state files are removed when widget stops."""
         # Write state files
@@ -338,14 +367,13 @@ class TestCloseAnimation:
 
     @patch.object(AvatarWidget, '_load_control_image')
     @patch.object(AvatarWidget, 'stop')
-    @patch('time.sleep')  # Mock sleep to speed up tests
-    def test_close_with_animation(self, mock_sleep, mock_stop, mock_load, widget):
+    def test_close_with_animation(self, mock_stop, mock_load, widget):
         """Test that close animation shows crying image and calls stop."""
-        # Mock the root window geometry update
+        # Mock the root window geometry update; run scheduled frames immediately
         widget._root.geometry = Mock()
-        widget._root.update = Mock()
         widget._root.winfo_x = Mock(return_value=100)
         widget._root.winfo_y = Mock(return_value=100)
+        widget._root.after = Mock(side_effect=lambda ms, func, *args: func(*args))
 
         widget._close_with_animation()
 
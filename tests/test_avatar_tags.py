@@ -156,6 +156,13 @@ def test_filter_no_matches():
     assert len(result) == 0
 
 
+def test_filter_accepts_set_arguments(sample_images):
+    """Test that include/exclude tags can be passed as sets (widget filter state)."""
+    result = filter_images_by_tags(sample_images, {'cheerful'}, {'casual'}, False)
+    assert len(result) == 1
+    assert result[0].path.name == 'cheerful-dress.png'
+
+
 # ============================================================================
 # Image Registry Loading Tests
 # ============================================================================
@@ -187,8 +194,8 @@ def test_load_image_registry_relative_paths():
 
         assert len(registry) == 2
         assert all(img.path.is_absolute() for img in registry)
-        assert registry[0].tags == ['cheerful', 'dress']
-        assert registry[1].tags == ['excited', 'hoodie']
+        assert registry[0].tags == ('cheerful', 'dress')
+        assert registry[1].tags == ('excited', 'hoodie')
 
 
 def test_load_image_registry_absolute_paths():
@@ -223,8 +230,8 @@ def test_load_image_registry_missing_emotion_tag():
         registry = load_image_registry(avatar_dir, registry_config)
 
         assert len(registry) == 2
-        assert registry[0].tags == ['cheerful', 'dress']
-        assert registry[1].tags == ['excited', 'hoodie']
+        assert registry[0].tags == ('cheerful', 'dress')
+        assert registry[1].tags == ('excited', 'hoodie')
 
 
 def test_load_image_registry_invalid_entries():
@@ -243,8 +250,8 @@ def test_load_image_registry_invalid_entries():
         registry = load_image_registry(avatar_dir, registry_config)
 
         assert len(registry) == 2
-        assert registry[0].tags == ['cheerful', 'dress']
-        assert registry[1].tags == ['calm', 'formal']
+        assert registry[0].tags == ('cheerful', 'dress')
+        assert registry[1].tags == ('calm', 'formal')
 
 
 # ============================================================================
@@ -256,7 +263,7 @@ def test_image_entry_creation():
     img = ImageEntry(Path('test.png'), ['cheerful', 'dress', 'wave'])
 
     assert img.path == Path('test.png')
-    assert img.tags == ['cheerful', 'dress', 'wave']
+    assert img.tags == ('cheerful', 'dress', 'wave')
     assert img.tag_set == {'cheerful', 'dress', 'wave'}
 
 
@@ -267,6 +274,14 @@ def test_image_entry_tag_set_lowercase():
     assert img.tag_set == {'cheerful', 'dress', 'wave'}
 
 
+def test_image_entry_tag_set_is_frozenset():
+    """Test that tag_set is an immutable frozenset for hashed membership checks."""
+    img = ImageEntry(Path('test.png'), ['cheerful', 'dress'])
+
+    assert isinstance(img.tag_set, frozenset)
+    assert 'dress' in img.tag_set
+
+
 def test_image_entry_string_path():
     """Test ImageEntry with string path (should convert to Path)."""
     img = ImageEntry('test.png', ['cheerful', 'dress'])
@@ -9,8 +9,10 @@ Author:
 """
 
 import json
+import sys
 import tempfile
 import tkinter as tk
+from collections import Counter
 from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock, call, patch
 
@@ -101,6 +103,87 @@ class TestEmotionFileIPC:
             cleanup_emotion_file(fake_pid)
 
 
+class TestIPCFileWatch:
+    """Test the widget's event-driven watching of the emotion and filter IPC files."""
+
+    def test_start_file_watch_without_watchdog_falls_back(self) -> None:
+        """Without watchdog installed, the widget reports polling is needed."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        widget = MagicMock()
+        widget.monitor_pid = 1234
+
+        with patch('pyagentvox.avatar_widget.Observer', None):
+            assert AvatarWidget._start_file_watch(widget) is False
+
+    def test_poll_tick_checks_filter_every_nth_tick(self) -> None:
+        """The shared poll reads emotion each tick and the filter file every Nth tick."""
+        from pyagentvox.avatar_widget import EMOTION_POLL_INTERVAL_MS, FILTER_POLL_EVERY_TICKS, AvatarWidget
+
+        widget = MagicMock()
+        widget._running = True
+        widget.monitor_pid = 1234
+        widget._ipc_poll_tick = 0
+
+        for _ in range(FILTER_POLL_EVERY_TICKS * 2):
+            AvatarWidget._poll_ipc_files(widget)
+
+        assert widget._apply_emotion_file.call_count == FILTER_POLL_EVERY_TICKS * 2
+        assert widget._apply_filter_file.call_count == 2
+        widget._root.after.assert_called_with(EMOTION_POLL_INTERVAL_MS, widget._poll_ipc_files)
+
+    def test_start_file_watch_schedules_tempdir(self) -> None:
+        """With watchdog available, the temp directory is watched and the observer kept."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        widget = MagicMock()
+        widget.monitor_pid = 1234
+        observer_cls = MagicMock()
+
+        with patch('pyagentvox.avatar_widget.Observer', observer_cls):
+            assert AvatarWidget._start_file_watch(widget) is True
+
+        observer = observer_cls.return_value
+        assert observer.schedule.call_args.args[1] == tempfile.gettempdir()
+        observer.start.assert_called_once()
+        assert widget._file_observer is observer
+
+
+class TestFilterControlParsing:
+    """Test parsing of filter control file commands."""
+
+    def test_parse_tag_list_strips_and_drops_blanks(self) -> None:
+        """Tag lists are stripped and empty entries removed."""
+        from pyagentvox.avatar_widget import _parse_tag_list
+
+        assert _parse_tag_list(' casual, summer,, ') == {'casual', 'summer'}
+        assert _parse_tag_list('') == set()
+
+    def test_apply_filter_file_dispatches_commands(self, tmp_path: Path) -> None:
+        """Each command line is routed to its handler and the file is consumed."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        widget = MagicMock()
+        widget._running = True
+        widget.monitor_pid = 4242
+        widget._filter_file = tmp_path / 'agent_avatar_filter_4242.txt'
+        for name in ('_set_include_filter', '_set_exclude_filter', '_set_require_all_filter'):
+            getattr(widget, name).side_effect = (
+                lambda value, method=getattr(AvatarWidget, name): method(widget, value)
+            )
+        widget._get_variants.return_value = []
+
+        filter_file = widget._filter_file
+        filter_file.write_text('include:casual, summer\nexclude:formal\nrequire_all:TRUE\nbogus:x', encoding='utf-8')
+
+        AvatarWidget._apply_filter_file(widget)
+
+        assert widget._include_tags == {'casual', 'summer'}
+        assert widget._exclude_tags == {'formal'}
+        assert widget._require_all_include is True
+        assert not filter_file.exists()
+
+
 # ============================================================================
 # Image Variant Discovery
 # ============================================================================
@@ -176,6 +259,22 @@ class TestVariantDiscovery:
         names = [v.name for v in variants]
         assert names == ['waiting-1.png', 'waiting-2.png', 'waiting-3.png']
 
+    def test_scan_avatar_directory_merges_subdirs_and_prefixed_files(self, tmp_path: Path) -> None:
+        """Directory scan groups subdirectory and prefixed images by emotion."""
+        from pyagentvox.avatar_widget import scan_avatar_directory
+
+        (tmp_path / 'excited').mkdir()
+        (tmp_path / 'excited' / 'b.PNG').touch()
+        (tmp_path / 'excited' / 'notes.txt').touch()
+        (tmp_path / 'excited-1.png').touch()
+        (tmp_path / 'calm.webp').touch()
+        (tmp_path / 'readme.md').touch()
+        (tmp_path / 'empty').mkdir()
+
+        result = scan_avatar_directory(tmp_path)
+
+        assert result == {'excited': ['b.PNG', 'excited-1.png'], 'calm': ['calm.webp']}
+
 
 # ============================================================================
 # Waiting State
@@ -355,6 +454,192 @@ class TestWidgetVariantFallback:
         assert all('waiting' in v.name for v in variants)
 
 
+class TestVariantResolution:
+    """Test the resolve-once / filter-on-lookup split in the widget variant lookup."""
+
+    def _make_widget(self, tmp_path: Path, registry: list[ImageEntry]) -> MagicMock:
+        """Create a mock widget wired to the real resolution methods."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        widget = MagicMock()
+        widget.avatar_dir = tmp_path
+        widget._image_registry = registry
+        widget._resolved_variants = {}
+        widget._variant_cache = {}
+        widget._include_tags = set()
+        widget._exclude_tags = set()
+        widget._require_all_include = False
+        widget._resolve_base_variants.side_effect = (
+            lambda emotion: AvatarWidget._resolve_base_variants(widget, emotion)
+        )
+        widget._registry_by_path = {}
+        widget._tag_counts = Counter()
+        widget._tag_index = {}
+        AvatarWidget._index_registry(widget)
+        return widget
+
+    def test_registry_entries_resolved_without_control_images(self, tmp_path: Path) -> None:
+        """Base resolution keeps tagged entries and drops control images."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        registry = [
+            ImageEntry(tmp_path / 'a.png', ['excited', 'dress']),
+            ImageEntry(tmp_path / 'b.png', ['excited', 'control-tts-clicked']),
+        ]
+        widget = self._make_widget(tmp_path, registry)
+
+        entries, fallback = AvatarWidget._resolve_base_variants(widget, 'excited')
+        assert [e.path.name for e in entries] == ['a.png']
+        assert fallback == []
+
+    def test_filter_change_reuses_resolved_sources(self, tmp_path: Path) -> None:
+        """Clearing only the filtered cache re-filters without re-resolving."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        registry = [
+            ImageEntry(tmp_path / 'a.png', ['excited', 'dress']),
+            ImageEntry(tmp_path / 'b.png', ['excited', 'hoodie']),
+        ]
+        widget = self._make_widget(tmp_path, registry)
+
+        assert len(AvatarWidget._get_variants(widget, 'excited')) == 2
+
+        widget._include_tags = {'hoodie'}
+        widget._variant_cache.clear()
+        result = AvatarWidget._get_variants(widget, 'excited')
+
+        assert [p.name for p in result] == ['b.png']
+        assert widget._resolve_base_variants.call_count == 1
+
+    def test_registry_path_index_finds_raw_and_resolved_paths(self, tmp_path: Path) -> None:
+        """The path index matches both the registered path and its resolved form."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        (tmp_path / 'sub').mkdir()
+        entry = ImageEntry(tmp_path / 'sub' / '..' / 'a.png', ['excited'])
+        widget = self._make_widget(tmp_path, [entry])
+
+        assert AvatarWidget._find_registry_entry(widget, entry.path) is entry
+        assert AvatarWidget._find_registry_entry(widget, tmp_path / 'a.png') is entry
+        assert AvatarWidget._find_registry_entry(widget, tmp_path / 'b.png') is None
+
+    def test_all_tags_cache_tracks_tag_edits(self, tmp_path: Path) -> None:
+        """Custom tags leave the editor tag set once no entry uses them."""
+        from pyagentvox.avatar_widget import VALID_EMOTIONS, AvatarWidget
+
+        first = ImageEntry(tmp_path / 'a.png', ['excited', 'dress'])
+        second = ImageEntry(tmp_path / 'b.png', ['calm', 'dress', 'hat'])
+        widget = self._make_widget(tmp_path, [first, second])
+
+        assert {'dress', 'hat'} <= widget._all_tags_cache
+        assert VALID_EMOTIONS <= widget._all_tags_cache
+
+        AvatarWidget._update_tag_indexes(widget, second, second.tags, ['calm', 'scarf'])
+        assert 'hat' not in widget._all_tags_cache
+        assert 'hat' not in widget._tag_index
+        assert widget._tag_index['dress'] == [first]
+        assert widget._tag_index['scarf'] == [second]
+        assert 'dress' in widget._all_tags_cache  # Still used by the first entry
+        assert 'scarf' in widget._all_tags_cache
+        assert 'calm' in widget._all_tags_cache
+
+    def test_warmup_handles_one_emotion_per_step(self) -> None:
+        """Warmup resolves and decodes one emotion, then reschedules itself."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        widget = MagicMock()
+        widget._running = True
+        widget._image_cache = {}
+        widget._get_variants.return_value = [Path('/fake/excited-1.png'), Path('/fake/excited-2.png')]
+        emotions = iter(['excited', 'calm'])
+
+        AvatarWidget._warmup(widget, emotions)
+
+        widget._get_variants.assert_called_once_with('excited')
+        widget._load_image_from_path.assert_called_once_with(Path('/fake/excited-1.png'))
+        widget._root.after.assert_called_once()
+        assert next(emotions) == 'calm'
+
+    def test_warmup_stops_when_exhausted(self) -> None:
+        """Warmup does not reschedule once every emotion has been handled."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        widget = MagicMock()
+        widget._running = True
+        widget._image_cache = {}
+
+        AvatarWidget._warmup(widget, iter([]))
+
+        widget._get_variants.assert_not_called()
+        widget._root.after.assert_not_called()
+        assert widget._warmup_after_id is None
+
+    def test_missing_emotion_falls_back_to_default(self, tmp_path: Path) -> None:
+        """Emotions without images resolve to the default avatar path."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        (tmp_path / f'{DEFAULT_AVATAR}.png').touch()
+        widget = self._make_widget(tmp_path, [])
+
+        result = AvatarWidget._get_variants(widget, 'nonexistent')
+        assert result == [tmp_path / f'{DEFAULT_AVATAR}.png']
+
+
+class TestControlsFileIndex:
+    """Test the cached controls/ directory listing used by control image fallback."""
+
+    def test_index_maps_stems_with_extension_preference(self, tmp_path: Path) -> None:
+        """Stems map to files, preferring .png over other formats."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        controls = tmp_path / 'controls'
+        controls.mkdir()
+        (controls / 'tts-off.webp').touch()
+        (controls / 'tts-off.png').touch()
+        (controls / 'crying.jpg').touch()
+        (controls / 'notes.txt').touch()
+
+        widget = MagicMock()
+        widget.avatar_dir = tmp_path
+        widget._controls_file_index = None
+
+        index = AvatarWidget._get_controls_file_index(widget)
+        assert index == {'tts-off': controls / 'tts-off.png', 'crying': controls / 'crying.jpg'}
+        assert AvatarWidget._get_controls_file_index(widget) is index  # Cached
+
+    def test_index_keys_are_casefolded(self, tmp_path: Path) -> None:
+        """Mixed-case filenames are indexed under their casefolded stem."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        controls = tmp_path / 'controls'
+        controls.mkdir()
+        (controls / 'TTS-Off.PNG').touch()
+
+        widget = MagicMock()
+        widget.avatar_dir = tmp_path
+        widget._controls_file_index = None
+
+        assert AvatarWidget._get_controls_file_index(widget) == {'tts-off': controls / 'TTS-Off.PNG'}
+
+    def test_legacy_reverse_map_inverts_legacy_map(self) -> None:
+        """Every legacy name appears under its functional tag in the reverse map."""
+        from pyagentvox.avatar_widget import LEGACY_CONTROL_MAP, LEGACY_REVERSE_MAP
+
+        for legacy_name, functional_tag in LEGACY_CONTROL_MAP.items():
+            assert legacy_name in LEGACY_REVERSE_MAP[functional_tag]
+        assert LEGACY_REVERSE_MAP['control-close-hover'] == ('close', 'pleading')
+
+    def test_index_empty_without_controls_dir(self, tmp_path: Path) -> None:
+        """Missing controls directory yields an empty index."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        widget = MagicMock()
+        widget.avatar_dir = tmp_path
+        widget._controls_file_index = None
+
+        assert AvatarWidget._get_controls_file_index(widget) == {}
+
+
 # ============================================================================
 # Variant Cycling Logic
 # ============================================================================
@@ -385,6 +670,109 @@ class TestVariantCycling:
             visited.add(index)
         assert visited == {0, 1, 2, 3}
 
+    def test_switch_emotion_never_repicks_current_image(self) -> None:
+        """Switching picks a variant other than the one already displayed."""
+        import random
+
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        variants = [Path(f'/fake/excited-{i}.png') for i in range(3)]
+        widget = MagicMock()
+        widget._rng = random.Random(0)
+        widget._image_registry = []
+        widget._cycle_after_id = None
+        widget._get_variants.return_value = variants
+
+        for _ in range(20):
+            widget.current_emotion = 'cheerful'
+            widget.current_avatar_path = variants[0]
+            AvatarWidget._switch_emotion(widget, 'excited')
+            shown = widget._display_variant.call_args[0][0]
+            assert shown != variants[0]
+            assert widget._current_variant_index == variants.index(shown)
+
+
+# ============================================================================
+# Fade Transition
+# ============================================================================
+
+class TestFadeTransition:
+    """Test that the alpha fade only runs where window alpha is supported."""
+
+    def test_non_windows_switches_immediately(self) -> None:
+        """Off Windows, the fade is skipped and no timer chain is scheduled."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        widget = MagicMock()
+        widget.current_emotion = 'cheerful'
+        widget._fade_after_id = None
+
+        with patch('pyagentvox.avatar_widget.sys.platform', 'linux'):
+            AvatarWidget._fade_transition(widget, 'excited')
+
+        widget._switch_emotion.assert_called_once_with('excited')
+        widget._fade_out.assert_not_called()
+        widget._root.after.assert_not_called()
+
+    def test_windows_starts_fade_out(self) -> None:
+        """On Windows, the fade-out animation is started."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        widget = MagicMock()
+        widget.current_emotion = 'cheerful'
+        widget._fade_after_id = None
+
+        with patch('pyagentvox.avatar_widget.sys.platform', 'win32'):
+            AvatarWidget._fade_transition(widget, 'excited')
+
+        widget._fade_out.assert_called_once()
+        widget._switch_emotion.assert_not_called()
+        assert widget._pending_emotion == 'excited'
+
+
+class TestCloseSlide:
+    """Test the after()-driven close slide animation."""
+
+    def test_close_schedules_slide_without_blocking(self) -> None:
+        """Closing shows the image and schedules the slide instead of sleeping."""
+        from pyagentvox.avatar_widget import CLOSE_HOLD_MS, AvatarWidget
+
+        widget = MagicMock()
+        widget._close_after_id = None
+        widget._root.winfo_x.return_value = 10
+        widget._root.winfo_y.return_value = 20
+
+        AvatarWidget._close_with_animation(widget)
+
+        widget._load_control_image.assert_called_once_with('control-close-animation')
+        widget._root.after.assert_called_once_with(CLOSE_HOLD_MS, widget._close_slide_step, 0, 10, 20)
+        widget.stop.assert_not_called()
+
+    def test_close_ignored_while_running(self) -> None:
+        """A second close click during the exit sequence is ignored."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        widget = MagicMock()
+        widget._close_after_id = 'after#1'
+
+        AvatarWidget._close_with_animation(widget)
+
+        widget._root.after.assert_not_called()
+
+    def test_slide_steps_then_stops(self) -> None:
+        """Each step moves the window and the final step stops the widget."""
+        from pyagentvox.avatar_widget import CLOSE_SLIDE_STEPS, AvatarWidget
+
+        widget = MagicMock()
+        widget._running = True
+        widget._root.after.side_effect = lambda ms, func, *args: AvatarWidget._close_slide_step(widget, *args)
+
+        AvatarWidget._close_slide_step(widget, 0, 10, 20)
+
+        assert widget._root.geometry.call_count == CLOSE_SLIDE_STEPS
+        widget._root.geometry.assert_any_call('+10+20')
+        widget.stop.assert_called_once()
+
 
 # ============================================================================
 # Hover Lock Logic
@@ -511,6 +899,20 @@ class TestHoverLock:
         assert widget._hover_locked is True
         assert widget._was_cycling is True
 
+    def test_pointer_over_canvas_uses_cached_bbox(self) -> None:
+        """Pointer hit-testing compares against the cached bbox only."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        widget = self._make_mock_widget()
+        widget._canvas_bbox = (100, 200, 400, 500)
+
+        widget._root.winfo_pointerxy.return_value = (250, 300)
+        assert AvatarWidget._pointer_over_canvas(widget) is True
+
+        widget._root.winfo_pointerxy.return_value = (50, 300)
+        assert AvatarWidget._pointer_over_canvas(widget) is False
+        widget._canvas.winfo_rootx.assert_not_called()
+
 
 # ============================================================================
 # Tag Editor Button Logic
@@ -589,12 +991,68 @@ class TestImageEntryTagSet:
         entry = ImageEntry(path=Path('test.png'), tags=['cheerful', 'Cheerful', 'CHEERFUL'])
         assert entry.tag_set == {'cheerful'}
 
+    def test_tag_set_cached_until_tags_reassigned(self) -> None:
+        """tag_set is computed once and refreshed when tags is reassigned."""
+        entry = ImageEntry(path=Path('test.png'), tags=['Cheerful', 'dress'])
+        first = entry.tag_set
+        assert entry.tag_set is first
+
+        entry.tags = ['excited']
+        assert entry.tag_set == {'excited'}
+
+    def test_tag_set_interns_tags(self) -> None:
+        """tag_set entries are interned so index lookups can match by identity."""
+        entry = ImageEntry(path=Path('test.png'), tags=['Control-Close-Hover'])
+        (tag,) = entry.tag_set
+        assert tag is sys.intern('control-close-hover')
+
     def test_path_string_converted_to_path(self) -> None:
-        """ImageEntry converts string path to Path in __post_init__."""
+        """ImageEntry converts a string path to Path."""
         entry = ImageEntry(path='my_image.png', tags=['cheerful'])  # type: ignore[arg-type]
         assert isinstance(entry.path, Path)
         assert entry.path.name == 'my_image.png'
 
+    def test_resolved_path_computed_once(self, tmp_path: Path) -> None:
+        """resolved_path resolves the path on first access and caches it."""
+        entry = ImageEntry(path=tmp_path / 'sub' / '..' / 'img.png', tags=['cheerful'])
+
+        with patch.object(Path, 'resolve', autospec=True, side_effect=lambda p: tmp_path / 'img.png') as mock_resolve:
+            assert entry.resolved_path == tmp_path / 'img.png'
+            assert entry.resolved_path == tmp_path / 'img.png'
+
+        mock_resolve.assert_called_once()
+
+    def test_tags_stored_as_tuple(self) -> None:
+        """Tags are copied into a tuple, so the caller's list can't change them."""
+        tags = ['cheerful', 'dress']
+        entry = ImageEntry(path=Path('test.png'), tags=tags)
+        tags.append('hat')
+
+        assert entry.tags == ('cheerful', 'dress')
+
+        entry.tags = ['excited']
+        assert entry.tags == ('excited',)
+
+    def test_path_reassignment_refreshes_resolved_path(self, tmp_path: Path) -> None:
+        """Assigning path drops the cached resolved_path (and tag_set)."""
+        entry = ImageEntry(path=tmp_path / 'a.png', tags=['cheerful'])
+        assert entry.resolved_path == (tmp_path / 'a.png').resolve()
+        first_tags = entry.tag_set
+
+        entry.path = str(tmp_path / 'b.png')
+
+        assert entry.path == tmp_path / 'b.png'
+        assert entry.resolved_path == (tmp_path / 'b.png').resolve()
+        assert entry.tag_set == first_tags and entry.tag_set is not first_tags
+
+    def test_equality_by_path_and_tags(self) -> None:
+        """Entries compare by value, and tag order matters like the config list."""
+        entry = ImageEntry(path=Path('a.png'), tags=['cheerful', 'dress'])
+
+        assert entry == ImageEntry(path='a.png', tags=('cheerful', 'dress'))
+        assert entry != ImageEntry(path='a.png', tags=['dress', 'cheerful'])
+        assert repr(entry) == f"ImageEntry(path={Path('a.png')!r}, tags=('cheerful', 'dress'))"
+
 
 # ============================================================================
 # TagEditorDialog Validation Logic
@@ -683,14 +1141,14 @@ class TestTagEditorSaveIntegration:
     """Test the _save_image_tags path updates memory and config."""
 
     def test_save_updates_in_memory_tags(self) -> None:
-        """Saving tags updates the ImageEntry.tags list in memory."""
+        """Saving tags updates ImageEntry.tags in memory."""
         entry = ImageEntry(path=Path('test.png'), tags=['cheerful', 'dress'])
         new_tags = ['excited', 'casual', 'wave']
 
         # Simulate _save_image_tags logic
         entry.tags = new_tags
 
-        assert entry.tags == ['excited', 'casual', 'wave']
+        assert entry.tags == ('excited', 'casual', 'wave')
         assert 'excited' in entry.tag_set
 
     def test_save_invalidates_variant_cache(self) -> None:
@@ -717,6 +1175,39 @@ class TestTagEditorSaveIntegration:
 
         mock_update.assert_called_once_with(image_path, new_tags)
 
+    @patch('pyagentvox.avatar_widget.update_image_tags')
+    def test_save_without_changes_skips_write(self, mock_update: MagicMock) -> None:
+        """Applying an unchanged tag list neither clears caches nor hits disk."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        entry = ImageEntry(path=Path('/fake/avatar/test.png'), tags=['cheerful', 'wave'])
+        widget = MagicMock()
+
+        AvatarWidget._save_image_tags(widget, entry, ['cheerful', 'wave'])
+
+        mock_update.assert_not_called()
+        widget._update_tag_indexes.assert_not_called()
+        widget._variant_cache.clear.assert_not_called()
+
+    @patch('pyagentvox.avatar_widget.update_image_tags')
+    def test_save_invalidates_only_affected_emotions(self, mock_update: MagicMock) -> None:
+        """Only emotions the edited image was or is tagged with are re-resolved."""
+        from pyagentvox.avatar_widget import AvatarWidget
+
+        entry = ImageEntry(path=Path('/fake/avatar/test.png'), tags=['cheerful', 'dress'])
+        widget = MagicMock()
+        widget._resolved_variants = {'cheerful': ([], []), 'excited': ([], []), 'calm': ([], [])}
+        widget._variant_cache = {'cheerful': [], 'excited': [], 'calm': []}
+        widget._invalidate_variants_for_tags.side_effect = (
+            lambda tags: AvatarWidget._invalidate_variants_for_tags(widget, tags)
+        )
+
+        AvatarWidget._save_image_tags(widget, entry, ['excited', 'casual'])
+
+        assert set(widget._variant_cache) == {'calm'}
+        assert set(widget._resolved_variants) == {'calm'}
+        mock_update.assert_called_once()
+
 
 # ============================================================================
 # Empty Subdirectory Fallthrough (Bug Fix Regression Test)
@@ -919,7 +1410,7 @@ class TestImageRegistryLoading:
         config = [{'path': 'test.png', 'tags': ['cheerful', 'dress', 'wave']}]
 
         entries = load_image_registry(tmp_path, config)
-        assert entries[0].tags == ['cheerful', 'dress', 'wave']
+        assert entries[0].tags == ('cheerful', 'dress', 'wave')
 
 
 # ============================================================================
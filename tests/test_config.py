@@ -0,0 +1,194 @@
+"""Tests for the configuration system.
+
+Tests value parsing and modification, dict merging, set-string parsing,
+config cloning, and config file lookup and caching.
+
+Author:
+    Jake Meador <jameador13@gmail.com>
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from pyagentvox import config
+from pyagentvox.config import (
+    STANDARD_EMOTIONS,
+    _clone_config,
+    _parse_signed_value,
+    find_config_file,
+    load_config_file,
+    merge_dicts,
+    modify_value,
+    parse_set_string,
+)
+
+
+# ============================================================================
+# Signed Value Parsing Tests
+# ============================================================================
+
+@pytest.mark.parametrize('value,expected', [
+    ('+10%', (10, '%')),
+    ('-2Hz', (-2, 'Hz')),
+    ('7', (7, '')),
+    ('-2.5Hz', (-2.5, 'Hz')),
+    ('+0.5%', (0.5, '%')),
+])
+def test_parse_signed_value(value, expected):
+    """Test integer and decimal values split into (number, unit)."""
+    assert _parse_signed_value(value) == expected
+
+
+def test_parse_signed_value_integer_fast_path_returns_int():
+    """Test integer values are parsed without going through float."""
+    number, _ = _parse_signed_value('+15%')
+    assert isinstance(number, int)
+
+
+@pytest.mark.parametrize('value', ['Hz', '', '+', 'abc'])
+def test_parse_signed_value_non_numeric(value):
+    """Test non-numeric values are rejected."""
+    assert _parse_signed_value(value) is None
+
+
+# ============================================================================
+# Value Modification Tests
+# ============================================================================
+
+@pytest.mark.parametrize('current,modifier,expected', [
+    ('+10%', '+5', '+15%'),
+    ('+10%', -15, '-5%'),
+    ('+20Hz', '-2.5', '+17Hz'),
+    ('-5Hz', 5, '+0Hz'),
+    ('+10%', 2.9, '+12%'),
+])
+def test_modify_value(current, modifier, expected):
+    """Test modifiers are added and the unit is preserved."""
+    assert modify_value(current, modifier) == expected
+
+
+@pytest.mark.parametrize('current,modifier', [
+    ('+0Hz', '-0.4'),
+    ('-5.5%', 5),
+])
+def test_modify_value_zero_result_is_signed(current, modifier):
+    """Test results that truncate to zero are formatted '+0', not '0'."""
+    assert modify_value(current, modifier).startswith('+0')
+
+
+def test_modify_value_non_numeric_current_unchanged():
+    """Test non-numeric current values are returned as-is."""
+    assert modify_value('en-US-AriaNeural', '+5') == 'en-US-AriaNeural'
+
+
+# ============================================================================
+# Dict Merge and Clone Tests
+# ============================================================================
+
+def test_merge_dicts_nested_override():
+    """Test nested keys merge and overrides win."""
+    base = {'neutral': {'voice': 'a', 'speed': '+0%'}, 'tts': {'engine': 'edge'}}
+    override = {'neutral': {'speed': '+10%'}, 'extra': 1}
+
+    merged = merge_dicts(base, override)
+
+    assert merged == {
+        'neutral': {'voice': 'a', 'speed': '+10%'},
+        'tts': {'engine': 'edge'},
+        'extra': 1,
+    }
+
+
+def test_merge_dicts_does_not_modify_inputs():
+    """Test neither input is changed by the merge."""
+    base = {'neutral': {'voice': 'a'}}
+    override = {'neutral': {'voice': 'b'}}
+
+    merge_dicts(base, override)
+
+    assert base == {'neutral': {'voice': 'a'}}
+    assert override == {'neutral': {'voice': 'b'}}
+
+
+def test_merge_dicts_dict_replaces_scalar():
+    """Test a dict override replaces a non-dict base value."""
+    assert merge_dicts({'a': 1}, {'a': {'b': 2}}) == {'a': {'b': 2}}
+
+
+def test_clone_config_is_deep():
+    """Test cloned containers are independent of the original."""
+    original = {'profiles': {'p': {'neutral': {'voice': 'a'}}}, 'list': [{'x': 1}]}
+
+    clone = _clone_config(original)
+    clone['profiles']['p']['neutral']['voice'] = 'b'
+    clone['list'][0]['x'] = 2
+
+    assert original == {'profiles': {'p': {'neutral': {'voice': 'a'}}}, 'list': [{'x': 1}]}
+
+
+# ============================================================================
+# Set String Parsing Tests
+# ============================================================================
+
+def test_parse_set_string_shorthand_fans_out():
+    """Test shorthand keys apply to every standard emotion."""
+    overrides = parse_set_string('speed=10')
+
+    assert set(overrides) == set(STANDARD_EMOTIONS)
+    assert all(settings == {'speed': '+10%'} for settings in overrides.values())
+
+
+def test_parse_set_string_key_path():
+    """Test dotted key paths and JSON values are applied."""
+    overrides = parse_set_string('neutral.pitch=+5Hz tts.rate=3 ignored')
+
+    assert overrides == {'neutral': {'pitch': '+5Hz'}, 'tts': {'rate': 3}}
+
+
+# ============================================================================
+# Config File Tests
+# ============================================================================
+
+def test_load_config_file_returns_independent_copies(tmp_path: Path):
+    """Test cached parses are never handed out to be mutated."""
+    path = tmp_path / 'pyagentvox.json'
+    path.write_text(json.dumps({'neutral': {'voice': 'a'}}), encoding='utf-8')
+
+    first = load_config_file(path)
+    first['neutral']['voice'] = 'changed'
+
+    assert load_config_file(path) == {'neutral': {'voice': 'a'}}
+
+
+def test_load_config_file_reparses_changed_file(tmp_path: Path):
+    """Test a rewritten file is parsed again instead of served from cache."""
+    path = tmp_path / 'pyagentvox.json'
+    path.write_text(json.dumps({'neutral': {'voice': 'a'}}), encoding='utf-8')
+    load_config_file(path)
+
+    path.write_text(json.dumps({'neutral': {'voice': 'bb'}}), encoding='utf-8')
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+
+    assert load_config_file(path) == {'neutral': {'voice': 'bb'}}
+    config._PARSED_CACHE.clear()
+
+
+def test_find_config_file_prefers_json(tmp_path: Path, monkeypatch):
+    """Test JSON in the working directory wins over YAML."""
+    (tmp_path / 'pyagentvox.yaml').write_text('neutral: {}\n', encoding='utf-8')
+    (tmp_path / 'pyagentvox.json').write_text('{}', encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+
+    assert find_config_file().name == 'pyagentvox.json'
+
+
+def test_find_config_file_ignores_directory(tmp_path: Path, monkeypatch):
+    """Test a directory named like a config file is skipped."""
+    (tmp_path / 'pyagentvox.json').mkdir()
+    (tmp_path / 'pyagentvox.yaml').write_text('neutral: {}\n', encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+
+    assert find_config_file().name == 'pyagentvox.yaml'
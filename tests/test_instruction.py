@@ -0,0 +1,155 @@
+"""Tests for the instructions file helpers.
+
+Tests voice block removal, the marker probe, and the atomic instructions
+file rewrite.
+
+Author:
+    Jake Meador <jameador13@gmail.com>
+"""
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from pyagentvox import instruction
+from pyagentvox.instruction import (
+    VOICE_SECTION_MARKER_END,
+    VOICE_SECTION_MARKER_START,
+    _read_cached,
+    _read_if_contains,
+    _remove_voice_blocks,
+    _write_cached,
+)
+
+BLOCK = f'{VOICE_SECTION_MARKER_START}\nvoice\n{VOICE_SECTION_MARKER_END}'
+
+
+# ============================================================================
+# Voice Block Removal Tests
+# ============================================================================
+
+@pytest.mark.parametrize('before,after', [
+    (f'# Rules\n\n{BLOCK}\n\n## More\n', '# Rules\n\n## More\n'),
+    (f'{BLOCK}\n\n# Rules\n', '# Rules\n'),
+    (f'# Rules\n\n{BLOCK}\n', '# Rules\n'),
+    (f'# A\n{BLOCK}\n# B\n', '# A\n\n# B\n'),
+    (f'# A\n\n{BLOCK}\n\n# B\n\n{BLOCK}\n\n# C\n', '# A\n\n# B\n\n# C\n'),
+    (f'# A\n\n{BLOCK}\n{BLOCK}\n\n# C\n', '# A\n\n# C\n'),
+    (f'{BLOCK}\n', '\n'),
+])
+def test_remove_voice_blocks_blank_lines(before, after):
+    """Test the text around a removed block is rejoined with one blank line."""
+    assert _remove_voice_blocks(before) == after
+
+
+def test_remove_voice_blocks_keeps_blank_runs_elsewhere():
+    """Test blank runs away from any block are not collapsed."""
+    before = f'\n\n# A\n\n\n\n# B\n\n{BLOCK}\n'
+
+    assert _remove_voice_blocks(before) == '\n\n# A\n\n\n\n# B\n'
+
+
+def test_remove_voice_blocks_unterminated_block_unchanged():
+    """Test content without a complete block is returned as-is."""
+    before = f'# A\n\n\n{VOICE_SECTION_MARKER_START}\nvoice\n'
+
+    assert _remove_voice_blocks(before) == before
+
+
+# ============================================================================
+# Marker Probe Tests
+# ============================================================================
+
+@pytest.mark.parametrize('split', range(1, len(VOICE_SECTION_MARKER_START)))
+def test_read_if_contains_marker_split_across_chunks(tmp_path: Path, split):
+    """Test a marker straddling a chunk boundary is still found."""
+    chunk_size = instruction._PROBE_CHUNK_SIZE
+    content = 'x' * (chunk_size - split) + VOICE_SECTION_MARKER_START + '\nvoice\n'
+    path = tmp_path / 'CLAUDE.md'
+    path.write_bytes(content.encode('utf-8'))
+
+    assert _read_if_contains(path, VOICE_SECTION_MARKER_START) == content
+
+
+def test_read_if_contains_marker_absent(tmp_path: Path):
+    """Test a multi-chunk file without the marker returns None."""
+    path = tmp_path / 'CLAUDE.md'
+    path.write_bytes(b'x' * (instruction._PROBE_CHUNK_SIZE * 2 + 7))
+
+    assert _read_if_contains(path, VOICE_SECTION_MARKER_START) is None
+
+
+def test_read_if_contains_universal_newlines(tmp_path: Path):
+    """Test CRLF content is returned with LF newlines."""
+    path = tmp_path / 'CLAUDE.md'
+    path.write_bytes(f'# Rules\r\n{VOICE_SECTION_MARKER_START}\r\n'.encode('utf-8'))
+
+    assert _read_if_contains(path, VOICE_SECTION_MARKER_START) == f'# Rules\n{VOICE_SECTION_MARKER_START}\n'
+
+
+# ============================================================================
+# Atomic Write Tests
+# ============================================================================
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Symlinks need privileges on Windows')
+def test_write_cached_preserves_symlink(tmp_path: Path):
+    """Test a symlinked instructions file stays a link and its target is rewritten."""
+    target = tmp_path / 'AGENTS.md'
+    target.write_text('old\n', encoding='utf-8')
+    link = tmp_path / 'CLAUDE.md'
+    link.symlink_to(target)
+
+    _write_cached(link, 'new\n')
+
+    assert link.is_symlink()
+    assert target.read_text(encoding='utf-8') == 'new\n'
+    assert not (tmp_path / 'AGENTS.md.pyav.tmp').exists()
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='POSIX permission bits')
+def test_write_cached_preserves_mode(tmp_path: Path):
+    """Test the replaced file keeps the original's permission bits."""
+    path = tmp_path / 'CLAUDE.md'
+    path.write_text('old\n', encoding='utf-8')
+    path.chmod(0o640)
+
+    _write_cached(path, 'new\n')
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+    assert path.read_text(encoding='utf-8') == 'new\n'
+
+
+def test_write_cached_permission_error_writes_in_place(tmp_path: Path, monkeypatch):
+    """Test a target that cannot be replaced is written in place instead."""
+    path = tmp_path / 'CLAUDE.md'
+    path.write_text('old\n', encoding='utf-8')
+
+    def deny_replace(src, dst):
+        raise PermissionError(13, 'Access is denied', dst)
+
+    monkeypatch.setattr(os, 'replace', deny_replace)
+    _write_cached(path, 'new\n')
+
+    assert path.read_text(encoding='utf-8') == 'new\n'
+    assert not (tmp_path / 'CLAUDE.md.pyav.tmp').exists()
+    assert _read_cached(path) == 'new\n'
+    instruction._CONTENT_CACHE.clear()
+
+
+def test_write_cached_other_errors_propagate(tmp_path: Path, monkeypatch):
+    """Test non-permission failures are raised and leave no temp file behind."""
+    path = tmp_path / 'CLAUDE.md'
+    path.write_text('old\n', encoding='utf-8')
+
+    def fail_replace(src, dst):
+        raise OSError(28, 'No space left on device', dst)
+
+    monkeypatch.setattr(os, 'replace', fail_replace)
+    with pytest.raises(OSError):
+        _write_cached(path, 'new\n')
+
+    assert path.read_text(encoding='utf-8') == 'old\n'
+    assert not (tmp_path / 'CLAUDE.md.pyav.tmp').exists()
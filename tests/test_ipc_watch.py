@@ -0,0 +1,54 @@
+"""Tests for event-driven IPC file watching.
+
+Tests that watchdog events for watched IPC filenames are routed to their
+callbacks, including atomic replaces that arrive as moves.
+
+Author:
+    Jake Meador <jameador13@gmail.com>
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from pyagentvox.ipc_watch import IPCFileEventHandler
+
+
+# ============================================================================
+# Event Routing Tests
+# ============================================================================
+
+def test_event_handler_routes_matching_filename() -> None:
+    """Events for a watched filename dispatch its callback."""
+    callback = MagicMock()
+    dispatch = MagicMock()
+    handler = IPCFileEventHandler({'pyagentvox_avatar_emotion_1.txt': callback}, dispatch)
+
+    src_path = str(Path(tempfile.gettempdir()) / 'pyagentvox_avatar_emotion_1.txt')
+    event = MagicMock(is_directory=False, src_path=src_path)
+    handler.on_any_event(event)
+
+    dispatch.assert_called_once_with(callback)
+
+
+def test_event_handler_matches_move_destination() -> None:
+    """Atomic replace (move) events match on the destination filename."""
+    callback = MagicMock()
+    dispatch = MagicMock()
+    handler = IPCFileEventHandler({'agent_avatar_filter_1.txt': callback}, dispatch)
+
+    event = MagicMock(is_directory=False, src_path='/tmp/tmpabc123', dest_path='/tmp/agent_avatar_filter_1.txt')
+    handler.on_any_event(event)
+
+    dispatch.assert_called_once_with(callback)
+
+
+def test_event_handler_ignores_other_files() -> None:
+    """Events for unrelated temp files are ignored."""
+    dispatch = MagicMock()
+    handler = IPCFileEventHandler({'agent_avatar_filter_1.txt': MagicMock()}, dispatch)
+
+    handler.on_any_event(MagicMock(is_directory=False, src_path='/tmp/other.txt', dest_path=''))
+    handler.on_any_event(MagicMock(is_directory=True, src_path='/tmp/agent_avatar_filter_1.txt'))
+
+    dispatch.assert_not_called()
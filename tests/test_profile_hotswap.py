@@ -58,7 +58,7 @@ def mock_profile_config():
 
 @pytest.mark.asyncio
 async def test_watch_profile_control_detects_file(mock_tts_engine, mock_config):
-    """Test that _watch_profile_control() detects control file changes."""
+    """Test that _poll_watched_files() detects profile control file changes."""
     with patch('pyagentvox.pyagentvox.create_engine', return_value=mock_tts_engine), \
          patch('pyagentvox.pyagentvox.pygame'), \
          patch('pyagentvox.pyagentvox.sr'), \
@@ -83,7 +83,7 @@ async def test_watch_profile_control_detects_file(mock_tts_engine, mock_config):
         agent._reload_profile = mock_reload
 
         # Start watching in background
-        watch_task = asyncio.create_task(agent._watch_profile_control())
+        watch_task = asyncio.create_task(agent._poll_watched_files())
 
         try:
             # Wait a bit for watcher to start
@@ -269,7 +269,7 @@ async def test_reload_profile_handles_engine_init_failure(mock_tts_engine, mock_
 
 @pytest.mark.asyncio
 async def test_watch_profile_control_auto_deletes_file(mock_tts_engine, mock_config):
-    """Test that _watch_profile_control() deletes control file after processing."""
+    """Test that _poll_watched_files() deletes profile control file after processing."""
     with patch('pyagentvox.pyagentvox.create_engine', return_value=mock_tts_engine), \
          patch('pyagentvox.pyagentvox.pygame'), \
          patch('pyagentvox.pyagentvox.sr'), \
@@ -295,7 +295,7 @@ async def test_watch_profile_control_auto_deletes_file(mock_tts_engine, mock_con
         agent._reload_profile = mock_reload
 
         # Start watching
-        watch_task = asyncio.create_task(agent._watch_profile_control())
+        watch_task = asyncio.create_task(agent._poll_watched_files())
 
         try:
             # Wait for watcher to start
@@ -325,14 +325,15 @@ async def test_watch_profile_control_auto_deletes_file(mock_tts_engine, mock_con
 
 
 def test_run_includes_profile_watcher():
-    """Test that run() method includes _watch_profile_control() in asyncio.gather()."""
-    # Read the pyagentvox.py file and check that gather includes profile watcher
+    """Test that run() watches the profile control file with and without watchdog."""
     pyagentvox_file = Path(__file__).parent.parent / 'pyagentvox' / 'pyagentvox.py'
     content = pyagentvox_file.read_text()
 
-    # Look for the asyncio.gather call in run() method
-    assert '_watch_profile_control()' in content, 'Profile control watcher not found in code'
+    # Polling fallback is started from run()
+    run_section = content[content.find('    async def run(self)'):content.find('\ndef run(')]
+    assert '_poll_watched_files()' in run_section, 'File polling not started by run()'
+    assert '_start_file_watch()' in run_section, 'File watch not started by run()'
 
-    # Check that it's in asyncio.gather
-    gather_section = content[content.find('await asyncio.gather'):content.find('await asyncio.gather') + 200]
-    assert '_watch_profile_control()' in gather_section, 'Profile watcher not in asyncio.gather()'
+    # Event-driven watch routes the control file to its handler
+    watch_section = content[content.find('    def _start_file_watch'):content.find('    async def _dispatch_file_events')]
+    assert '_check_profile_control' in watch_section, 'Profile control file not routed by file watch'
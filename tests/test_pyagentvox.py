@@ -0,0 +1,242 @@
+"""Tests for the PyAgentVox main process helpers.
+
+Tests emotion segment parsing, markdown cleanup for speech, MP3 duration
+estimation, the synthesized audio cache, and its private on-disk directory.
+
+Author:
+    Jake Meador <jameador13@gmail.com>
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from pyagentvox import pyagentvox
+from pyagentvox.pyagentvox import PyAgentVox, _estimate_mp3_duration
+
+
+@pytest.fixture
+def vox():
+    """PyAgentVox instance without running __init__ (no audio or config)."""
+    return PyAgentVox.__new__(PyAgentVox)
+
+
+@pytest.fixture
+def cache_vox(vox, tmp_path: Path, monkeypatch):
+    """Instance with an empty audio cache capped at 10 bytes."""
+    monkeypatch.setattr(pyagentvox, 'TTS_CACHE_MAX_BYTES', 10)
+    vox._tts_cache = OrderedDict()
+    vox._tts_cache_bytes = 0
+    vox._tts_cache_dir = str(tmp_path)
+    vox.emotion_voices = {}
+    vox.voice, vox.rate, vox.pitch = 'en-US-MichelleNeural', '+0%', '+0Hz'
+    return vox
+
+
+@pytest.fixture
+def temp_root(tmp_path: Path, monkeypatch) -> Path:
+    """Point tempfile.gettempdir() at a fresh directory."""
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    return tmp_path
+
+
+posix_only = pytest.mark.skipif(sys.platform == 'win32', reason='POSIX owner and mode checks')
+
+
+# ============================================================================
+# Segment Parsing Tests
+# ============================================================================
+
+@pytest.mark.parametrize('text,expected', [
+    ('Hello!', [(None, 'Hello!')]),
+    ('[cheerful] Line one\nLine two', [('cheerful', 'Line one'), ('cheerful', 'Line two')]),
+    ('Hello [cheerful] there [calm] friend!', [(None, 'Hello'), ('cheerful', 'there'), ('calm', 'friend!')]),
+    ('- first\n* second', [(None, 'first'), (None, 'second')]),
+])
+def test_parse_segments(vox, text, expected):
+    """Test text is split on emotion tags and newlines."""
+    assert vox._parse_segments(text) == expected
+
+
+def test_parse_segments_bare_dash_line_kept(vox):
+    """Test a line that is just '-' is spoken and does not merge into the next line."""
+    assert vox._parse_segments('Intro\n-\nNext item') == [
+        (None, 'Intro'),
+        (None, '-'),
+        (None, 'Next item'),
+    ]
+
+
+def test_parse_segments_removes_one_bullet_per_line(vox):
+    """Test only the leading bullet marker of each line is removed."""
+    assert vox._parse_segments('Steps:\n-\t-\tnested') == [(None, 'Steps:'), (None, '- nested')]
+
+
+# ============================================================================
+# MP3 Duration Tests
+# ============================================================================
+
+# Frame headers: MPEG-1 Layer III 128 kbps 44.1 kHz, and edge-tts's default
+# MPEG-2 Layer III 48 kbps 24 kHz mono
+MPEG1_128K_HEADER = bytes([0xFF, 0xFB, 0x90, 0x64])
+MPEG2_48K_HEADER = bytes([0xFF, 0xF3, 0x64, 0xC4])
+
+
+def test_estimate_mp3_duration_mpeg1():
+    """Test 16000 bytes at 128 kbps last one second."""
+    assert _estimate_mp3_duration(MPEG1_128K_HEADER + bytes(15996)) == pytest.approx(1.0)
+
+
+def test_estimate_mp3_duration_mpeg2_48kbps():
+    """Test the MPEG-2 bitrate table is used for edge-tts's 48 kbps frames."""
+    assert _estimate_mp3_duration(MPEG2_48K_HEADER + bytes(5996)) == pytest.approx(1.0)
+
+
+def test_estimate_mp3_duration_skips_id3v2_tag():
+    """Test the syncsafe ID3v2 size is skipped and the tag excluded from the duration."""
+    tag = b'ID3\x04\x00\x00' + bytes([0x00, 0x00, 0x01, 0x00]) + bytes(128)  # 10 + 128 bytes
+
+    assert _estimate_mp3_duration(tag + MPEG2_48K_HEADER + bytes(5996)) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize('audio', [
+    b'',
+    b'ID3',
+    bytes(1000),
+    b'not an mp3 file at all',
+    bytes([0xFF, 0xFD, 0x90, 0x64]) + bytes(100),  # Layer II
+    bytes([0xFF, 0xEB, 0x90, 0x64]) + bytes(100),  # Reserved MPEG version
+    bytes([0xFF, 0xF3, 0xF4, 0xC4]) + bytes(100),  # Bad bitrate index
+    bytes([0xFF, 0xF3, 0x04, 0xC4]) + bytes(100),  # Free-format bitrate
+    b'ID3\x04\x00\x00\x00\x00\x7f\x7f' + MPEG2_48K_HEADER,  # Tag runs past the data
+])
+def test_estimate_mp3_duration_unreadable_returns_zero(audio):
+    """Test input without a usable Layer III header falls back to 0.0."""
+    assert _estimate_mp3_duration(audio) == 0.0
+
+
+# ============================================================================
+# Audio Cache Tests
+# ============================================================================
+
+class FakeCommunicate:
+    """edge_tts.Communicate stand-in streaming the first four bytes of the text."""
+
+    calls: list[str] = []
+
+    def __init__(self, text, voice, rate, pitch):
+        self.text = text
+        FakeCommunicate.calls.append(text)
+
+    async def stream(self):
+        yield {'type': 'audio', 'data': self.text[:4].encode()}
+
+
+def test_remember_tts_audio_evicts_by_total_bytes(cache_vox, tmp_path: Path):
+    """Test the oldest clips are dropped, with their disk copies, once over the byte cap."""
+    (tmp_path / 'a.mp3').write_bytes(b'aaaa')
+    cache_vox._remember_tts_audio('a', b'aaaa')
+    cache_vox._remember_tts_audio('b', b'bbbb')
+    cache_vox._remember_tts_audio('c', b'cccc')
+
+    assert list(cache_vox._tts_cache) == ['b', 'c']
+    assert cache_vox._tts_cache_bytes == 8
+    assert not (tmp_path / 'a.mp3').exists()
+
+
+def test_remember_tts_audio_replacing_key_recounts_bytes(cache_vox):
+    """Test re-recording a key replaces its size instead of adding to it."""
+    cache_vox._remember_tts_audio('a', b'aaaa')
+    cache_vox._remember_tts_audio('a', b'aaaaaa')
+
+    assert cache_vox._tts_cache_bytes == 6
+    assert list(cache_vox._tts_cache) == ['a']
+
+
+def test_remember_tts_audio_keeps_oversized_newest_clip(cache_vox):
+    """Test a single clip larger than the cap is still kept."""
+    cache_vox._remember_tts_audio('a', b'aaaa')
+    cache_vox._remember_tts_audio('big', b'x' * 20)
+
+    assert list(cache_vox._tts_cache) == ['big']
+    assert cache_vox._tts_cache_bytes == 20
+
+
+def test_cache_hit_refreshes_lru_position(cache_vox, monkeypatch):
+    """Test a cache hit makes the clip newest, so a later miss evicts the other one."""
+    monkeypatch.setattr(pyagentvox.edge_tts, 'Communicate', FakeCommunicate)
+    monkeypatch.setattr(FakeCommunicate, 'calls', [])
+
+    async def speak(*texts):
+        return [await cache_vox._generate_tts_audio(None, text) for text in texts]
+
+    assert asyncio.run(speak('Hello', 'World', 'Hello', 'Again')) == [b'Hell', b'Worl', b'Hell', b'Agai']
+    assert list(cache_vox._tts_cache.values()) == [b'Hell', b'Agai']
+    assert FakeCommunicate.calls == ['Hello', 'World', 'Again']
+
+
+
+# ============================================================================
+# Cache Directory Tests
+# ============================================================================
+
+@posix_only
+def test_open_tts_cache_dir_private(temp_root: Path):
+    """Test the cache directory is created 0700 and carries the uid."""
+    cache_dir = PyAgentVox._open_tts_cache_dir()
+
+    assert cache_dir == str(temp_root / f'pyagentvox_tts_cache_{os.getuid()}')
+    assert os.stat(cache_dir).st_mode & 0o777 == 0o700
+
+
+@posix_only
+def test_open_tts_cache_dir_rejects_group_or_world_access(temp_root: Path):
+    """Test an existing directory other users can reach is not used."""
+    cache_dir = temp_root / f'pyagentvox_tts_cache_{os.getuid()}'
+    cache_dir.mkdir()
+    cache_dir.chmod(0o777)
+
+    assert PyAgentVox._open_tts_cache_dir() is None
+
+
+@posix_only
+def test_open_tts_cache_dir_rejects_other_owner(temp_root: Path, monkeypatch):
+    """Test a directory owned by another user is not used."""
+    other_uid = os.getuid() + 1
+    cache_dir = temp_root / f'pyagentvox_tts_cache_{other_uid}'
+    cache_dir.mkdir(mode=0o700)
+    monkeypatch.setattr(os, 'getuid', lambda: other_uid)
+
+    assert PyAgentVox._open_tts_cache_dir() is None
+
+
+@posix_only
+def test_open_tts_cache_dir_rejects_symlink(temp_root: Path):
+    """Test a symlink planted at the cache path is not followed."""
+    elsewhere = temp_root / 'elsewhere'
+    elsewhere.mkdir(mode=0o700)
+    (temp_root / f'pyagentvox_tts_cache_{os.getuid()}').symlink_to(elsewhere)
+
+    assert PyAgentVox._open_tts_cache_dir() is None
+
+
+@posix_only
+def test_open_tts_cache_dir_prunes(temp_root: Path, monkeypatch):
+    """Test leftover temp files go and the oldest clips beyond the budget are removed."""
+    monkeypatch.setattr(pyagentvox, 'TTS_CACHE_MAX_BYTES', 10)
+    cache_dir = temp_root / f'pyagentvox_tts_cache_{os.getuid()}'
+    cache_dir.mkdir(mode=0o700)
+    (cache_dir / 'agent_voice_x.mp3').write_bytes(b'partial')
+    for age, name in enumerate(['new', 'mid', 'old']):
+        clip = cache_dir / f'{name}.mp3'
+        clip.write_bytes(b'1234')
+        os.utime(clip, (1_000_000 - age, 1_000_000 - age))
+
+    PyAgentVox._open_tts_cache_dir()
+
+    assert sorted(path.name for path in cache_dir.iterdir()) == ['mid.mp3', 'new.mp3']